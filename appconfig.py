@@ -1,5 +1,6 @@
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -8,6 +9,8 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str
+    DATABASE_REPLICA_URLS: list = []
+    DATABASE_DEDICATED_REPLICA_URL: str = ""
     CACHE_SERVER_URL: str        
     CACHE_TTL: str = "30m"      
     APP_NAME: str
@@ -97,10 +100,86 @@ class Settings(BaseSettings):
             "name": "Relatório de Gestão - Responsável pela Análise",
             "description": "Dados relativos aos Responsáveis pela Análise do Relatório de Gestão - FaF",
         },
+        {
+            "name": "Plano de Ação - Resumo de Execução",
+            "description": "Resumo de execução por Plano de Ação - FaF: valores empenhados, lançamentos financeiros, metas e relatórios de gestão.",
+        },
+        {
+            "name": "Consultas em Lote",
+            "description": "Execução de várias consultas aos dados - FaF em uma única requisição.",
+        },
+        {
+            "name": "Exportação",
+            "description": "Exportação completa dos dados - FaF em NDJSON ou CSV, transmitida à medida que os registros são lidos.",
+        },
+        {
+            "name": "Agregações",
+            "description": "Totais (soma, contagem, mínimo e máximo) dos valores financeiros - FaF, agrupados por dimensões.",
+        },
+        {
+            "name": "Arquivos Parquet",
+            "description": "Cópia diária de todas as tabelas - FaF em arquivos Parquet comprimidos, para download direto.",
+        },
     ]
     DEFAULT_PAGE_SIZE: int = 100
     MAX_PAGE_SIZE: int = 1000
+    MAX_FILTER_VALUES: int = 1000
+    MAX_BATCH_QUERIES: int = 50
+    MAX_BATCH_CONCURRENCY: int = 5
+    MAX_AGGREGATION_GROUPS: int = 10000
+    MAX_EXPANSION_ROWS: int = 10000
+    EXPORT_CHUNK_SIZE: int = 5000
+    EXPORT_CSV_COPY: bool = True
+    EXPORT_COPY_QUEUE_SIZE: int = 16
+    EXPORT_STATEMENT_TIMEOUT: int = 3600
+    MEMORY_TABLES: list = ["programa", "programa_gestao_agil", "gestao_financeira_categorias_despesa", "termo_adesao"]
+    MEMORY_TABLES_CHECK_INTERVAL: int = 30
+    MEMORY_TABLES_MAX_ROWS: int = 100000
+    SNAPSHOT_DIR: str = "snapshots"
+    SNAPSHOT_BATCH_SIZE: int = 100000
+    SNAPSHOT_COMPRESSION: str = "zstd"
+    SNAPSHOT_KEEP: int = 2
+    SNAPSHOT_PARTITIONS: dict = {
+        "gestao_financeira_lancamentos": "data_lancamento_gestao_financeira",
+        "gestao_financeira_subtransacoes": "data_pagamento_subtransacao_gestao_financeira",
+        "empenho": "data_emissao_empenho",
+    }
     ERROR_MESSAGE_NO_PARAMS: str = "Nenhum parâmetro de consulta foi informado."
     ERROR_MESSAGE_INTERNAL: str = "Erro Interno Inesperado."
+    ERROR_MESSAGE_INVALID_CURSOR: str = "Cursor de paginação inválido."
+    ERROR_MESSAGE_INVALID_PARAM: str = "Valor inválido para o parâmetro de consulta '{}'."
+    ERROR_MESSAGE_TOO_MANY_VALUES: str = "O parâmetro de consulta '{}' aceita no máximo {} valores."
+    ERROR_MESSAGE_INVALID_ORDER: str = "Campo de ordenação inválido: '{}'. Campos aceitos: {}."
+    ERROR_MESSAGE_INVALID_FIELDS: str = "Campo(s) inexistente(s) informado(s) em campos: {}."
+    ERROR_MESSAGE_TOO_MANY_QUERIES: str = "O lote aceita no máximo {} consultas."
+    ERROR_MESSAGE_UNKNOWN_ENDPOINT: str = "Endpoint de consulta inexistente: '{}'."
+    ERROR_MESSAGE_TOO_MANY_GROUPS: str = "A agregação excede o limite de {} grupos. Informe filtros ou menos dimensões em agrupar_por."
+    ERROR_MESSAGE_QUERY_TOO_EXPENSIVE: str = "O custo estimado da contagem exata excede o limite do endpoint. Informe filtros mais restritivos ou use contagem=estimada ou contagem=nenhuma."
+    ERROR_MESSAGE_QUERY_TIMEOUT: str = "A consulta excedeu o tempo limite de execução. Informe filtros mais restritivos ou use contagem=nenhuma."
+    ERROR_MESSAGE_NO_SNAPSHOT: str = "Nenhum snapshot dos dados foi gerado até o momento."
+    ERROR_MESSAGE_INVALID_EXPANSION: str = "Relação inválida em expandir: '{}'. Relações aceitas: {}."
+    ERROR_MESSAGE_TOO_MANY_EXPANSION_ROWS: str = "A relação '{}' em expandir excede o limite de {} registros. Informe filtros mais restritivos ou um tamanho_da_pagina menor."
+    STATEMENT_CACHE_SIZE: int = 2000
+    DB_QUERY_CACHE_SIZE: int = 2000
+    WEB_CONCURRENCY: int = 1
+    DB_MAX_CONNECTIONS: int = 120
+    DB_POOL_OVERFLOW_FACTOR: int = 2
+    DB_POOL_MIN_CONNECTIONS: int = 2
+    DB_POOL_TIMEOUT: int = 30
+    DB_PGBOUNCER: bool = False
+    DB_STATEMENT_TIMEOUT: int = 30
+    DB_DEDICATED_STATEMENT_TIMEOUT: int = 300
+    QUERY_COST_GUARD: bool = True
+    QUERY_COST_BUDGET: float = 100000.0
+    QUERY_COST_BUDGETS: dict = {}
+    QUERY_COST_REJECT_FACTOR: float = 100.0
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    DB_CREATE_INDEXES: bool = False
+    DB_CREATE_TRIGRAM_INDEXES: bool = False
+    DB_CREATE_SUMMARIES: bool = False
+    DB_REPLICA_ROUTING: Literal["round_robin", "least_connections"] = "round_robin"
+    DB_READ_FROM_PRIMARY: bool = False
+    DB_HEALTH_CHECK_INTERVAL: int = 10
+    DB_HEALTH_CHECK_TIMEOUT: int = 5
     STATS_USER: str 
     STATS_PASSWORD: str 
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Benchmark da exportação CSV (/exportar/{recurso}?formato=csv): caminho COPY do PostgreSQL
+(asyncpg copy_from_query) contra a serialização em Python a partir do cursor no servidor.
+
+Popula gestao_financeira_subtransacoes com registros sintéticos (generate_series) e mede,
+para a tabela inteira, o tempo de geração de:
+  - cursor_csv: cursor no servidor + csv.writer (caminho com EXPORT_CSV_COPY=false);
+  - cursor_ndjson: cursor no servidor + orjson (formato ndjson);
+  - copy_csv: COPY (consulta) TO STDOUT WITH CSV HEADER, blocos repassados sem objetos por registro.
+
+ATENÇÃO: as tabelas de gestão financeira do banco em DATABASE_URL são esvaziadas e repovoadas.
+Use um banco de dados descartável.
+
+Uso (a partir da raiz do projeto):
+    DATABASE_URL=postgresql+asyncpg://.../banco_descartavel python -m benchmarks.export_copy --linhas 1000000 --repeticoes 3
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from appconfig import Settings
+from src import models
+from src.exports import compile_export, stream_rows, copy_rows
+from src.filters import column_type
+from src.summaries import create_tables
+
+
+def synthetic_value(model, column, fixed: dict) -> str:
+    """
+    Expressão SQL do valor sintético da coluna para a linha g do generate_series
+    """
+    if column.name in fixed:
+        return str(fixed[column.name])
+    python_type = column_type(model, column)
+    if python_type is int:
+        return "g" if column.primary_key else "(g % 1000)"
+    if python_type is float:
+        return "((g % 100000) * 1.37)"
+    if python_type is date:
+        return "(DATE '2024-01-01' + (g % 365))"
+    return "g::text" if column.primary_key else f"('{column.name[:20]} ' || g)"
+
+
+async def populate(conn, model, rows: int, fixed: dict = None) -> None:
+    table = model.__table__
+    fixed = fixed or {}
+    columns = ", ".join(column.name for column in table.columns)
+    values = ", ".join(synthetic_value(model, column, fixed) for column in table.columns)
+    await conn.exec_driver_sql(f"INSERT INTO {table.fullname} ({columns}) SELECT {values} FROM generate_series(1, {rows}) AS g")
+
+
+async def prepare(engine, rows: int) -> None:
+    """
+    Cria as tabelas e repovoa subtransações (com uma categoria e um lançamento referenciados)
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(create_tables)
+        await conn.exec_driver_sql(f"TRUNCATE {models.GestaoFinanceiraSubtransacoes.__table__.fullname}, "
+                                   f"{models.GestaoFinanceiraLancamentos.__table__.fullname}, "
+                                   f"{models.GestaoFinanceiraCategoriasDespesa.__table__.fullname}")
+        await populate(conn, models.GestaoFinanceiraCategoriasDespesa, 1)
+        await populate(conn, models.GestaoFinanceiraLancamentos, 1, {"id_categoria_despesa_gestao_financeira": 1})
+        await populate(conn, models.GestaoFinanceiraSubtransacoes, rows,
+                       {"id_categoria_despesa_gestao_financeira": 1, "id_lancamento_gestao_financeira": 1})
+        await conn.exec_driver_sql(f"ANALYZE {models.GestaoFinanceiraSubtransacoes.__table__.fullname}")
+
+
+async def timed(engine, export, repeticoes: int) -> tuple:
+    """
+    Mediana do tempo de geração do arquivo completo, em segundos, e tamanho gerado em bytes
+    """
+    query = compile_export(models.GestaoFinanceiraSubtransacoes, {})
+    tempos = []
+    tamanho = 0
+    for _ in range(repeticoes):
+        async with AsyncSession(engine) as dbsession:
+            inicio = time.perf_counter()
+            tamanho = 0
+            async for chunk in export(query, dbsession):
+                tamanho += len(chunk)
+            tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos), tamanho
+
+
+async def main(linhas: int, repeticoes: int, preparar: bool):
+    engine = create_async_engine(Settings().DATABASE_URL)
+    caminhos = {
+        "cursor_csv": lambda query, dbsession: stream_rows(query, "csv", dbsession),
+        "cursor_ndjson": lambda query, dbsession: stream_rows(query, "ndjson", dbsession),
+        "copy_csv": copy_rows,
+    }
+    resultados = {}
+    try:
+        if preparar:
+            await prepare(engine, linhas)
+        for nome, export in caminhos.items():
+            resultados[nome] = await timed(engine, export, repeticoes)
+    finally:
+        await engine.dispose()
+
+    base = resultados["cursor_csv"][0]
+    print(f"{'caminho':<16} {'tempo (s)':>10} {'linhas/s':>12} {'MB':>10} {'ganho':>8}")
+    for nome, (tempo, tamanho) in resultados.items():
+        print(f"{nome:<16} {tempo:>10.2f} {linhas / tempo:>12.0f} {tamanho / 2**20:>10.1f} {base / tempo:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exportação CSV: COPY do PostgreSQL contra serialização em Python")
+    parser.add_argument("--linhas", type=int, default=1_000_000, help="Registros sintéticos em gestao_financeira_subtransacoes")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Execuções por caminho (é reportada a mediana)")
+    parser.add_argument("--sem-preparar", action="store_true", help="Reutiliza os registros já gerados por uma execução anterior")
+    args = parser.parse_args()
+    asyncio.run(main(args.linhas, args.repeticoes, not args.sem_preparar))
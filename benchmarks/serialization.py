@@ -0,0 +1,102 @@
+"""
+Benchmark da serialização das listas paginadas: caminho atual do FastAPI (validação da página pelo
+response_model com from_attributes, serialização com exclude_unset e orjson no ORJSONResponse)
+contra a conversão pré-compilada por schema de src/serializers.py (fast_response), direto para bytes.
+
+Gera páginas sintéticas (sem banco de dados) de cada schema, com registros como instâncias dos modelos
+(consulta sem o parâmetro campos) e como dicionários (consulta com campos), confere que os dois caminhos
+produzem exatamente os mesmos bytes e mede a mediana do tempo por página.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.serialization --registros 1000 --repeticoes 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from src import models
+from src.filters import column_type
+from src.schemas import (
+    PaginatedResponseTemplate, PaginatedPlanoAcaoResponse, PaginatedEmpenhoResponse,
+    PaginatedGestaoFinanceiraLancamentosResponse, PaginatedPlanoAcaoResumoResponse,
+)
+from src.serializers import page_serializer
+
+
+# Schema de resposta de cada modelo medido
+SCHEMAS = {
+    models.PlanoAcao: PaginatedPlanoAcaoResponse,
+    models.Empenho: PaginatedEmpenhoResponse,
+    models.GestaoFinanceiraLancamentos: PaginatedGestaoFinanceiraLancamentosResponse,
+    models.PlanoAcaoResumo: PaginatedPlanoAcaoResumoResponse,
+}
+
+
+def synthetic_value(model, column, i: int):
+    python_type = column_type(model, column)
+    if python_type is int:
+        return i
+    if python_type is float:
+        return i * 1.37
+    if python_type is date:
+        return date(2024, 1, 1) + timedelta(days=i % 365)
+    if python_type is datetime:
+        return datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i)
+    if python_type is bool:
+        return i % 2 == 0
+    return f"{column.name[:20]} {i}"
+
+
+def synthetic_page(model, registros: int, dicionarios: bool) -> PaginatedResponseTemplate:
+    columns = model.__table__.columns
+    rows = [{column.name: synthetic_value(model, column, i) for column in columns} for i in range(registros)]
+    data = rows if dicionarios else [model(**row) for row in rows]
+    return PaginatedResponseTemplate(data=data, total_pages=10, total_items=registros * 10, total_items_exact=True,
+                                     page_number=1, page_size=registros, next_cursor="WzEwMDBd")
+
+
+async def current_path(field, page) -> bytes:
+    content = await serialize_response(field=field, response_content=page, exclude_unset=True)
+    return ORJSONResponse(content).body
+
+
+def timed(run, repeticoes: int) -> float:
+    """
+    Mediana do tempo por página, em milissegundos
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        run()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def main(registros: int, repeticoes: int):
+    loop = asyncio.new_event_loop()
+    print(f"{'schema':<48} {'registros':<12} {'atual (ms)':>11} {'rápido (ms)':>12} {'ganho':>7}")
+    for model, schema in SCHEMAS.items():
+        field = create_model_field(name="Response_" + schema.__name__, type_=schema, mode="serialization")
+        serializer = page_serializer(schema)
+        for dicionarios in (False, True):
+            page = synthetic_page(model, registros, dicionarios)
+            esperado = loop.run_until_complete(current_path(field, page))
+            if serializer.render(page) != esperado:
+                raise SystemExit(f"{schema.__name__}: a conversão pré-compilada difere do caminho do FastAPI")
+            atual = timed(lambda: loop.run_until_complete(current_path(field, page)), repeticoes)
+            rapido = timed(lambda: serializer.render(page), repeticoes)
+            tipo = "dicionários" if dicionarios else "instâncias"
+            print(f"{schema.__name__:<48} {tipo:<12} {atual:>11.2f} {rapido:>12.2f} {atual / rapido:>6.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serialização das listas paginadas: caminho do FastAPI contra a conversão pré-compilada")
+    parser.add_argument("--registros", type=int, default=1000, help="Registros por página")
+    parser.add_argument("--repeticoes", type=int, default=50, help="Serializações por caminho (é reportada a mediana)")
+    args = parser.parse_args()
+    main(args.registros, args.repeticoes)
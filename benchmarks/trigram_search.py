@@ -0,0 +1,86 @@
+"""
+Benchmark das buscas por substring (ILIKE '%termo%') das rotas de consulta, com e sem
+os índices de trigramas (pg_trgm) criados por src/indexes.py.
+
+Para cada endpoint e coluna pesquisada por substring, executa a mesma consulta da rota
+(primeira página com contagem exata) duas vezes:
+  - antes: planejador impedido de usar índices (SET LOCAL enable_bitmapscan/enable_indexscan = off),
+    equivalente a uma tabela sem o índice de trigramas;
+  - depois: plano normal, com o índice de trigramas disponível.
+
+Uso (a partir da raiz do projeto, com DATABASE_URL apontando para o PostgreSQL):
+    python -m src.indexes                      # provisiona os índices
+    python -m benchmarks.trigram_search --termo silva --repeticoes 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlmodel import SQLModel
+from appconfig import Settings
+from src.filters import compile_query, column_param
+from src.indexes import text_search_columns
+from src.utils import page_statement
+
+
+def model_for(table):
+    """
+    Classe do modelo correspondente à tabela
+    """
+    return next(mapper.class_ for mapper in SQLModel._sa_registry.mappers if mapper.local_table is table)
+
+
+async def timed(dbsession: AsyncSession, statement, params: dict, repeticoes: int, indices: bool) -> float:
+    """
+    Mediana do tempo de execução da consulta, em milissegundos
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        async with dbsession.begin():
+            if not indices:
+                conn = await dbsession.connection()
+                await conn.exec_driver_sql("SET LOCAL enable_bitmapscan = off")
+                await conn.exec_driver_sql("SET LOCAL enable_indexscan = off")
+            inicio = time.perf_counter()
+            result = await dbsession.execute(statement, params)
+            result.all()
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+async def main(termo: str, repeticoes: int):
+    settings = Settings()
+    engine = create_async_engine(settings.DATABASE_URL)
+    resultados = defaultdict(list)
+    try:
+        async with AsyncSession(engine) as dbsession:
+            for column in text_search_columns():
+                model = model_for(column.table)
+                query = compile_query(model, {column_param(column): termo})
+                pk_columns = list(model.__table__.primary_key.columns)
+                statement = page_statement(query.statement, pk_columns).add_columns(func.count().over())
+                params = {**query.params, "_deslocamento": 0, "_limite": settings.DEFAULT_PAGE_SIZE + 1}
+                antes = await timed(dbsession, statement, params, repeticoes, indices=False)
+                depois = await timed(dbsession, statement, params, repeticoes, indices=True)
+                resultados[column.table.name].append((column.name, antes, depois))
+    finally:
+        await engine.dispose()
+
+    print(f"{'endpoint / coluna':<90} {'antes (ms)':>12} {'depois (ms)':>12} {'ganho':>8}")
+    for endpoint, colunas in resultados.items():
+        antes = sum(c[1] for c in colunas)
+        depois = sum(c[2] for c in colunas)
+        print(f"/{endpoint:<89} {antes:>12.1f} {depois:>12.1f} {antes / depois if depois else 0:>7.1f}x")
+        for nome, antes, depois in colunas:
+            print(f"    {nome:<86} {antes:>12.1f} {depois:>12.1f} {antes / depois if depois else 0:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Latência das buscas por substring antes/depois dos índices de trigramas")
+    parser.add_argument("--termo", default="silva", help="Termo pesquisado (mínimo de 3 caracteres para usar o índice)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Execuções por consulta (é reportada a mediana)")
+    args = parser.parse_args()
+    asyncio.run(main(args.termo, args.repeticoes))
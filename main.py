@@ -13,6 +13,8 @@ from cashews.contrib.fastapi import (
 from collections import defaultdict
 from src.database import Database
 from src.cache import setup_cache
+from src.statements import statement_cache
+from src.inmemory import memory_tables
 from src.utils import (
     reset_minute_counters, 
     verify_admin, 
@@ -21,6 +23,7 @@ from src.utils import (
     get_allowed_stats_paths
 )
 import asyncio
+import mimetypes
 import psutil
 import json
 import time
@@ -32,6 +35,7 @@ from src.routers.programa import pg_router
 from src.routers.programa_beneficiario import pgb_router
 from src.routers.programa_gestao_agil import pgga_router
 from src.routers.plano_acao import pa_router
+from src.routers.plano_acao_resumo import par_router
 from src.routers.plano_acao_dado_bancario import padb_router
 from src.routers.plano_acao_meta import pam_router
 from src.routers.plano_acao_meta_acao import pama_router
@@ -49,6 +53,10 @@ from src.routers.relatorio_gestao import rg_router
 from src.routers.relatorio_gestao_acoes import rga_router
 from src.routers.relatorio_gestao_analise import rgan_router
 from src.routers.relatorio_gestao_analise_responsavel import rgra_router
+from src.routers.consultas import cs_router
+from src.routers.agregacao import ag_router
+from src.routers.exportar import ex_router
+from src.routers.arquivos import arq_router
 
 
 
@@ -86,6 +94,8 @@ async def lifespan(app: FastAPI):
     try:
         # Inicializa o Banco de Dados
         await db.init_db()        
+        # Load the small tables answered from memory (MEMORY_TABLES)
+        await memory_tables.start(db.primary.engine)
         # Configure o cache
         setup_cache(config)
         # background task to Update allowed paths for stats
@@ -111,6 +121,9 @@ async def lifespan(app: FastAPI):
         await save_task
     except asyncio.CancelledError:
         pass
+    # Stop the replica health checks and close the database pools
+    await memory_tables.close()
+    await db.close()
     
 
 app = FastAPI(lifespan=lifespan, 
@@ -123,6 +136,10 @@ app = FastAPI(lifespan=lifespan,
               swagger_ui_parameters={"defaultModelExpandDepth": -1})
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount(f"{ROOTPATH}/static", StaticFiles(directory="static"), name="static_prefixed")
+# Parquet snapshots (python -m src.snapshots); the directory may not exist before the first run
+mimetypes.add_type("application/vnd.apache.parquet", ".parquet")
+app.mount("/arquivos", StaticFiles(directory=config.SNAPSHOT_DIR, check_dir=False), name="arquivos")
+app.mount(f"{ROOTPATH}/arquivos", StaticFiles(directory=config.SNAPSHOT_DIR, check_dir=False), name="arquivos_prefixed")
 
 # Incluindo Middlewares
 app.add_middleware(CacheEtagMiddleware)
@@ -158,6 +175,7 @@ app.include_router(pg_router)
 app.include_router(pgb_router)
 app.include_router(pgga_router)
 app.include_router(pa_router)
+app.include_router(par_router)
 app.include_router(padb_router)
 app.include_router(pam_router)
 app.include_router(pama_router)
@@ -175,6 +193,10 @@ app.include_router(rg_router)
 app.include_router(rga_router)
 app.include_router(rgan_router)
 app.include_router(rgra_router)
+app.include_router(cs_router)
+app.include_router(ag_router)
+app.include_router(ex_router)
+app.include_router(arq_router)
 
 
 @app.get("/docs", include_in_schema=False)
@@ -284,6 +306,97 @@ async def get_stats(username: str = Depends(verify_admin)):
                 </tr>
         """
 
+    html_content += """
+                </tbody>
+            </table>
+            <h2>Statement Cache</h2>
+            <table id="statementCacheStats">
+                <thead>
+                    <tr>
+                        <th>Endpoint</th>
+                        <th>Hits</th>
+                        <th>Misses</th>
+                        <th>Hit Rate (%)</th>
+                    </tr>
+                </thead>
+                <tbody>
+    """
+
+    for _endpoint, rates in statement_cache.hit_rates().items():
+        html_content += f"""
+                <tr>
+                    <td>{_endpoint}</td>
+                    <td>{rates['hits']}</td>
+                    <td>{rates['misses']}</td>
+                    <td>{rates['hit_rate'] * 100:.2f}</td>
+                </tr>
+        """
+
+    html_content += """
+                </tbody>
+            </table>
+            <h2>Database Nodes</h2>
+            <table id="databaseNodeStats">
+                <thead>
+                    <tr>
+                        <th>Node</th>
+                        <th>Healthy</th>
+                        <th>Active Sessions</th>
+                        <th>Total Sessions</th>
+                        <th>Pool Size</th>
+                        <th>Checked Out</th>
+                        <th>Overflow</th>
+                        <th>Utilization (%)</th>
+                        <th>Checkouts</th>
+                        <th>Avg Checkout Wait (ms)</th>
+                        <th>Max Checkout Wait (ms)</th>
+                        <th>Overflow Checkouts</th>
+                    </tr>
+                </thead>
+                <tbody>
+    """
+
+    for node in db.nodes():
+        pool = node.pool_stats()
+        html_content += f"""
+                <tr>
+                    <td>{node.name}</td>
+                    <td>{'yes' if node.healthy else 'no'}</td>
+                    <td>{node.active_sessions}</td>
+                    <td>{node.total_sessions}</td>
+                    <td>{pool.get('size', '-')}</td>
+                    <td>{pool.get('checked_out', '-')}</td>
+                    <td>{pool.get('overflow', '-')}</td>
+                    <td>{pool.get('utilization', 0) * 100:.2f}</td>
+                    <td>{pool.get('checkouts', '-')}</td>
+                    <td>{pool.get('avg_wait', 0) * 1000:.2f}</td>
+                    <td>{pool.get('max_wait', 0) * 1000:.2f}</td>
+                    <td>{pool.get('overflow_checkouts', '-')}</td>
+                </tr>
+        """
+
+    html_content += """
+                </tbody>
+            </table>
+            <h2>In-Memory Tables</h2>
+            <table id="memoryTableStats">
+                <thead>
+                    <tr>
+                        <th>Table</th>
+                        <th>Rows</th>
+                    </tr>
+                </thead>
+                <tbody>
+    """
+
+    for table, rows in memory_tables.stats().items():
+        html_content += f"""
+                <tr>
+                    <td>{table}</td>
+                    <td>{rows}</td>
+                </tr>
+        """
+
     html_content += """
                 </tbody>
             </table>
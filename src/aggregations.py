@@ -0,0 +1,170 @@
+from datetime import date
+from typing import NamedTuple, Optional
+from sqlalchemy import bindparam, literal_column, Integer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select, func, cast, Date
+from fastapi import HTTPException, status
+import hashlib
+from src import models
+from src.cache import cache
+from src.filters import active_filters, filter_key, filter_predicates, filter_params, column_type
+from src.statements import statement_cache
+from src.utils import translate_statement_timeout
+from appconfig import Settings
+
+config = Settings()
+
+
+# Granularidades aceitas para dimensões de data (ex.: mes:data_lancamento_gestao_financeira)
+GRANULARIDADES = {"mes": "month", "ano": "year"}
+SEPARADOR_GRANULARIDADE = ":"
+
+
+class Aggregation(NamedTuple):
+    """
+    Agregação permitida para um recurso: modelo, dimensões de agrupamento e colunas numéricas somadas
+    """
+    model: type
+    dimensions: tuple
+    metrics: tuple
+
+
+def numeric_columns(model) -> tuple:
+    """
+    Colunas numéricas (valores monetários, float) do modelo
+    """
+    return tuple(column.name for column in model.__table__.columns if column_type(model, column) is float)
+
+
+# Recursos com agregação, dimensões de agrupamento e colunas agregáveis permitidas
+AGREGACOES = {
+    "plano_acao": Aggregation(
+        models.PlanoAcao,
+        ("id_programa", "situacao_plano_acao", "uf_ente_repassador_plano_acao", "uf_ente_recebedor_plano_acao",
+         "codigo_ibge_municipio_ente_recebedor_plano_acao", "data_inicio_vigencia_plano_acao", "data_fim_vigencia_plano_acao"),
+        numeric_columns(models.PlanoAcao)),
+    "empenho": Aggregation(
+        models.Empenho,
+        ("ano_empenho", "data_emissao_empenho", "fonte_recurso_empenho", "esfera_orcamentaria_empenho",
+         "natureza_despesa_empenho", "tipo_empenho", "situacao_empenho", "id_plano_acao"),
+        numeric_columns(models.Empenho)),
+    "gestao_financeira_lancamentos": Aggregation(
+        models.GestaoFinanceiraLancamentos,
+        ("origem_solicitacao_gestao_financeira", "cnpj_ente_solicitante_gestao_financeira", "tipo_operacao_gestao_financeira",
+         "data_lancamento_gestao_financeira", "data_evento_lancamento_gestao_financeira", "id_categoria_despesa_gestao_financeira"),
+        numeric_columns(models.GestaoFinanceiraLancamentos)),
+}
+
+
+def invalid_param(name: str):
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                         detail=config.ERROR_MESSAGE_INVALID_PARAM.format(name))
+
+
+def parse_dimensions(aggregation: Aggregation, agrupar_por: Optional[str]) -> tuple:
+    """
+    Dimensões de agrupamento solicitadas, como pares (granularidade, coluna).
+    Colunas de data aceitam as granularidades mes: e ano:
+    """
+    dimensions = []
+    for item in (item.strip() for item in (agrupar_por or "").split(",")):
+        if not item:
+            continue
+        granularity, _, name = item.rpartition(SEPARADOR_GRANULARIDADE)
+        if name not in aggregation.dimensions:
+            raise invalid_param("agrupar_por")
+        column = aggregation.model.__table__.c[name]
+        if granularity and (granularity not in GRANULARIDADES or column_type(aggregation.model, column) is not date):
+            raise invalid_param("agrupar_por")
+        if (granularity, name) not in dimensions:
+            dimensions.append((granularity, name))
+    return tuple(dimensions)
+
+
+def parse_metrics(aggregation: Aggregation, valores: Optional[str]) -> tuple:
+    """
+    Colunas numéricas agregadas (soma, mínimo e máximo); por padrão, todas as permitidas
+    """
+    if not valores:
+        return aggregation.metrics
+    metrics = tuple(dict.fromkeys(item.strip() for item in valores.split(",") if item.strip()))
+    if not metrics or any(name not in aggregation.metrics for name in metrics):
+        raise invalid_param("valores")
+    return metrics
+
+
+def dimension_label(granularity: str, name: str) -> str:
+    return f"{granularity}_{name}" if granularity else name
+
+
+def dimension_expression(model, granularity: str, name: str):
+    """
+    Expressão SQL da dimensão: a coluna ou sua data truncada no mês/ano
+    """
+    column = model.__table__.c[name]
+    if granularity:
+        # literal granularity keeps the SELECT and GROUP BY expressions identical for the planner
+        return cast(func.date_trunc(literal_column(f"'{GRANULARIDADES[granularity]}'"), column), Date)
+    return column
+
+
+def aggregation_statement(aggregation: Aggregation, active: list, dimensions: tuple, metrics: tuple):
+    """
+    SELECT agregado: dimensões, contagem de registros e soma/mínimo/máximo das colunas numéricas,
+    com os mesmos filtros das rotas de consulta e limite de grupos parametrizado
+    """
+    model = aggregation.model
+    table = model.__table__
+    groups = [dimension_expression(model, granularity, name) for granularity, name in dimensions]
+    columns = [expression.label(dimension_label(granularity, name)) for expression, (granularity, name) in zip(groups, dimensions)]
+    columns.append(func.count().label("contagem"))
+    for name in metrics:
+        columns += [func.sum(table.c[name]).label(f"soma_{name}"),
+                    func.min(table.c[name]).label(f"minimo_{name}"),
+                    func.max(table.c[name]).label(f"maximo_{name}")]
+    return (select(*columns)
+            .select_from(table)
+            .where(*filter_predicates(active))
+            .group_by(*groups)
+            .order_by(*groups)
+            .limit(bindparam("_limite", type_=Integer)))
+
+
+@translate_statement_timeout
+async def aggregate(recurso: str, params: dict, agrupar_por: Optional[str], valores: Optional[str], dbsession: AsyncSession) -> dict:
+    """
+    Executa a agregação do recurso com os filtros informados. O resultado é armazenado
+    no cache por forma e valores da consulta
+    """
+    aggregation = AGREGACOES[recurso]
+    model = aggregation.model
+    dimensions = parse_dimensions(aggregation, agrupar_por)
+    metrics = parse_metrics(aggregation, valores)
+    active = active_filters(model, params)
+    values = filter_params(model, active)
+    shape = ("agregacao", filter_key(model, active), dimensions, metrics)
+
+    digest = hashlib.sha1(f"{shape!r}|{sorted(values.items())!r}".encode()).hexdigest()
+    cache_key = f"agregacao:{model.__tablename__}:{digest}"
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    statement = statement_cache.get(model.__tablename__, shape, lambda: aggregation_statement(aggregation, active, dimensions, metrics))
+    result = await dbsession.execute(statement, {**values, "_limite": config.MAX_AGGREGATION_GROUPS + 1})
+    rows = result.mappings().all()
+    if len(rows) > config.MAX_AGGREGATION_GROUPS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_TOO_MANY_GROUPS.format(config.MAX_AGGREGATION_GROUPS))
+
+    groups = []
+    for row in rows:
+        group = {dimension_label(granularity, name): row[dimension_label(granularity, name)] for granularity, name in dimensions}
+        group["contagem"] = row["contagem"]
+        group["valores"] = {name: {"soma": row[f"soma_{name}"], "minimo": row[f"minimo_{name}"], "maximo": row[f"maximo_{name}"]}
+                            for name in metrics}
+        groups.append(group)
+
+    response = {"grupos": groups, "total_grupos": len(groups)}
+    await cache.set(cache_key, response, expire=config.CACHE_TTL)
+    return response
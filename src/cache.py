@@ -1,8 +1,18 @@
 # src/cache.py
 from cashews import cache
+from cashews.key import get_cache_key_template
 
 def setup_cache(settings):
     # Setup cache server
     cache.setup(settings.CACHE_SERVER_URL, 
                 enable=True,
                 suppress=False)
+
+
+def cache_route(**kwargs):
+    # Cache of the query routes keyed by the query parameters only: the db session
+    # is a different object on every call and would make every key unique
+    def decorator(func):
+        key = get_cache_key_template(func, exclude_parameters=("dbsession",))
+        return cache(key=key, **kwargs)(func)
+    return decorator
@@ -1,47 +1,300 @@
 import asyncio
+import itertools
+import time
+import uuid
 from typing import AsyncGenerator
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
-from sqlmodel import SQLModel, Session
+from sqlalchemy.orm import Session as OrmSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import Session
 from sqlmodel.ext.asyncio.session import AsyncSession
 from appconfig import Settings
+from src.indexes import create_missing_indexes, create_trigram_indexes, verify_indexes
+from src.summaries import create_tables, create_summaries
 import logging
 from tenacity import retry, stop_after_attempt, wait_fixed
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+class ReadSession(OrmSession):
+    """
+    Sessão de leitura com tempo limite de execução das instruções (info["statement_timeout"], em segundos)
+    """
+
+
+@event.listens_for(ReadSession, "after_begin")
+def set_statement_timeout(session, transaction, connection):
+    # SET LOCAL lasts until the end of the session transaction, i.e. the request;
+    # runs only when the request actually uses the database
+    timeout = session.info.get("statement_timeout")
+    if timeout and connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout * 1000)}")
+
+
+class PoolMetrics:
+    """
+    Métricas do pool de conexões de um engine: tempo de espera no checkout e uso de overflow
+    """
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.overflow_checkouts = 0
+        self.max_overflow_in_use = 0
+
+    def record(self, wait: float, overflow: int) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if overflow > 0:
+            self.overflow_checkouts += 1
+            self.max_overflow_in_use = max(self.max_overflow_in_use, overflow)
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool de conexões que mede o tempo de cada checkout (espera por conexão livre
+    ou abertura de uma nova) e o uso de conexões de overflow
+    """
+    def __init__(self, *args, pool_size: int = 5, max_overflow: int = 10, **kw):
+        super().__init__(*args, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        self.metrics = PoolMetrics(pool_size + max_overflow)
+
+    def connect(self):
+        start = time.perf_counter()
+        connection = super().connect()
+        # overflow() counts the connections opened beyond pool_size (negative while the pool is not full)
+        self.metrics.record(time.perf_counter() - start, self.overflow())
+        return connection
+
+
+class DatabaseNode:
+    """
+    Nó de banco de dados (primário ou réplica de leitura): engine, fábrica de sessões,
+    estado de saúde e contadores de sessões usados no roteamento das leituras
+    """
+    def __init__(self, name: str, engine):
+        self.name = name
+        self.engine = engine
+        self.session_maker = async_sessionmaker(bind=engine, expire_on_commit=False, sync_session_class=ReadSession)
+        self.healthy = True
+        self.active_sessions = 0
+        self.total_sessions = 0
+
+    async def prefill(self, connections: int) -> None:
+        """
+        Abre conexões no pool antes das primeiras requisições, evitando a latência do pool frio
+        """
+        opened = await asyncio.gather(*(self.engine.connect() for _ in range(connections)), return_exceptions=True)
+        for conn in opened:
+            if not isinstance(conn, BaseException):
+                await conn.close()
+        failures = [conn for conn in opened if isinstance(conn, BaseException)]
+        if failures:
+            logger.warning(f"Nó {self.name}: {len(failures)} de {connections} conexões do pré-aquecimento falharam: {failures[0]!r}")
+
+    def pool_stats(self) -> dict:
+        """
+        Estado e métricas do pool de conexões do nó
+        """
+        pool = self.engine.pool
+        metrics = getattr(pool, "metrics", None)
+        if metrics is None:
+            return {}
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "utilization": pool.checkedout() / metrics.capacity if metrics.capacity else 0.0,
+            "checkouts": metrics.checkouts,
+            "avg_wait": metrics.total_wait / metrics.checkouts if metrics.checkouts else 0.0,
+            "max_wait": metrics.max_wait,
+            "overflow_checkouts": metrics.overflow_checkouts,
+            "max_overflow_in_use": metrics.max_overflow_in_use,
+        }
+
+
 # Initialize engine and sessionmaker once (no globals)
 class Database:
     def __init__(self):
         self.engine = None
         self.async_session_maker = None
+        self.settings = None
+        self.primary = None
+        self.replicas = []
+        self.dedicated = None
+        self.health_task = None
+        self._rotation = itertools.count()
 
-    @retry(stop=stop_after_attempt(5), wait=wait_fixed(3))
-    async def init_db(self):
-        settings = Settings()
-        self.engine = create_async_engine(
-            settings.DATABASE_URL,  # MUST be postgresql+asyncpg://...
+    def pool_sizing(self) -> tuple:
+        """
+        Tamanho do pool e overflow de cada worker: o orçamento global de conexões por banco
+        de dados (DB_MAX_CONNECTIONS) dividido entre os workers do uvicorn (WEB_CONCURRENCY),
+        com DB_POOL_OVERFLOW_FACTOR conexões de overflow para cada conexão persistente
+        """
+        per_worker = max(self.settings.DB_MAX_CONNECTIONS // max(self.settings.WEB_CONCURRENCY, 1), 1)
+        pool_size = max(per_worker // (1 + self.settings.DB_POOL_OVERFLOW_FACTOR), 1)
+        return pool_size, per_worker - pool_size
+
+    def connect_args(self) -> dict:
+        if self.settings.DB_PGBOUNCER:
+            # PgBouncer transaction pooling: server connections change between transactions,
+            # so prepared statements cannot be cached and need unique names
+            return {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        # asyncpg prepared statements kept per connection, reused by repeated query shapes
+        return {"prepared_statement_cache_size": self.settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+
+    def create_engine(self, url: str):
+        pool_size, max_overflow = self.pool_sizing()
+        return create_async_engine(
+            url,  # MUST be postgresql+asyncpg://...
             future=True,
+            poolclass=MeteredQueuePool,
             pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-            pool_recycle=3600  # recycle the connections after 1 hour (3600 seconds)
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=self.settings.DB_POOL_TIMEOUT,
+            pool_recycle=3600,  # recycle the connections after 1 hour (3600 seconds)
+            query_cache_size=self.settings.DB_QUERY_CACHE_SIZE,  # SQLAlchemy compiled statement cache
+            connect_args=self.connect_args()
         )
+
+    @retry(stop=stop_after_attempt(5), wait=wait_fixed(3))
+    async def init_db(self):
+        settings = Settings()
+        self.settings = settings
+        self.engine = self.create_engine(settings.DATABASE_URL)
         
         # Test connection
         async with self.engine.begin() as conn:
             await conn.run_sync(lambda _: None)  # Simple connection test
         
-        # Create tables
+        # Create tables (materialized views are created by create_summaries)
         async with self.engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.run_sync(create_tables)
+
+        # Create the summary materialized views that do not exist yet (populated by a join over the
+        # lancamentos table: off by default, created and refreshed with python -m src.summaries)
+        if settings.DB_CREATE_SUMMARIES:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(create_summaries)
+
+        # Create indexes declared on the models for tables that already existed (plain CREATE INDEX,
+        # blocks writes while it runs: off by default, provisioned with python -m src.indexes)
+        if settings.DB_CREATE_INDEXES:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(create_missing_indexes)
+
+        # Create pg_trgm GIN indexes for the substring (ILIKE) filters
+        if settings.DB_CREATE_TRIGRAM_INDEXES:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(create_trigram_indexes)
+
+        # Log the query indexes still missing
+        async with self.engine.connect() as conn:
+            await conn.run_sync(verify_indexes)
         
         self.async_session_maker = async_sessionmaker(
             bind=self.engine, 
             expire_on_commit=False
         )
+        self.primary = DatabaseNode("primario", self.engine)
+
+        # Read replicas: a replica down at startup stays out of rotation until a health check succeeds
+        self.replicas = [DatabaseNode(f"replica_{i}", self.create_engine(url))
+                         for i, url in enumerate(settings.DATABASE_REPLICA_URLS, start=1)]
+        if settings.DATABASE_DEDICATED_REPLICA_URL:
+            self.dedicated = DatabaseNode("replica_dedicada", self.create_engine(settings.DATABASE_DEDICATED_REPLICA_URL))
+        await self.check_replicas()
+        if self.replica_nodes() and self.health_task is None:
+            self.health_task = asyncio.create_task(self.monitor_replicas())
+
+        # Warm up the pools of the nodes in rotation
+        pool_size, max_overflow = self.pool_sizing()
+        logger.info(f"Pool de conexões por worker: {pool_size} + {max_overflow} de overflow")
+        connections = min(self.settings.DB_POOL_MIN_CONNECTIONS, pool_size)
+        if connections > 0:
+            await asyncio.gather(*(node.prefill(connections) for node in self.nodes() if node.healthy))
+
+    def replica_nodes(self) -> list:
+        return self.replicas + ([self.dedicated] if self.dedicated else [])
+
+    def nodes(self) -> list:
+        return ([self.primary] if self.primary else []) + self.replica_nodes()
+
+    async def check_node(self, node: DatabaseNode) -> None:
+        """
+        Verifica a saúde do nó com SELECT 1, retirando-o ou devolvendo-o à rotação
+        """
+        try:
+            async with node.engine.connect() as conn:
+                await asyncio.wait_for(conn.execute(text("SELECT 1")), timeout=self.settings.DB_HEALTH_CHECK_TIMEOUT)
+            healthy = True
+        except Exception as e:
+            healthy = False
+            if node.healthy:
+                logger.warning(f"Nó {node.name} retirado da rotação: {e!r}")
+        if healthy and not node.healthy:
+            logger.info(f"Nó {node.name} devolvido à rotação")
+        node.healthy = healthy
+
+    async def check_replicas(self) -> None:
+        await asyncio.gather(*(self.check_node(node) for node in self.replica_nodes()))
+
+    async def monitor_replicas(self) -> None:
+        """
+        Tarefa de segundo plano: verificação periódica da saúde das réplicas
+        """
+        while True:
+            await asyncio.sleep(self.settings.DB_HEALTH_CHECK_INTERVAL)
+            await self.check_replicas()
+
+    def route(self, dedicated: bool = False) -> DatabaseNode:
+        """
+        Nó que atende a próxima sessão de leitura: a réplica dedicada para consultas pesadas
+        (quando configurada e saudável) ou uma das réplicas saudáveis, por rodízio ou pelo menor
+        número de sessões ativas. O primário atende quando não há réplica saudável ou DB_READ_FROM_PRIMARY
+        """
+        if dedicated and self.dedicated is not None and self.dedicated.healthy:
+            return self.dedicated
+        nodes = [node for node in self.replicas if node.healthy]
+        if not nodes or self.settings.DB_READ_FROM_PRIMARY:
+            nodes.append(self.primary)
+        if len(nodes) == 1:
+            return nodes[0]
+        if self.settings.DB_REPLICA_ROUTING == "least_connections":
+            return min(nodes, key=lambda node: node.active_sessions)
+        return nodes[next(self._rotation) % len(nodes)]
 
-    async def get_db_session(self) -> AsyncGenerator[AsyncSession, None]:
-        async with self.async_session_maker() as session:
-            yield session
+    async def get_db_session(self, dedicated: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        node = self.route(dedicated)
+        timeout = self.settings.DB_DEDICATED_STATEMENT_TIMEOUT if dedicated else self.settings.DB_STATEMENT_TIMEOUT
+        node.active_sessions += 1
+        node.total_sessions += 1
+        try:
+            async with node.session_maker(info={"statement_timeout": timeout}) as session:
+                yield session
+        except DBAPIError as e:
+            # lost connection to a replica: out of rotation until the next successful health check
+            if e.connection_invalidated and node is not self.primary and node.healthy:
+                node.healthy = False
+                logger.warning(f"Nó {node.name} retirado da rotação: {e!r}")
+            raise
+        finally:
+            node.active_sessions -= 1
 
+    async def close(self) -> None:
+        if self.health_task is not None:
+            self.health_task.cancel()
+            self.health_task = None
+        for node in self.nodes():
+            await node.engine.dispose()
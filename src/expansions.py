@@ -0,0 +1,132 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import NamedTuple, Optional
+from sqlalchemy import bindparam, any_, Integer, ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel, select
+from fastapi import HTTPException, status
+from src.statements import statement_cache
+from appconfig import Settings
+
+config = Settings()
+
+
+# Parâmetro de expansão das relações filhas e separador de níveis (ex.: metas.acoes)
+PARAMETRO_EXPANDIR = "expandir"
+SEPARADOR_NIVEL = "."
+
+
+class Relation(NamedTuple):
+    """
+    Relação filha de um modelo, derivada de uma chave estrangeira declarada em src/models.py
+    """
+    child: type
+    foreign_key: object
+    parent_key: object
+
+
+@lru_cache(maxsize=None)
+def relations(model) -> dict:
+    """
+    Relações filhas do modelo, por nome: chaves estrangeiras de outros modelos que referenciam
+    a tabela do modelo e declaram o nome da relação em Column.info["expansao"]
+    """
+    found = {}
+    for mapper in SQLModel._sa_registry.mappers:
+        for column in mapper.local_table.columns:
+            name = column.info.get("expansao")
+            if name is None:
+                continue
+            for foreign_key in column.foreign_keys:
+                if foreign_key.column.table is model.__table__:
+                    found[name] = Relation(mapper.class_, column, foreign_key.column)
+    return found
+
+
+def parse_expansions(model, expandir: Optional[str]) -> tuple:
+    """
+    Caminhos de relações solicitados pelo parâmetro expandir (nomes separados por vírgula,
+    níveis separados por ponto), como tuplas de nomes.
+    Retorna tupla vazia quando o parâmetro não foi informado
+    """
+    if not expandir:
+        return ()
+    paths = set()
+    for path in (path.strip() for path in expandir.split(",")):
+        if not path:
+            continue
+        current = model
+        for name in path.split(SEPARADOR_NIVEL):
+            available = relations(current)
+            if name not in available:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                    detail=config.ERROR_MESSAGE_INVALID_EXPANSION.format(path, ", ".join(sorted(available)) or "-"))
+            current = available[name].child
+        paths.add(tuple(path.split(SEPARADOR_NIVEL)))
+    return tuple(sorted(paths))
+
+
+def as_dict(instance) -> dict:
+    """
+    Registro como dicionário das colunas da tabela, ao qual as relações expandidas são anexadas
+    """
+    if isinstance(instance, dict):
+        return instance
+    return {column.name: getattr(instance, column.name) for column in instance.__table__.columns}
+
+
+def keys_predicate(column, dialect):
+    """
+    Registros filhos das chaves do pai. No PostgreSQL as chaves vão em um único parâmetro
+    do tipo array (= ANY), como nos filtros de lista: o SQL não muda com a quantidade de chaves
+    e não há um parâmetro por chave
+    """
+    if dialect.name == "postgresql":
+        return column == any_(bindparam("_chaves", type_=ARRAY(column.type)))
+    return column.in_(bindparam("_chaves", expanding=True))
+
+
+def children_statement(model, name: str, relation: Relation, dialect):
+    """
+    Consulta dos registros filhos de um conjunto de chaves do pai, ordenados pela chave primária e
+    limitados a MAX_EXPANSION_ROWS registros (um a mais, para detectar que o limite foi excedido)
+    """
+    def build():
+        return (select(relation.child)
+                .where(keys_predicate(relation.foreign_key, dialect))
+                .order_by(*relation.child.__table__.primary_key.columns)
+                .limit(bindparam("_limite", type_=Integer)))
+    return statement_cache.get(model.__tablename__, ("expandir", model.__tablename__, name, dialect.name), build)
+
+
+async def expand_items(model, items: list, paths: tuple, dbsession: AsyncSession) -> list:
+    """
+    Anexa a cada registro da página as relações filhas solicitadas, carregando cada relação
+    para a página inteira com uma única consulta (IN das chaves dos pais) e descendo
+    recursivamente nos níveis seguintes
+    """
+    items = [as_dict(item) for item in items]
+    nested = defaultdict(list)
+    for path in paths:
+        nested[path[0]].append(path[1:])
+
+    for name, subpaths in nested.items():
+        relation = relations(model)[name]
+        keys = list({item[relation.parent_key.name] for item in items})
+        children = []
+        if keys:
+            statement = children_statement(model, name, relation, dbsession.bind.dialect)
+            result = await dbsession.execute(statement, {"_chaves": keys, "_limite": config.MAX_EXPANSION_ROWS + 1})
+            rows = result.scalars().all()
+            if len(rows) > config.MAX_EXPANSION_ROWS:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                    detail=config.ERROR_MESSAGE_TOO_MANY_EXPANSION_ROWS.format(name, config.MAX_EXPANSION_ROWS))
+            children = await expand_items(relation.child, rows,
+                                          tuple(subpath for subpath in subpaths if subpath), dbsession)
+
+        grouped = defaultdict(list)
+        for child in children:
+            grouped[child[relation.foreign_key.name]].append(child)
+        for item in items:
+            item[name] = grouped.get(item[relation.parent_key.name], [])
+    return items
@@ -0,0 +1,155 @@
+from contextlib import suppress
+from functools import lru_cache
+from typing import NamedTuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel, select
+import asyncio
+import csv
+import io
+import orjson
+from src import models  # registers the tables read by exportable_models
+from src.filters import active_filters, filter_key, filter_predicates, filter_params, parse_fields, PARAMETRO_CAMPOS
+from src.statements import statement_cache
+from appconfig import Settings
+
+config = Settings()
+
+
+# Formatos de exportação: tipo de conteúdo e extensão do arquivo
+FORMATOS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+
+@lru_cache(maxsize=None)
+def exportable_models() -> dict:
+    """
+    Modelos exportáveis, pelo nome da tabela (o mesmo do endpoint de consulta)
+    """
+    return {mapper.class_.__tablename__: mapper.class_
+            for mapper in sorted(SQLModel._sa_registry.mappers, key=lambda mapper: mapper.class_.__tablename__)}
+
+
+class ExportQuery(NamedTuple):
+    """
+    Consulta de exportação: modelo, colunas selecionadas, instrução filtrada e ordenada pela chave primária,
+    valores dos parâmetros dos filtros e chave da forma da consulta
+    """
+    model: type
+    columns: list
+    statement: object
+    params: dict
+    key: tuple
+
+
+def compile_export(model, params: dict) -> ExportQuery:
+    """
+    Compila os filtros e o parâmetro campos informados na consulta de exportação do modelo.
+    Sem filtros, exporta a tabela inteira
+    """
+    active = active_filters(model, params)
+    fields = parse_fields(model, params.get(PARAMETRO_CAMPOS))
+    table = model.__table__
+    columns = [column.name for column in table.columns if not fields or column.name in fields]
+    key = ("exportar", filter_key(model, active), fields)
+    statement = statement_cache.get(
+        table.name, key,
+        lambda: (select(*[table.c[name] for name in columns])
+                 .where(*filter_predicates(active))
+                 .order_by(*table.primary_key.columns)))
+    return ExportQuery(model, columns, statement, filter_params(model, active), key)
+
+
+def ndjson_chunk(rows, columns: list, header: bool) -> bytes:
+    """
+    Bloco NDJSON: um objeto JSON por linha
+    """
+    return b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+
+def csv_chunk(rows, columns: list, header: bool) -> bytes:
+    """
+    Bloco CSV, com a linha de cabeçalho no primeiro bloco
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows(["" if value is None else value for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+SERIALIZADORES = {
+    "ndjson": ndjson_chunk,
+    "csv": csv_chunk,
+}
+
+
+async def stream_rows(query: ExportQuery, formato: str, dbsession: AsyncSession):
+    """
+    Gera os blocos do arquivo exportado a partir de um cursor no servidor (stream_results),
+    lendo EXPORT_CHUNK_SIZE linhas por vez: a memória usada não depende do tamanho do resultado
+    e cada bloco é enviado ao cliente assim que lido
+    """
+    serialize = SERIALIZADORES[formato]
+    header = True
+    result = await dbsession.stream(query.statement, query.params,
+                                    execution_options={"yield_per": config.EXPORT_CHUNK_SIZE})
+    async for rows in result.partitions():
+        yield serialize(rows, query.columns, header)
+        header = False
+    if header and formato == "csv":
+        # empty result: header only
+        yield serialize([], query.columns, header)
+
+
+async def copy_rows(query: ExportQuery, dbsession: AsyncSession):
+    """
+    Gera o CSV diretamente pelo PostgreSQL (COPY (consulta) TO STDOUT WITH CSV HEADER, via asyncpg
+    copy_from_query): os blocos recebidos do servidor são repassados sem criar objetos por registro.
+    A fila limitada aplica contrapressão ao COPY quando o cliente lê mais devagar
+    """
+    conn = await dbsession.connection()
+    dialect = conn.dialect
+    compiled = statement_cache.get(query.model.__tablename__, query.key + (f"copy_{dialect.name}",),
+                                   lambda: query.statement.compile(dialect=dialect))
+    values = {**compiled.params, **query.params}
+    args = [values[name] for name in compiled.positiontup]
+    # COPY is a single statement: the export timeout replaces the per-request one
+    await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {config.EXPORT_STATEMENT_TIMEOUT * 1000}")
+    driver = (await conn.get_raw_connection()).driver_connection
+
+    chunks = asyncio.Queue(maxsize=config.EXPORT_COPY_QUEUE_SIZE)
+
+    async def copy():
+        # None marks the end of the data; not sent when cancelled, as the queue may be full
+        try:
+            await driver.copy_from_query(compiled.string, *args, output=chunks.put, format="csv", header=True)
+        except Exception:
+            await chunks.put(None)
+            raise
+        await chunks.put(None)
+
+    task = asyncio.create_task(copy())
+    try:
+        while (chunk := await chunks.get()) is not None:
+            yield bytes(chunk)
+        await task  # raises the COPY error, if any
+    finally:
+        if not task.done():
+            # client went away mid-stream: cancel the COPY and discard the connection
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            await conn.invalidate()
+
+
+def export_rows(query: ExportQuery, formato: str, dbsession: AsyncSession):
+    """
+    Blocos do arquivo exportado: CSV pelo COPY do PostgreSQL (EXPORT_CSV_COPY) ou,
+    nos demais casos, serializados a partir do cursor no servidor
+    """
+    if formato == "csv" and config.EXPORT_CSV_COPY and dbsession.bind.dialect.name == "postgresql":
+        return copy_rows(query, dbsession)
+    return stream_rows(query, formato, dbsession)
@@ -0,0 +1,309 @@
+from datetime import date, timedelta
+from typing import NamedTuple, Optional
+from sqlalchemy import bindparam, and_, any_, String, ARRAY
+from sqlmodel import select, cast, Time, func
+from fastapi import HTTPException, status
+from src.statements import statement_cache
+from src.expansions import parse_expansions, PARAMETRO_EXPANDIR
+from appconfig import Settings
+
+config = Settings()
+
+
+# Tipos de filtro suportados, declarados em Column.info["filtro"] nos modelos (src/models.py)
+FILTRO_IGUAL = "igual"
+FILTRO_TEXTO = "texto"
+FILTRO_DATA = "data"
+FILTRO_HORA = "hora"
+FILTRO_DATA_DE = "data_de"
+FILTRO_DATA_ATE = "data_ate"
+FILTRO_MIN = "min"
+FILTRO_MAX = "max"
+FILTRO_LISTA = "lista"
+
+# Sufixos dos parâmetros de intervalo das colunas de data e do limite superior da data exata
+SUFIXO_DE = "_de"
+SUFIXO_ATE = "_ate"
+SUFIXO_LIMITE = "_limite"
+
+# Sufixos dos parâmetros de intervalo das colunas numéricas (valores monetários)
+SUFIXO_MIN = "_min"
+SUFIXO_MAX = "_max"
+
+# Prefixos dos parâmetros de identificadores, que aceitam múltiplos valores (repetidos ou separados por vírgula)
+PREFIXOS_LISTA = ("id_", "codigo_")
+SEPARADOR_LISTA = ","
+
+# Parâmetro de seleção dos campos retornados (projeção de colunas)
+PARAMETRO_CAMPOS = "campos"
+
+# Parâmetro de ordenação e prefixo de ordem decrescente
+PARAMETRO_ORDENACAO = "ordenar_por"
+PREFIXO_DECRESCENTE = "-"
+
+
+def column_param(column) -> str:
+    """
+    Nome do parâmetro de consulta associado à coluna
+    """
+    return column.info.get("parametro", column.name)
+
+
+def column_type(model, column) -> type:
+    """
+    Tipo Python declarado para a coluna no modelo
+    """
+    return model.model_fields[column.name].annotation
+
+
+def column_filter(model, column) -> str:
+    """
+    Tipo de filtro aplicado à coluna: o declarado no modelo ou, na ausência dele,
+    filtro por data para colunas de data e por igualdade para as demais
+    """
+    if "filtro" in column.info:
+        return column.info["filtro"]
+    if column_type(model, column) is date:
+        return FILTRO_DATA
+    return FILTRO_IGUAL
+
+
+def column_filters(model, column) -> list:
+    """
+    Parâmetros de consulta aceitos pela coluna, como pares (parâmetro, tipo de filtro).
+    Colunas de data aceitam, além da data exata, os parâmetros de intervalo
+    <parametro>_de e <parametro>_ate (datas inclusivas); colunas numéricas (float)
+    aceitam <parametro>_min e <parametro>_max (valores inclusivos)
+    """
+    param = column_param(column)
+    kind = column_filter(model, column)
+    if kind == FILTRO_DATA:
+        return [(param, FILTRO_DATA), (param + SUFIXO_DE, FILTRO_DATA_DE), (param + SUFIXO_ATE, FILTRO_DATA_ATE)]
+    if column_type(model, column) is float:
+        return [(param, kind), (param + SUFIXO_MIN, FILTRO_MIN), (param + SUFIXO_MAX, FILTRO_MAX)]
+    return [(param, kind)]
+
+
+def accepts_list(model, column) -> bool:
+    """
+    Indica se o filtro da coluna aceita múltiplos valores: filtros de igualdade de identificadores e códigos
+    """
+    return column_filter(model, column) == FILTRO_IGUAL and column_param(column).startswith(PREFIXOS_LISTA)
+
+
+def filter_value(model, column, name: str, kind: str, value):
+    """
+    Valor e tipo efetivo do filtro. Parâmetros de múltiplos valores chegam como lista
+    (valores repetidos), cujos itens podem ainda ser separados por vírgula: um único valor
+    mantém o filtro de igualdade e dois ou mais valores viram o filtro de lista (= ANY).
+    Retorna valor None quando o filtro não foi informado
+    """
+    if not isinstance(value, list):
+        return value, kind
+    values = list(dict.fromkeys(item.strip() for entry in value for item in str(entry).split(SEPARADOR_LISTA) if item.strip()))
+    if not values:
+        return None, kind
+    if len(values) == 1:
+        return values[0], kind
+    if not accepts_list(model, column):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_INVALID_PARAM.format(name))
+    if len(values) > config.MAX_FILTER_VALUES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_TOO_MANY_VALUES.format(name, config.MAX_FILTER_VALUES))
+    return values, FILTRO_LISTA
+
+
+def coerce_value(model, column, name: str, value):
+    """
+    Converte o valor recebido na consulta para o tipo Python da coluna
+    """
+    python_type = column_type(model, column)
+    try:
+        if python_type is date and isinstance(value, str):
+            return date.fromisoformat(value)
+        if python_type in (int, float) and isinstance(value, str):
+            return python_type(value)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_INVALID_PARAM.format(name))
+    return value
+
+
+def bind_values(model, column, name: str, kind: str, value) -> dict:
+    """
+    Valores passados na execução para os parâmetros do filtro
+    """
+    if kind == FILTRO_TEXTO:
+        return {name: f"%{value}%"}
+    if kind == FILTRO_LISTA:
+        return {name: [coerce_value(model, column, name, item) for item in value]}
+    value = coerce_value(model, column, name, value)
+    if kind == FILTRO_DATA:
+        return {name: value, name + SUFIXO_LIMITE: value + timedelta(days=1)}
+    if kind == FILTRO_DATA_ATE:
+        return {name: value + timedelta(days=1)}
+    return {name: value}
+
+
+def build_predicate(column, name: str, kind: str):
+    """
+    Monta o predicado SQL de um filtro, com o valor como parâmetro nomeado (bindparam).
+    Filtros de data comparam a coluna diretamente com o intervalo [início, fim), sem
+    aplicar funções ou conversões sobre ela, de modo que o índice da coluna possa ser usado
+    """
+    param = bindparam(name, type_=column.type)
+    if kind == FILTRO_TEXTO:
+        return column.ilike(param)
+    if kind == FILTRO_DATA:
+        return and_(column >= param, column < bindparam(name + SUFIXO_LIMITE, type_=column.type))
+    if kind == FILTRO_DATA_DE:
+        return column >= param
+    if kind == FILTRO_DATA_ATE:
+        return column < param
+    if kind == FILTRO_MIN:
+        return column >= param
+    if kind == FILTRO_MAX:
+        return column <= param
+    if kind == FILTRO_LISTA:
+        # a single array parameter keeps the statement shape regardless of the number of values
+        return column == any_(bindparam(name, type_=ARRAY(column.type)))
+    if kind == FILTRO_HORA:
+        return func.to_char(cast(column, Time), 'HH24:MI') == bindparam(name, type_=String())
+    return column == param
+
+
+def parse_fields(model, campos: Optional[str]) -> tuple:
+    """
+    Colunas selecionadas pelo parâmetro campos (nomes separados por vírgula), na ordem da tabela.
+    A chave primária é sempre incluída, pois ordena a paginação e compõe o cursor
+    (assim como a coluna de ordenação, incluída em compile_query).
+    Retorna tupla vazia quando o parâmetro não foi informado (todas as colunas)
+    """
+    if not campos:
+        return ()
+    requested = {name.strip() for name in campos.split(",") if name.strip()}
+    columns = {column_param(column): column for column in model.__table__.columns}
+    unknown = requested - columns.keys()
+    if unknown:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_INVALID_FIELDS.format(", ".join(sorted(unknown))))
+    return tuple(column.name for name, column in columns.items() if name in requested or column.primary_key)
+
+
+def sortable_columns(model) -> dict:
+    """
+    Colunas aceitas na ordenação, por nome do parâmetro: a chave primária e as colunas indexadas (btree),
+    de modo que a ordenação seja atendida por índice
+    """
+    return {column_param(column): column for column in model.__table__.columns if column.primary_key or column.index}
+
+
+def parse_order(model, ordenar_por: Optional[str]) -> tuple:
+    """
+    Ordenação solicitada pelo parâmetro ordenar_por, como (coluna, decrescente).
+    Retorna tupla vazia quando o parâmetro não foi informado (ordenação pela chave primária)
+    """
+    if not ordenar_por:
+        return ()
+    descending = ordenar_por.startswith(PREFIXO_DECRESCENTE)
+    name = ordenar_por.removeprefix(PREFIXO_DECRESCENTE).strip()
+    columns = sortable_columns(model)
+    if name not in columns:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_INVALID_ORDER.format(name, ", ".join(columns)))
+    return (columns[name].name, descending)
+
+
+class FilteredQuery(NamedTuple):
+    """
+    Consulta filtrada de um modelo: instrução SQL (compartilhada entre consultas de mesma forma),
+    valores dos parâmetros, chave dos filtros ativos, colunas projetadas (vazio para todas),
+    ordenação (vazio para a chave primária) e relações filhas expandidas
+    """
+    model: type
+    statement: object
+    params: dict
+    key: tuple
+    fields: tuple = ()
+    order: tuple = ()
+    expand: tuple = ()
+
+
+def select_fields(model, fields: tuple):
+    """
+    SELECT do modelo completo ou somente das colunas projetadas
+    """
+    if not fields:
+        return select(model)
+    return select(*[model.__table__.c[name] for name in fields])
+
+
+class ActiveFilter(NamedTuple):
+    """
+    Filtro informado na consulta: coluna, nome do parâmetro, tipo de filtro e valor
+    """
+    column: object
+    name: str
+    kind: str
+    value: object
+
+
+def active_filters(model, params: dict) -> list:
+    """
+    Filtros ativos (valor diferente de None) entre os parâmetros informados, sempre na ordem
+    das colunas da tabela, de modo que a mesma combinação de filtros produza sempre o mesmo SQL
+    """
+    active = []
+    for column in model.__table__.columns:
+        for name, kind in column_filters(model, column):
+            value, kind = filter_value(model, column, name, kind, params.get(name))
+            if value is not None:
+                active.append(ActiveFilter(column, name, kind, value))
+    return active
+
+
+def filter_key(model, active: list) -> tuple:
+    """
+    Chave da forma dos filtros ativos: tabela e pares (parâmetro, tipo de filtro)
+    """
+    return (model.__tablename__, tuple((item.name, item.kind) for item in active))
+
+
+def filter_predicates(active: list) -> list:
+    """
+    Predicados SQL dos filtros ativos
+    """
+    return [build_predicate(item.column, item.name, item.kind) for item in active]
+
+
+def filter_params(model, active: list) -> dict:
+    """
+    Valores dos parâmetros de execução dos filtros ativos
+    """
+    values = {}
+    for item in active:
+        values.update(bind_values(model, item.column, item.name, item.kind, item.value))
+    return values
+
+
+def compile_query(model, params: dict) -> Optional[FilteredQuery]:
+    """
+    Compila os parâmetros de consulta informados na consulta filtrada do modelo.
+    Somente filtros ativos geram predicados (ver active_filters).
+    Retorna None quando nenhum filtro foi informado. O parâmetro campos restringe as colunas selecionadas
+    e os parâmetros ordenar_por e expandir definem a ordenação e as relações filhas incorporadas
+    """
+    active = active_filters(model, params)
+    if not active:
+        return None
+
+    fields = parse_fields(model, params.get(PARAMETRO_CAMPOS))
+    order = parse_order(model, params.get(PARAMETRO_ORDENACAO))
+    expand = parse_expansions(model, params.get(PARAMETRO_EXPANDIR))
+    if fields and order and order[0] not in fields:
+        # the sort column is needed to build the cursor of the next page
+        fields = tuple(column.name for column in model.__table__.columns if column.name in fields or column.name == order[0])
+    key = filter_key(model, active)
+    statement = statement_cache.get(model.__tablename__, (key, fields), lambda: select_fields(model, fields).where(*filter_predicates(active)))
+    return FilteredQuery(model, statement, filter_params(model, active), key, fields, order, expand)
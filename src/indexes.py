@@ -0,0 +1,141 @@
+from sqlalchemy import inspect
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from src import models  # registers the tables on SQLModel.metadata
+from src.filters import FILTRO_TEXTO
+from appconfig import Settings
+import hashlib
+import logging
+import asyncio
+
+logger = logging.getLogger(__name__)
+
+# Limite de tamanho de identificadores do PostgreSQL
+MAX_IDENTIFIER_LENGTH = 63
+
+
+def existing_indexes(connection) -> dict:
+    """
+    Nomes dos índices existentes no banco de dados, por tabela dos modelos
+    """
+    inspector = inspect(connection)
+    return {table.fullname: {index["name"] for index in inspector.get_indexes(table.name, schema=table.schema)}
+            for table in SQLModel.metadata.sorted_tables
+            if inspector.has_table(table.name, schema=table.schema)}
+
+
+def missing_indexes(connection) -> list:
+    """
+    Índices declarados nos modelos (Field(index=True)) que ainda não existem no banco de dados.
+    O create_all só cria índices junto com a tabela, então tabelas já existentes
+    não recebem os índices adicionados posteriormente aos modelos
+    """
+    existing = existing_indexes(connection)
+    preparer = connection.dialect.identifier_preparer
+    # format_index aplica a abreviação de nomes longos feita pelo SQLAlchemy na criação do índice
+    return [index
+            for table in SQLModel.metadata.sorted_tables if table.fullname in existing
+            for index in table.indexes if preparer.format_index(index) not in existing[table.fullname]]
+
+
+def create_missing_indexes(connection, concurrently: bool = False) -> None:
+    """
+    Cria os índices declarados nos modelos que ainda não existem no banco de dados.
+    Com concurrently=True a conexão deve estar em modo AUTOCOMMIT
+    """
+    for index in missing_indexes(connection):
+        logger.info(f"Criando índice {index.name} em {index.table.fullname}")
+        ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=connection.dialect))
+        if concurrently:
+            ddl = ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+        connection.exec_driver_sql(ddl)
+
+
+def text_search_columns() -> list:
+    """
+    Colunas pesquisadas por substring (filtro texto, ILIKE '%valor%') nas rotas de consulta
+    """
+    return [column
+            for table in SQLModel.metadata.sorted_tables
+            for column in table.columns
+            if column.info.get("filtro") == FILTRO_TEXTO]
+
+
+def trigram_index_name(column) -> str:
+    """
+    Nome do índice de trigramas da coluna, abreviado com um hash quando excede
+    o limite de tamanho de identificadores do PostgreSQL
+    """
+    name = f"ix_trgm_{column.table.name}_{column.name}"
+    if len(name) > MAX_IDENTIFIER_LENGTH:
+        digest = hashlib.md5(name.encode()).hexdigest()[:8]
+        name = f"{name[:MAX_IDENTIFIER_LENGTH - 9]}_{digest}"
+    return name
+
+
+def trigram_index_ddl(column, concurrently: bool = False) -> str:
+    """
+    DDL do índice GIN de trigramas (pg_trgm) da coluna, que atende ao ILIKE com curinga inicial
+    """
+    return (f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {trigram_index_name(column)} "
+            f"ON {column.table.fullname} USING gin ({column.name} gin_trgm_ops)")
+
+
+def create_trigram_indexes(connection, concurrently: bool = False) -> None:
+    """
+    Cria a extensão pg_trgm e os índices de trigramas das colunas pesquisadas por substring.
+    Com concurrently=True a conexão deve estar em modo AUTOCOMMIT
+    """
+    if connection.dialect.name != "postgresql":
+        logger.warning(f"Índices de trigramas não suportados pelo banco de dados {connection.dialect.name}")
+        return
+    connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in text_search_columns():
+        logger.info(f"Criando índice {trigram_index_name(column)} em {column.table.fullname}")
+        connection.exec_driver_sql(trigram_index_ddl(column, concurrently))
+
+
+def missing_trigram_indexes(connection) -> list:
+    """
+    Colunas pesquisadas por substring que ainda não possuem índice de trigramas
+    """
+    existing = existing_indexes(connection)
+    return [column for column in text_search_columns()
+            if column.table.fullname in existing and trigram_index_name(column) not in existing[column.table.fullname]]
+
+
+def verify_indexes(connection) -> None:
+    """
+    Verifica, na inicialização, se os índices de consulta existem no banco de dados
+    e registra no log os ausentes (provisionados com python -m src.indexes)
+    """
+    missing = [f"{index.table.fullname}.{index.name}" for index in missing_indexes(connection)]
+    if connection.dialect.name == "postgresql":
+        missing += [f"{column.table.fullname}.{trigram_index_name(column)}" for column in missing_trigram_indexes(connection)]
+    for name in missing:
+        logger.warning(f"Índice ausente: {name}")
+    if missing:
+        logger.warning(f"{len(missing)} índice(s) de consulta ausente(s). Execute python -m src.indexes para criá-los")
+    else:
+        logger.info("Todos os índices de consulta estão presentes")
+
+
+async def provision_indexes() -> None:
+    """
+    Provisiona os índices de consulta (índices dos modelos e de trigramas) sem bloquear
+    escritas nas tabelas, com CREATE INDEX CONCURRENTLY
+    """
+    engine = create_async_engine(Settings().DATABASE_URL, isolation_level="AUTOCOMMIT")
+    try:
+        async with engine.connect() as conn:
+            await conn.run_sync(create_missing_indexes, True)
+            await conn.run_sync(create_trigram_indexes, True)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    # python -m src.indexes
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(provision_indexes())
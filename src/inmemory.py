@@ -0,0 +1,330 @@
+from array import array
+from functools import lru_cache, wraps
+from math import ceil
+from typing import Optional
+from sqlalchemy import text, bindparam
+from sqlmodel import SQLModel, select, func
+import asyncio
+import logging
+import re
+from src.filters import (
+    compile_query, active_filters, sortable_columns, FilteredQuery,
+    FILTRO_IGUAL, FILTRO_TEXTO, FILTRO_DATA, FILTRO_HORA, FILTRO_DATA_DE, FILTRO_DATA_ATE, FILTRO_MIN, FILTRO_MAX, FILTRO_LISTA, SUFIXO_LIMITE,
+)
+from src.expansions import expand_items
+from src.schemas import PaginatedResponseTemplate
+from src.utils import decode_cursor, encode_cursor, order_columns, order_spec
+from appconfig import Settings
+
+logger = logging.getLogger(__name__)
+config = Settings()
+
+
+class MemoryMiss(Exception):
+    """
+    Consulta que a cópia em memória não responde com a mesma semântica do banco de dados
+    (ex.: cursor de um registro que não existe mais); atendida pelo banco de dados
+    """
+
+
+@lru_cache(maxsize=1024)
+def like_pattern(pattern: str):
+    """
+    Expressão regular equivalente ao padrão do ILIKE: % e _ como curingas e \\ como caractere de escape
+    """
+    regex = []
+    escaped = False
+    for char in pattern:
+        if escaped:
+            regex.append(re.escape(char))
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "%":
+            regex.append(".*")
+        elif char == "_":
+            regex.append(".")
+        else:
+            regex.append(re.escape(char))
+    if escaped:
+        # PostgreSQL rejects a pattern ending with the escape character
+        raise MemoryMiss(pattern)
+    return re.compile("".join(regex), re.IGNORECASE | re.DOTALL)
+
+
+def row_predicate(position: int, name: str, kind: str, params: dict):
+    """
+    Predicado Python de um filtro sobre a tupla do registro, com a semântica de build_predicate
+    (src/filters.py) e os mesmos valores de execução (bind_values). Como no SQL, valores nulos
+    não satisfazem nenhum filtro
+    """
+    value = params[name]
+    if kind == FILTRO_TEXTO:
+        pattern = like_pattern(value)
+        return lambda row: row[position] is not None and pattern.fullmatch(row[position]) is not None
+    if kind == FILTRO_DATA:
+        limit = params[name + SUFIXO_LIMITE]
+        return lambda row: row[position] is not None and value <= row[position] < limit
+    if kind in (FILTRO_DATA_DE, FILTRO_MIN):
+        return lambda row: row[position] is not None and row[position] >= value
+    if kind == FILTRO_DATA_ATE:
+        return lambda row: row[position] is not None and row[position] < value
+    if kind == FILTRO_MAX:
+        return lambda row: row[position] is not None and row[position] <= value
+    if kind == FILTRO_LISTA:
+        values = frozenset(value)
+        return lambda row: row[position] in values
+    if kind == FILTRO_HORA:
+        return lambda row: row[position] is not None and row[position].strftime("%H:%M") == value
+    return lambda row: row[position] is not None and row[position] == value
+
+
+class MemoryTable:
+    """
+    Cópia em memória de uma tabela pequena: registros como tuplas na ordem da chave primária,
+    índices de igualdade (valor -> posições) da chave primária e das colunas indexadas e,
+    para cada coluna aceita em ordenar_por, a posição de cada registro na ordenação do banco
+    de dados (a ordem dos textos segue a collation do servidor, não a do Python)
+    """
+    def __init__(self, model, rows: list, ranks: dict, version):
+        self.model = model
+        self.version = version
+        self.rows = rows
+        self.columns = tuple(column.name for column in model.__table__.columns)
+        self.positions = {name: i for i, name in enumerate(self.columns)}
+        self.ranks = ranks
+        table = model.__table__
+        indexed = [column.name for column in table.columns if column.primary_key or column.index]
+        self.indexes = {}
+        for name in indexed:
+            index = {}
+            position = self.positions[name]
+            for i, row in enumerate(rows):
+                index.setdefault(row[position], array("I")).append(i)
+            self.indexes[name] = index
+        self.primary_key = table.primary_key.columns[0].name
+
+    def matches(self, query: FilteredQuery, params: dict) -> list:
+        """
+        Posições dos registros que satisfazem os filtros, na ordem da chave primária.
+        Os candidatos vêm do índice do filtro de igualdade mais seletivo, quando houver;
+        os demais filtros são avaliados sobre eles
+        """
+        active = active_filters(self.model, params)
+        candidates = None
+        chosen = None
+        for item in active:
+            if item.kind not in (FILTRO_IGUAL, FILTRO_LISTA) or item.column.name not in self.indexes:
+                continue
+            index = self.indexes[item.column.name]
+            values = query.params[item.name] if item.kind == FILTRO_LISTA else [query.params[item.name]]
+            found = sorted({i for value in values for i in index.get(value, ())})
+            if candidates is None or len(found) < len(candidates):
+                candidates, chosen = found, item
+        predicates = [row_predicate(self.positions[item.column.name], item.name, item.kind, query.params)
+                      for item in active if item is not chosen]
+        rows = self.rows
+        if candidates is None:
+            candidates = range(len(rows))
+        return [i for i in candidates if all(predicate(rows[i]) for predicate in predicates)]
+
+    def item(self, i: int, fields: tuple) -> dict:
+        row = self.rows[i]
+        if fields:
+            return {name: row[self.positions[name]] for name in fields}
+        return dict(zip(self.columns, row))
+
+    def page(self, query: FilteredQuery, params: dict, current_page: int, records_per_page: int, cursor: Optional[str], count_mode: str) -> PaginatedResponseTemplate:
+        """
+        Página da consulta com a mesma semântica de get_paginated_data: ordenação pela coluna de
+        ordenar_por e pela chave primária, paginação por deslocamento ou por cursor e modo de contagem
+        """
+        matched = self.matches(query, params)
+        sort_columns = [column.name for column in order_columns(query, self.model.__table__.primary_key.columns)]
+        descending = bool(query.order) and query.order[1]
+        # positions follow the primary key order, ranks the order of the other sort columns
+        rank = self.ranks.get(sort_columns[0])
+        if rank is not None:
+            matched.sort(key=rank.__getitem__)
+        if descending:
+            matched.reverse()
+
+        if cursor is not None:
+            table = self.model.__table__
+            last_seen = decode_cursor(cursor, self.model, [table.c[name] for name in sort_columns], order_spec(query))
+            found = self.indexes[self.primary_key].get(last_seen[-1])
+            if not found or [self.rows[found[0]][self.positions[name]] for name in sort_columns] != last_seen:
+                # the row of the cursor was deleted or changed: seek by value in the database
+                raise MemoryMiss(cursor)
+            key = rank.__getitem__ if rank is not None else (lambda i: i)
+            seen = key(found[0])
+            page = [i for i in matched if (key(i) < seen if descending else key(i) > seen)][:records_per_page + 1]
+        else:
+            offset = (current_page - 1) * records_per_page
+            page = matched[offset:offset + records_per_page + 1]
+
+        items = [self.item(i, query.fields) for i in page]
+        next_cursor = None
+        if len(items) > records_per_page:
+            items = items[:records_per_page]
+            last = self.rows[page[records_per_page - 1]]
+            last_seen = [last[self.positions[name]] for name in sort_columns]
+            next_cursor = encode_cursor([order_spec(query)] + last_seen if query.order else last_seen)
+
+        total_records = len(matched) if count_mode != "nenhuma" else None
+        return PaginatedResponseTemplate(
+            data=items,
+            total_pages=ceil(total_records / records_per_page) if total_records is not None else None,
+            total_items=total_records,
+            # the count over the copy is always exact, also for contagem=estimada
+            total_items_exact=total_records is not None,
+            page_number=current_page,
+            page_size=len(items),
+            next_cursor=next_cursor
+        )
+
+
+class MemoryTables:
+    """
+    Cópias em memória das tabelas pequenas e pouco alteradas (MEMORY_TABLES), carregadas do primário
+    na inicialização e recarregadas quando a verificação de versão (MEMORY_TABLES_CHECK_INTERVAL)
+    detecta alteração. A cópia nova substitui a anterior de uma só vez, após a carga completa
+    """
+    def __init__(self):
+        self.engine = None
+        self.tables = {}
+        self.reload_task = None
+
+    def models(self) -> dict:
+        return {mapper.class_.__tablename__: mapper.class_ for mapper in SQLModel._sa_registry.mappers
+                if mapper.class_.__tablename__ in config.MEMORY_TABLES}
+
+    async def versions(self, conn, models: dict) -> dict:
+        """
+        Versão dos dados de cada tabela: no PostgreSQL, os contadores de linhas inseridas, alteradas
+        e excluídas de pg_stat_user_tables (a consulta não lê a tabela; as estatísticas são publicadas
+        pelo servidor com atraso de alguns segundos); nos demais bancos, a quantidade de registros
+        """
+        if conn.dialect.name != "postgresql":
+            return {name: await conn.scalar(select(func.count()).select_from(model.__table__))
+                    for name, model in models.items()}
+        schemas = {model.__table__.schema for model in models.values()}
+        statement = text("SELECT relname, n_tup_ins, n_tup_upd, n_tup_del FROM pg_stat_user_tables "
+                         "WHERE schemaname IN :esquemas AND relname IN :tabelas").bindparams(
+                             bindparam("esquemas", expanding=True), bindparam("tabelas", expanding=True))
+        result = await conn.execute(statement, {"esquemas": list(schemas), "tabelas": list(models)})
+        return {row.relname: (row.n_tup_ins, row.n_tup_upd, row.n_tup_del) for row in result}
+
+    async def load_table(self, conn, model, version) -> Optional[MemoryTable]:
+        """
+        Carrega os registros e a ordenação do banco de dados de cada coluna aceita em ordenar_por.
+        Tabelas acima de MEMORY_TABLES_MAX_ROWS não são carregadas e continuam atendidas pelo banco
+        """
+        table = model.__table__
+        total = await conn.scalar(select(func.count()).select_from(table))
+        if total > config.MEMORY_TABLES_MAX_ROWS:
+            logger.warning(f"Tabela {table.name} com {total} registros não carregada em memória (limite {config.MEMORY_TABLES_MAX_ROWS})")
+            return None
+        primary_key = list(table.primary_key.columns)
+        rows = [tuple(row) for row in await conn.execute(select(*table.columns).order_by(*primary_key))]
+        key_position = table.columns.keys().index(primary_key[0].name)
+        position = {row[key_position]: i for i, row in enumerate(rows)}
+        ranks = {}
+        for column in sortable_columns(model).values():
+            if column.primary_key:
+                continue
+            rank = array("I", bytes(4 * len(rows)))
+            ordered = await conn.scalars(select(primary_key[0]).order_by(column, *primary_key))
+            for i, key in enumerate(ordered):
+                rank[position[key]] = i
+            ranks[column.name] = rank
+        return MemoryTable(model, rows, ranks, version)
+
+    async def reload(self) -> None:
+        """
+        Recarrega as tabelas cuja versão mudou (todas, na primeira execução). A versão é lida antes
+        dos registros: uma alteração concorrente à carga é detectada na verificação seguinte
+        """
+        models = self.models()
+        async with self.engine.connect() as conn:
+            versions = await self.versions(conn, models)
+        changed = {name: model for name, model in models.items()
+                   if name not in self.tables or self.tables[name].version != versions.get(name)}
+        if not changed:
+            return
+        # one snapshot for the rows and the orderings of all the tables
+        async with self.engine.connect() as conn:
+            if conn.dialect.name == "postgresql":
+                await conn.execution_options(isolation_level="REPEATABLE READ")
+            for name, model in changed.items():
+                table = await self.load_table(conn, model, versions.get(name))
+                if table is None:
+                    self.tables.pop(name, None)
+                    continue
+                self.tables[name] = table
+                logger.info(f"Tabela {name} carregada em memória: {len(table.rows)} registros")
+
+    async def monitor(self) -> None:
+        """
+        Tarefa de segundo plano: verificação periódica da versão dos dados das tabelas em memória
+        """
+        while True:
+            await asyncio.sleep(config.MEMORY_TABLES_CHECK_INTERVAL)
+            try:
+                await self.reload()
+            except Exception as e:
+                # keeps the current copies; retried on the next check
+                logger.warning(f"Falha ao recarregar as tabelas em memória: {e!r}")
+
+    async def start(self, engine) -> None:
+        """
+        Carga inicial a partir do primário (onde as cargas de dados são gravadas) e início da verificação periódica.
+        Uma falha na carga não impede a inicialização: as rotas continuam atendidas pelo banco de dados
+        """
+        if not config.MEMORY_TABLES:
+            return
+        self.engine = engine
+        try:
+            await self.reload()
+        except Exception as e:
+            logger.warning(f"Falha ao carregar as tabelas em memória: {e!r}")
+        if self.reload_task is None:
+            self.reload_task = asyncio.create_task(self.monitor())
+
+    async def close(self) -> None:
+        if self.reload_task is not None:
+            self.reload_task.cancel()
+            self.reload_task = None
+        self.tables = {}
+
+    def stats(self) -> dict:
+        return {name: len(table.rows) for name, table in self.tables.items()}
+
+
+memory_tables = MemoryTables()
+
+
+def in_memory(model):
+    """
+    Decorador das rotas de lista paginada das tabelas em memória: responde a consulta pela cópia
+    em memória, sem cache externo e sem conexão com o banco de dados (exceto para as relações de expandir).
+    Sem cópia carregada, ou quando ela não responde com a mesma semântica, executa a rota normalmente
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            table = memory_tables.tables.get(model.__tablename__)
+            if table is None:
+                return await func(*args, **kwargs)
+            query = compile_query(model, kwargs)
+            if query is None:
+                return await func(*args, **kwargs)
+            try:
+                result = table.page(query, kwargs, kwargs["pagina"], kwargs["tamanho_da_pagina"], kwargs["cursor"], kwargs["contagem"])
+            except MemoryMiss:
+                return await func(*args, **kwargs)
+            if query.expand:
+                result.data = await expand_items(model, result.data, query.expand, kwargs["dbsession"])
+            return result
+        return wrapper
+    return decorator
@@ -5,6 +5,11 @@ from typing import Optional
 
 db_schema = 'api_transferegov_faf'
 
+# Metadados de filtro das colunas (Column.info), lidos pelo compilador de filtros em src/filters.py.
+# Sem metadado, colunas de data são filtradas por data e as demais por igualdade.
+# Chaves estrangeiras com metadado "expansao" definem o nome da relação filha no parâmetro expandir (src/expansions.py)
+FILTRO_TEXTO = {"filtro": "texto"}
+
 class BaseModel(SQLModel, table=False):
     __table_args__ = {"schema": db_schema}
 
@@ -17,31 +22,31 @@ class Empenho(BaseModel, table=True):
     ano_empenho: str
     gestao_emitente_empenho: str
     ug_emitente_empenho: str
-    data_emissao_empenho: date
+    data_emissao_empenho: date = Field(index=True)
     fonte_recurso_empenho: str
     esfera_orcamentaria_empenho: int
-    descricao_esfera_orcamentaria_empenho: str
+    descricao_esfera_orcamentaria_empenho: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     plano_interno_empenho: str
     unidade_gestora_responsavel_empenho: str
-    observacao_empenho: str
-    cnpj_favorecido_empenho: str
+    observacao_empenho: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    cnpj_favorecido_empenho: str = Field(index=True)
     numero_lista_empenho: str
     unidade_gestora_referencia_empenho: str
     gestao_referencia_empenho: str
     numero_interno_empenho: int
-    objeto_empenho: str
+    objeto_empenho: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     numero_sistema_empenho: str
     natureza_despesa_empenho: str
     natureza_despesa_sub_item_empenho: int
     tipo_empenho: int
     descricao_tipo_empenho: str
     codigo_tipo_nota_empenho: str
-    descricao_tipo_nota_empenho: str
+    descricao_tipo_nota_empenho: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     situacao_empenho: int
-    descricao_situacao_empenho: str
-    valor_empenho: float
+    descricao_situacao_empenho: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_empenho: float = Field(index=True)
     versao_empenho: int
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "empenhos"}})
 
 
 # Tabela gestao_financeira_categorias_despesa
@@ -50,11 +55,11 @@ class GestaoFinanceiraCategoriasDespesa(BaseModel, table=True):
     
     id_categoria_despesa_gestao_financeira: int = Field(primary_key=True)
     id_nivel_pai_categoria_despesa_gestao_financeira: int
-    nome_nivel_atual_categoria_despesa_gestao_financeira: str
+    nome_nivel_atual_categoria_despesa_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     nivel_atual_categoria_despesa_gestao_financeira: int
-    nome_completo_niveis_categoria_despesa_gestao_financeira: str
-    codigo_programa_agil: int
-    nome_programa_agil: str
+    nome_completo_niveis_categoria_despesa_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_programa_agil: int = Field(index=True)
+    nome_programa_agil: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
 
 
 # Tabela gestao_financeira_lancamentos
@@ -63,34 +68,34 @@ class GestaoFinanceiraLancamentos(BaseModel, table=True):
     
     id_lancamento_gestao_financeira: int = Field(primary_key=True)
     origem_solicitacao_gestao_financeira: str
-    descricao_origem_solicitacao_gestao_financeira: str
-    cnpj_ente_solicitante_gestao_financeira: str
-    nome_ente_solicitante_gestao_financeira: str
-    nome_personalizado_ente_solicitante_gestao_financeira: str
-    codigo_programa_agil_ente_solicitante_gestao_financeira: str
+    descricao_origem_solicitacao_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    cnpj_ente_solicitante_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    nome_ente_solicitante_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    nome_personalizado_ente_solicitante_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_programa_agil_ente_solicitante_gestao_financeira: str = Field(index=True)
     codigo_banco_gestao_financeira: str
-    codigo_agencia_gestao_financeira: str
+    codigo_agencia_gestao_financeira: str = Field(index=True)
     dv_agencia_gestao_financeira: str
-    codigo_conta_gestao_financeira: str
+    codigo_conta_gestao_financeira: str = Field(index=True)
     dv_conta_gestao_financeira: str
     tipo_operacao_gestao_financeira: str
     descricao_tipo_operacao_gestao_financeira: str
-    descricao_gestao_financeira: str
-    data_lancamento_gestao_financeira: date
-    data_evento_lancamento_gestao_financeira: date
+    descricao_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    data_lancamento_gestao_financeira: date = Field(index=True)
+    data_evento_lancamento_gestao_financeira: date = Field(index=True)
     numero_ordem_gestao_financeira: int
     numero_referencia_unica_gestao_financeira: str
     tipo_favorecido_gestao_financeira: int
-    descricao_tipo_favorecido_gestao_financeira: str
+    descricao_tipo_favorecido_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     doc_favorecido_gestao_financeira_mask: str
-    nome_favorecido_gestao_financeira: str
+    nome_favorecido_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     codigo_banco_favorecido_gestao_financeira: str
-    codigo_agencia_favorecido_gestao_financeira: str
+    codigo_agencia_favorecido_gestao_financeira: str = Field(index=True)
     dv_agencia_favorecido_gestao_financeira: str
-    codigo_conta_favorecido_gestao_financeira: str
+    codigo_conta_favorecido_gestao_financeira: str = Field(index=True)
     dv_conta_favorecido_gestao_financeira: str
-    valor_lancamento_gestao_financeira: float
-    id_categoria_despesa_gestao_financeira: int = Field(foreign_key=f"{db_schema}.gestao_financeira_categorias_despesa.id_categoria_despesa_gestao_financeira")
+    valor_lancamento_gestao_financeira: float = Field(index=True)
+    id_categoria_despesa_gestao_financeira: int = Field(foreign_key=f"{db_schema}.gestao_financeira_categorias_despesa.id_categoria_despesa_gestao_financeira", index=True)
     quantidade_subtransacoes_lancamento_gestao_financeira: int
     id_agencia_conta: str
 
@@ -103,18 +108,18 @@ class GestaoFinanceiraSubtransacoes(BaseModel, table=True):
     estado_subtransacao_gestao_financeira: int
     situacao_pagamento_subtransacao_gestao_financeira: int
     descricao_situacao_pagamento_subtransacao_gestao_financeira: str
-    data_pagamento_subtransacao_gestao_financeira: date
+    data_pagamento_subtransacao_gestao_financeira: date = Field(index=True)
     tipo_pessoa_beneficiario_subtransacao_gestao_financeira: int
     descricao_tipo_pessoa_beneficiario_subtransacao_gestao_financei: str
     numero_documento_beneficiario_subtransacao_gestao_financeira_ma: str
-    nome_beneficiario_subtransacao_gestao_financeira: str
+    nome_beneficiario_subtransacao_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     codigo_banco_beneficiario_subtransacao_gestao_financeira: str
-    codigo_agencia_beneficiario_subtransacao_gestao_financeira: str
-    codigo_conta_beneficiario_subtransacao_gestao_financeira: str
-    descricao_subtransacao_gestao_financeira: str
-    valor_subtransacao_gestao_financeira: float
-    id_categoria_despesa_gestao_financeira: int = Field(foreign_key=f"{db_schema}.gestao_financeira_categorias_despesa.id_categoria_despesa_gestao_financeira")
-    id_lancamento_gestao_financeira: int = Field(foreign_key=f"{db_schema}.gestao_financeira_lancamentos.id_lancamento_gestao_financeira")
+    codigo_agencia_beneficiario_subtransacao_gestao_financeira: str = Field(index=True)
+    codigo_conta_beneficiario_subtransacao_gestao_financeira: str = Field(index=True)
+    descricao_subtransacao_gestao_financeira: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_subtransacao_gestao_financeira: float = Field(index=True)
+    id_categoria_despesa_gestao_financeira: int = Field(foreign_key=f"{db_schema}.gestao_financeira_categorias_despesa.id_categoria_despesa_gestao_financeira", index=True)
+    id_lancamento_gestao_financeira: int = Field(foreign_key=f"{db_schema}.gestao_financeira_lancamentos.id_lancamento_gestao_financeira", index=True)
 
 
 # Tabela plano_acao
@@ -122,52 +127,76 @@ class PlanoAcao(BaseModel, table=True):
     __tablename__ = "plano_acao"
     
     id_plano_acao: int = Field(primary_key=True)
-    codigo_plano_acao: str
-    data_inicio_vigencia_plano_acao: date
-    data_fim_vigencia_plano_acao: date
-    diagnostico_plano_acao: str
-    objetivos_plano_acao: str
-    situacao_plano_acao: str
-    valor_repasse_emenda_plano_acao: float
-    valor_repasse_especifico_plano_acao: float
-    valor_repasse_voluntario_plano_acao: float
-    valor_total_repasse_plano_acao: float
-    valor_recursos_proprios_plano_acao: float
-    valor_outros_plano_acao: float
-    valor_rendimentos_aplicacao_plano_acao: float
-    valor_total_plano_acao: float
-    valor_total_investimento_plano_acao: float
-    valor_total_custeio_plano_acao: float
-    valor_saldo_disponivel_plano_acao: float
+    codigo_plano_acao: str = Field(index=True)
+    data_inicio_vigencia_plano_acao: date = Field(index=True)
+    data_fim_vigencia_plano_acao: date = Field(index=True)
+    diagnostico_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    objetivos_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    situacao_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_repasse_emenda_plano_acao: float = Field(index=True)
+    valor_repasse_especifico_plano_acao: float = Field(index=True)
+    valor_repasse_voluntario_plano_acao: float = Field(index=True)
+    valor_total_repasse_plano_acao: float = Field(index=True)
+    valor_recursos_proprios_plano_acao: float = Field(index=True)
+    valor_outros_plano_acao: float = Field(index=True)
+    valor_rendimentos_aplicacao_plano_acao: float = Field(index=True)
+    valor_total_plano_acao: float = Field(index=True)
+    valor_total_investimento_plano_acao: float = Field(index=True)
+    valor_total_custeio_plano_acao: float = Field(index=True)
+    valor_saldo_disponivel_plano_acao: float = Field(index=True)
     id_orgao_repassador_plano_acao: int
     sigla_orgao_repassador_plano_acao: str
-    cnpj_orgao_repassador_plano_acao: str
-    nome_orgao_repassador_plano_acao: str
+    cnpj_orgao_repassador_plano_acao: str = Field(index=True)
+    nome_orgao_repassador_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     id_ente_repassador_plano_acao: int
-    cnpj_ente_repassador_plano_acao: str
-    nome_ente_repassador_plano_acao: str
+    cnpj_ente_repassador_plano_acao: str = Field(index=True)
+    nome_ente_repassador_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     uf_ente_repassador_plano_acao: str
-    nome_municipio_ente_repassador_plano_acao: str
-    codigo_ibge_municipio_ente_repassador_plano_acao: int
+    nome_municipio_ente_repassador_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_ibge_municipio_ente_repassador_plano_acao: int = Field(index=True)
     id_ente_recebedor_plano_acao: int
-    cnpj_ente_recebedor_plano_acao: str
-    nome_ente_recebedor_plano_acao: str
+    cnpj_ente_recebedor_plano_acao: str = Field(index=True)
+    nome_ente_recebedor_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     uf_ente_recebedor_plano_acao: str
-    nome_municipio_ente_recebedor_plano_acao: str
-    codigo_ibge_municipio_ente_recebedor_plano_acao: int
+    nome_municipio_ente_recebedor_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_ibge_municipio_ente_recebedor_plano_acao: int = Field(index=True)
     id_fundo_repassador_plano_acao: int
-    cnpj_fundo_repassador_plano_acao: str
-    nome_fundo_repassador_plano_acao: str
+    cnpj_fundo_repassador_plano_acao: str = Field(index=True)
+    nome_fundo_repassador_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     uf_fundo_repassador_plano_acao: str
-    municipio_fundo_repassador_plano_acao: str
-    codigo_ibge_fundo_repassador_plano_acao: int
+    municipio_fundo_repassador_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_ibge_fundo_repassador_plano_acao: int = Field(index=True)
     id_fundo_recebedor_plano_acao: int
-    cnpj_fundo_recebedor_plano_acao: str
-    nome_fundo_recebedor_plano_acao: str
+    cnpj_fundo_recebedor_plano_acao: str = Field(index=True)
+    nome_fundo_recebedor_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     uf_fundo_recebedor_plano_acao: str
-    municipio_fundo_recebedor_plano_acao: str
-    codigo_ibge_fundo_recebedor_plano_acao: int
-    id_programa: int = Field(foreign_key=f"{db_schema}.programa.id_programa")
+    municipio_fundo_recebedor_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_ibge_fundo_recebedor_plano_acao: int = Field(index=True)
+    id_programa: int = Field(foreign_key=f"{db_schema}.programa.id_programa", index=True, sa_column_kwargs={"info": {"expansao": "planos_acao"}})
+
+
+# Resumo de execução do plano de ação (visão materializada mantida por src/summaries.py,
+# não criada pelo create_all; atualizada com python -m src.summaries após as cargas de dados)
+MATERIALIZADA = {"materializada": True}
+
+class PlanoAcaoResumo(BaseModel, table=True):
+    __tablename__ = "plano_acao_resumo"
+    __table_args__ = {"schema": db_schema, "info": MATERIALIZADA}
+    
+    id_plano_acao: int = Field(primary_key=True)
+    codigo_plano_acao: str = Field(index=True)
+    situacao_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    uf_ente_recebedor_plano_acao: str
+    codigo_ibge_municipio_ente_recebedor_plano_acao: int = Field(index=True)
+    valor_total_plano_acao: float = Field(index=True)
+    quantidade_empenhos_plano_acao: int
+    valor_total_empenhado_plano_acao: float = Field(index=True)
+    quantidade_lancamentos_plano_acao: int
+    valor_total_lancamentos_plano_acao: float = Field(index=True)
+    quantidade_metas_plano_acao: int
+    quantidade_relatorios_gestao_plano_acao: int
+    data_atualizacao_resumo_plano_acao: datetime
+    id_programa: int = Field(index=True)
 
 
 # Tabela plano_acao_analise
@@ -175,12 +204,12 @@ class PlanoAcaoAnalise(BaseModel, table=True):
     __tablename__ = "plano_acao_analise"
     
     id_analise_plano_acao: int = Field(primary_key=True)
-    tipo_analise_plano_acao: str
-    tipo_analise_resultado_plano_acao: str
-    data_analise_plano_acao: date
-    parecer_analise_plano_acao: str
-    tipo_origem_analise_plano_acao: str
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    tipo_analise_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    tipo_analise_resultado_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    data_analise_plano_acao: date = Field(index=True)
+    parecer_analise_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    tipo_origem_analise_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "analises"}})
     id_historico_plano_acao: int
 
 
@@ -188,9 +217,9 @@ class PlanoAcaoAnalise(BaseModel, table=True):
 class PlanoAcaoAnaliseResponsavel(BaseModel, table=True):
     __tablename__ = "plano_acao_analise_responsavel"
     
-    plano_acao_analise_fk: int = Field(foreign_key=f"{db_schema}.plano_acao_analise.id_analise_plano_acao")
-    nome_responsavel_analise_plano_acao: str = Field(primary_key=True)
-    cargo_responsavel_analise_plano_acao: str = Field(primary_key=True)
+    plano_acao_analise_fk: int = Field(foreign_key=f"{db_schema}.plano_acao_analise.id_analise_plano_acao", index=True, sa_column_kwargs={"info": {"parametro": "id_analise_plano_acao", "expansao": "responsaveis"}})
+    nome_responsavel_analise_plano_acao: str = Field(primary_key=True, sa_column_kwargs={"info": FILTRO_TEXTO})
+    cargo_responsavel_analise_plano_acao: str = Field(primary_key=True, sa_column_kwargs={"info": FILTRO_TEXTO})
 
 
 # Tabela plano_acao_dado_bancario
@@ -200,16 +229,16 @@ class PlanoAcaoDadoBancario(BaseModel, table=True):
     id_plano_acao_dado_bancario: int = Field(primary_key=True)
     id_agencia_conta: str
     codigo_banco_plano_acao_dado_bancario: int
-    nome_banco_plano_acao_dado_bancario: str
+    nome_banco_plano_acao_dado_bancario: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     numero_agencia_plano_acao_dado_bancario: int
     dv_agencia_plano_acao_dado_bancario: str
     numero_conta_plano_acao_dado_bancario: int
     dv_conta_plano_acao_dado_bancario: str
-    situacao_conta_plano_acao_dado_bancario: str
-    data_abertura_conta_plano_acao_dado_bancario: date
-    nome_programa_agil_conta_plano_acao_dado_bancario: str
-    saldo_final_conta_plano_acao_dado_bancario: float
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    situacao_conta_plano_acao_dado_bancario: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    data_abertura_conta_plano_acao_dado_bancario: date = Field(index=True)
+    nome_programa_agil_conta_plano_acao_dado_bancario: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    saldo_final_conta_plano_acao_dado_bancario: float = Field(index=True)
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "dados_bancarios"}})
 
 
 # Tabela plano_acao_destinacao_recursos
@@ -217,11 +246,11 @@ class PlanoAcaoDestinacaoRecursos(BaseModel, table=True):
     __tablename__ = "plano_acao_destinacao_recursos"
     
     id_destinacao_recursos_plano_acao: int = Field(primary_key=True)
-    codigo_natureza_despesa_destinacao_recursos_plano_acao: str
-    descricao_natureza_despesa_destinacao_recursos_plano_acao: str
-    tipo_despesa_destinacao_recursos_plano_acao: str
-    valor_destinacao_recursos_plano_acao: float
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    codigo_natureza_despesa_destinacao_recursos_plano_acao: str = Field(index=True)
+    descricao_natureza_despesa_destinacao_recursos_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    tipo_despesa_destinacao_recursos_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_destinacao_recursos_plano_acao: float = Field(index=True)
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "destinacoes_recursos"}})
 
 
 # Tabela plano_acao_historico
@@ -229,10 +258,10 @@ class PlanoAcaoHistorico(BaseModel, table=True):
     __tablename__ = "plano_acao_historico"
     
     id_historico_plano_acao: int = Field(primary_key=True)
-    situacao_historico_plano_acao: str
-    data_historico_plano_acao: date
+    situacao_historico_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    data_historico_plano_acao: date = Field(index=True)
     versao_historico_plano_acao: int
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "historicos"}})
 
 
 # Tabela plano_acao_meta
@@ -241,12 +270,12 @@ class PlanoAcaoMeta(BaseModel, table=True):
     
     id_meta_plano_acao: int = Field(primary_key=True)
     numero_meta_plano_acao: str
-    nome_meta_plano_acao: str
-    descricao_meta_plano_acao: str
-    valor_meta_plano_acao: float
+    nome_meta_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    descricao_meta_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_meta_plano_acao: float = Field(index=True)
     versao_meta_plano_acao: int
     sequencial_meta_plano_acao: int
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "metas"}})
 
 
 # Tabela plano_acao_meta_acao
@@ -255,12 +284,12 @@ class PlanoAcaoMetaAcao(BaseModel, table=True):
     
     id_acao_meta_plano_acao: int = Field(primary_key=True)
     numero_acao_meta_plano_acao: str
-    nome_acao_meta_plano_acao: str
-    descricao_acao_meta_plano_acao: str
-    valor_acao_meta_plano_acao: float
+    nome_acao_meta_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    descricao_acao_meta_plano_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_acao_meta_plano_acao: float = Field(index=True)
     versao_acao_meta_plano_acao: int
     sequencial_acao_meta_plano_acao: int
-    id_meta_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao_meta.id_meta_plano_acao")
+    id_meta_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao_meta.id_meta_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "acoes"}})
 
 
 # Tabela programa
@@ -270,37 +299,37 @@ class Programa(BaseModel, table=True):
     id_programa: int = Field(primary_key=True)
     ano_programa: int
     modalidade_programa: str
-    codigo_programa: str
-    nome_programa: str
+    codigo_programa: str = Field(index=True)
+    nome_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     id_unidade_gestora_programa: int
-    nome_institucional_programa: str
+    nome_institucional_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     permite_transferencia_sem_fundo_programa: bool
-    objetivo_programa: str
-    descricao_programa: str
-    situacao_programa: str
-    valor_global_programa: float
+    objetivo_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    descricao_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    situacao_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_global_programa: float = Field(index=True)
     quantidade_parcelas_programa: int
     id_orgao_superior_programa: int
     sigla_orgao_superior_programa: str
-    cnpj_orgao_superior_programa: str
-    nome_orgao_superior_programa: str
+    cnpj_orgao_superior_programa: str = Field(index=True)
+    nome_orgao_superior_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     id_fundo_programa: int
-    cnpj_fundo_programa: str
-    nome_fundo_programa: str
+    cnpj_fundo_programa: str = Field(index=True)
+    nome_fundo_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     uf_fundo_programa: str
     municipio_fundo_programa: str
-    codigo_ibge_fundo_programa: int
-    grupo_natureza_despesa_programa: str
-    codigo_descricao_orcamentaria_programa: str
-    descricao_acao_orcamentaria_programa: str
-    valor_acao_orcamentaria_programa: float
-    data_inicio_recebimento_planos_acao_beneficiarios_especificos: date
-    data_fim_recebimento_planos_acao_beneficiarios_especificos: date
-    data_inicio_recebimento_planos_acao_beneficiarios_emendas: date
-    data_fim_recebimento_planos_acao_beneficiarios_emendas: date
-    data_inicio_recebimento_planos_acao_beneficiarios_voluntarios: date
-    data_fim_recebimento_planos_acao_beneficiarios_voluntarios: date
-    nome_gestao_agil_programa: str
+    codigo_ibge_fundo_programa: int = Field(index=True)
+    grupo_natureza_despesa_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_descricao_orcamentaria_programa: str = Field(index=True)
+    descricao_acao_orcamentaria_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_acao_orcamentaria_programa: float = Field(index=True)
+    data_inicio_recebimento_planos_acao_beneficiarios_especificos: date = Field(index=True)
+    data_fim_recebimento_planos_acao_beneficiarios_especificos: date = Field(index=True)
+    data_inicio_recebimento_planos_acao_beneficiarios_emendas: date = Field(index=True)
+    data_fim_recebimento_planos_acao_beneficiarios_emendas: date = Field(index=True)
+    data_inicio_recebimento_planos_acao_beneficiarios_voluntarios: date = Field(index=True)
+    data_fim_recebimento_planos_acao_beneficiarios_voluntarios: date = Field(index=True)
+    nome_gestao_agil_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
 
 
 # Tabela programa_beneficiario
@@ -308,14 +337,14 @@ class ProgramaBeneficiario(BaseModel, table=True):
     __tablename__ = "programa_beneficiario"
     
     id_beneficiario_programa: int = Field(primary_key=True)
-    cnpj_beneficiario_programa: str
-    nome_beneficiario_programa: str
-    valor_beneficiario_programa: float
+    cnpj_beneficiario_programa: str = Field(index=True)
+    nome_beneficiario_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    valor_beneficiario_programa: float = Field(index=True)
     numero_emenda_beneficiario_programa: str
     nome_parlamentar_beneficiario_programa: str
-    tipo_beneficiario_programa: str
+    tipo_beneficiario_programa: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     uf_beneficiario_programa: str
-    id_programa: int = Field(foreign_key=f"{db_schema}.programa.id_programa")
+    id_programa: int = Field(foreign_key=f"{db_schema}.programa.id_programa", index=True, sa_column_kwargs={"info": {"expansao": "beneficiarios"}})
 
 
 # Tabela programa_gestao_agil
@@ -324,13 +353,13 @@ class ProgramaGestaoAgil(BaseModel, table=True):
     
     id_programa_agil: int = Field(primary_key=True)
     id_programa_agil_bb: int
-    nome_programa_agil: str
-    codigo_programa_agil: str
-    codigo_siorg_orgao_programa_agil: int
+    nome_programa_agil: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    codigo_programa_agil: str = Field(index=True)
+    codigo_siorg_orgao_programa_agil: int = Field(index=True)
     sigla_orgao_programa_agil: str
-    cnpj_orgao_programa_agil: str
-    nome_orgao_programa_agil: str
-    id_programa: int = Field(foreign_key=f"{db_schema}.programa.id_programa")
+    cnpj_orgao_programa_agil: str = Field(index=True)
+    nome_orgao_programa_agil: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    id_programa: int = Field(foreign_key=f"{db_schema}.programa.id_programa", index=True, sa_column_kwargs={"info": {"expansao": "programas_gestao_agil"}})
 
 
 # Tabela relatorio_gestao
@@ -338,18 +367,18 @@ class RelatorioGestao(BaseModel, table=True):
     __tablename__ = "relatorio_gestao"
     
     id_relatorio_gestao: int = Field(primary_key=True)
-    data_relatorio_gestao: date
-    data_e_hora_relatorio_gestao: str
+    data_relatorio_gestao: date = Field(index=True)
+    data_e_hora_relatorio_gestao: str = Field(sa_column_kwargs={"info": {"filtro": "hora", "parametro": "hora_relatorio_gestao"}})
     tipo_relatorio_gestao: str
     situacao_relatorio_gestao: str
-    valor_executado_relatorio_gestao: float
-    valor_pendente_relatorio_gestao: float
-    resultados_alcancados_metas_relatorio_gestao: str
-    descritivo_relatorio_gestao: str
-    contrapartida_relatorio_gestao: str
-    endereco_eletronico_publicidade_acoes_relatorio_gestao: str
+    valor_executado_relatorio_gestao: float = Field(index=True)
+    valor_pendente_relatorio_gestao: float = Field(index=True)
+    resultados_alcancados_metas_relatorio_gestao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    descritivo_relatorio_gestao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    contrapartida_relatorio_gestao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    endereco_eletronico_publicidade_acoes_relatorio_gestao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     declaracao_conformidade_relatorio_gestao: bool
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "relatorios_gestao"}})
 
 
 # Tabela relatorio_gestao_acoes
@@ -358,9 +387,9 @@ class RelatorioGestaoAcoes(BaseModel, table=True):
     
     id_acao_relatorio_gestao: int = Field(primary_key=True)
     percentual_execucao_fisica_acao_relatorio_gestao_acao: str
-    observacoes_justificativas_relatorio_gestao_acao: str
-    id_relatorio_gestao: int = Field(foreign_key=f"{db_schema}.relatorio_gestao.id_relatorio_gestao")
-    id_acao_meta_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao_meta.id_meta_plano_acao")
+    observacoes_justificativas_relatorio_gestao_acao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    id_relatorio_gestao: int = Field(foreign_key=f"{db_schema}.relatorio_gestao.id_relatorio_gestao", index=True, sa_column_kwargs={"info": {"expansao": "acoes"}})
+    id_acao_meta_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao_meta.id_meta_plano_acao", index=True)
 
 
 # Tabela relatorio_gestao_analise
@@ -368,22 +397,22 @@ class RelatorioGestaoAnalise(BaseModel, table=True):
     __tablename__ = "relatorio_gestao_analise"
     
     id_relatorio_gestao_analise: int = Field(primary_key=True)
-    tipo_analise_relatorio_gestao_analise: str
-    resultado_analise_relatorio_gestao_analise: str
-    parecer_analise_relatorio_gestao_analise: str
+    tipo_analise_relatorio_gestao_analise: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    resultado_analise_relatorio_gestao_analise: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    parecer_analise_relatorio_gestao_analise: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     origem_analise_relatorio_gestao_analise: str
-    data_analise_relatorio_gestao_analise: date
+    data_analise_relatorio_gestao_analise: date = Field(index=True)
     versao_analise_relatorio_gestao_analise: int
-    id_relatorio_gestao: int = Field(foreign_key=f"{db_schema}.relatorio_gestao.id_relatorio_gestao")
+    id_relatorio_gestao: int = Field(foreign_key=f"{db_schema}.relatorio_gestao.id_relatorio_gestao", index=True, sa_column_kwargs={"info": {"expansao": "analises"}})
 
 
 # Tabela relatorio_gestao_analise_responsavel
 class RelatorioGestaoAnaliseResponsavel(BaseModel, table=True):
     __tablename__ = "relatorio_gestao_analise_responsavel"
     
-    relatorio_gestao_analise_fk: int = Field(foreign_key=f"{db_schema}.relatorio_gestao_analise.id_relatorio_gestao_analise")
-    nome_responsavel_analise_relatorio_gestao_analise: str = Field(primary_key=True)
-    cargo_responsavel_analise_relatorio_gestao_analise: str = Field(primary_key=True)
+    relatorio_gestao_analise_fk: int = Field(foreign_key=f"{db_schema}.relatorio_gestao_analise.id_relatorio_gestao_analise", index=True, sa_column_kwargs={"info": {"parametro": "id_relatorio_gestao_analise", "expansao": "responsaveis"}})
+    nome_responsavel_analise_relatorio_gestao_analise: str = Field(primary_key=True, sa_column_kwargs={"info": FILTRO_TEXTO})
+    cargo_responsavel_analise_relatorio_gestao_analise: str = Field(primary_key=True, sa_column_kwargs={"info": FILTRO_TEXTO})
 
 
 # Tabela termo_adesao
@@ -392,14 +421,14 @@ class TermoAdesao(BaseModel, table=True):
     
     id_termo_adesao: int = Field(primary_key=True)
     numero_processo_termo_adesao: str
-    situacao_termo_adesao: str
+    situacao_termo_adesao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
     objeto_termo_adesao: str
-    data_assinatura_termo_adesao: date
+    data_assinatura_termo_adesao: date = Field(index=True)
     ano_termo_adesao: int
     secao_publicacao_dou_termo_adesao: int
     pagina_publicacao_dou_termo_adesao: int
-    data_publicacao_dou_termo_adesao: date
-    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao")
+    data_publicacao_dou_termo_adesao: date = Field(index=True)
+    id_plano_acao: int = Field(foreign_key=f"{db_schema}.plano_acao.id_plano_acao", index=True, sa_column_kwargs={"info": {"expansao": "termos_adesao"}})
 
 
 # Tabela termo_adesao_historico
@@ -407,6 +436,6 @@ class TermoAdesaoHistorico(BaseModel, table=True):
     __tablename__ = "termo_adesao_historico"
     
     id_historico_termo_adesao: int = Field(primary_key=True)
-    situacao_historico_termo_adesao: str
-    data_historico_termo_adesao: date
-    id_termo_adesao: int = Field(foreign_key=f"{db_schema}.termo_adesao.id_termo_adesao")
\ No newline at end of file
+    situacao_historico_termo_adesao: str = Field(sa_column_kwargs={"info": FILTRO_TEXTO})
+    data_historico_termo_adesao: date = Field(index=True)
+    id_termo_adesao: int = Field(foreign_key=f"{db_schema}.termo_adesao.id_termo_adesao", index=True, sa_column_kwargs={"info": {"expansao": "historicos"}})
\ No newline at end of file
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, HTTPException, Depends, Request, status, Query
+from fastapi.dependencies.utils import request_params_to_args
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.aggregations import AGREGACOES, aggregate
+from src.routers.consultas import list_routes
+from src.utils import get_dedicated_session, config
+from src.schemas import AgregacaoResponse
+from typing import Optional, Literal
+
+
+ag_router = APIRouter(tags=["Agregações"])
+
+
+def describe(recurso: str) -> str:
+    aggregation = AGREGACOES[recurso]
+    return (f"{recurso} - agrupar_por: {', '.join(aggregation.dimensions)}; "
+            f"valores: {', '.join(aggregation.metrics)}")
+
+
+@ag_router.get("/agregacao/{recurso}",
+                status_code=status.HTTP_200_OK,
+                description="Retorna a contagem de registros e a soma, o mínimo e o máximo dos valores financeiros de um recurso, "
+                            "agrupados pelas dimensões informadas em agrupar_por. Colunas de data aceitam agrupamento por mês "
+                            "(mes:coluna) ou ano (ano:coluna). Aceita os mesmos filtros da lista paginada do recurso. "
+                            "Dimensões e valores permitidos: " + " | ".join(describe(recurso) for recurso in AGREGACOES) + ".",
+                response_description="Grupos com Contagem e Valores Agregados",
+                response_model=AgregacaoResponse,
+                response_model_exclude_unset=True
+                )
+async def agregacao_faf(
+    request: Request,
+    recurso: Literal[tuple(AGREGACOES)],
+    agrupar_por: Optional[str] = Query(None, description="Dimensões de agrupamento, separadas por vírgula (ex.: uf_ente_recebedor_plano_acao,mes:data_inicio_vigencia_plano_acao). Sem dimensões, retorna um único grupo com os totais"),
+    valores: Optional[str] = Query(None, description="Colunas numéricas agregadas, separadas por vírgula (padrão: todas as permitidas para o recurso)"),
+    dbsession: AsyncSession = Depends(get_dedicated_session)
+):
+    # Filters are parsed and validated exactly as in the list route of the resource
+    route = list_routes(request)[recurso]
+    params, errors = request_params_to_args(route.dependant.query_params, request.query_params)
+    if errors:
+        raise RequestValidationError(errors)
+
+    try:
+        result = await aggregate(recurso, params, agrupar_por, valores, dbsession)
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail=config.ERROR_MESSAGE_INTERNAL)
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, HTTPException, Request, status
+import orjson
+import os
+from src.snapshots import MANIFESTO
+from src.utils import config
+
+
+arq_router = APIRouter(tags=["Arquivos Parquet"])
+
+
+@arq_router.get("/arquivos",
+                status_code=status.HTTP_200_OK,
+                description="Retorna o manifesto da cópia diária das tabelas - FaF em arquivos Parquet: data de geração e, para cada tabela, a quantidade de registros "
+                            "e os arquivos (URL, partição mensal, registros, tamanho em bytes e checksum sha256). "
+                            "Os arquivos são servidos como estáticos em /arquivos/..., com suporte a ETag (If-None-Match) e a downloads parciais (Range).",
+                response_description="Manifesto dos arquivos Parquet",
+                )
+async def arquivos_faf(request: Request):
+    try:
+        with open(os.path.join(config.SNAPSHOT_DIR, MANIFESTO), "rb") as f:
+            manifest = orjson.loads(f.read())
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=config.ERROR_MESSAGE_NO_SNAPSHOT)
+    for table in manifest["tabelas"].values():
+        for file in table["arquivos"]:
+            file["url"] = str(request.url_for("arquivos", path=file["caminho"]))
+    return manifest
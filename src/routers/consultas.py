@@ -0,0 +1,96 @@
+from contextlib import aclosing
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.dependencies.utils import request_params_to_args
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from fastapi.routing import APIRoute, serialize_response
+from starlette.datastructures import QueryParams
+from src.utils import get_session, config
+from src.schemas import PaginatedResponseTemplate, ConsultasRequest, ConsultaRequest, ConsultasResponse
+import asyncio
+import orjson
+
+
+cs_router = APIRouter(tags=["Consultas em Lote"])
+
+
+def list_routes(request: Request) -> dict:
+    """
+    Rotas de consulta paginada da aplicação, por endpoint (caminho sem a barra inicial)
+    """
+    return {route.path.lstrip("/"): route
+            for route in request.app.routes
+            if isinstance(route, APIRoute) and "GET" in route.methods
+            and isinstance(route.response_model, type) and issubclass(route.response_model, PaginatedResponseTemplate)}
+
+
+def query_params(parametros: dict) -> QueryParams:
+    """
+    Parâmetros da consulta no formato de query string, com listas como valores repetidos
+    """
+    items = []
+    for name, value in parametros.items():
+        for item in (value if isinstance(value, list) else [value]):
+            if item is None:
+                continue
+            items.append((name, str(item).lower() if isinstance(item, bool) else str(item)))
+    return QueryParams(items)
+
+
+async def run_query(route: APIRoute, consulta: ConsultaRequest, semaphore: asyncio.Semaphore) -> dict:
+    """
+    Executa uma consulta do lote pela mesma função da rota GET (validação dos parâmetros,
+    cache e resposta), com sessão própria do pool de conexões
+    """
+    values, errors = request_params_to_args(route.dependant.query_params, query_params(consulta.parametros))
+    if errors:
+        return {"status_code": status.HTTP_422_UNPROCESSABLE_ENTITY, "erro": jsonable_encoder(errors)}
+
+    # aclosing: the session generator is closed here, also when the query returns early with an error
+    async with semaphore, aclosing(get_session()) as sessions:
+        dbsession = await anext(sessions)
+        try:
+            result = await route.endpoint(**values, dbsession=dbsession)
+        except HTTPException as e:
+            return {"status_code": e.status_code, "erro": e.detail}
+
+    if isinstance(result, Response):
+        # page already serialized by the route (fast_response)
+        content = orjson.loads(result.body)
+    else:
+        content = await serialize_response(field=route.response_field,
+                                           response_content=result,
+                                           exclude_unset=route.response_model_exclude_unset)
+    return {"status_code": status.HTTP_200_OK, "resultado": content}
+
+
+@cs_router.post("/consultas",
+                status_code=status.HTTP_200_OK,
+                description="Executa um lote de consultas aos endpoints de listas paginadas e retorna todos os resultados em uma única resposta. "
+                            "As consultas são executadas concorrentemente, cada uma com sua conexão ao banco de dados.",
+                response_description="Resultados das Consultas, na ordem do lote",
+                response_model=ConsultasResponse
+                )
+async def consulta_lote(request: Request, lote: ConsultasRequest):
+    if len(lote.consultas) > config.MAX_BATCH_QUERIES:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_TOO_MANY_QUERIES.format(config.MAX_BATCH_QUERIES))
+
+    routes = list_routes(request)
+    # Limits the connections taken from the pool by a single batch
+    semaphore = asyncio.Semaphore(config.MAX_BATCH_CONCURRENCY)
+
+    async def run(consulta: ConsultaRequest) -> dict:
+        endpoint = consulta.endpoint.strip("/")
+        route = routes.get(endpoint)
+        if route is None:
+            result = {"status_code": status.HTTP_404_NOT_FOUND, "erro": config.ERROR_MESSAGE_UNKNOWN_ENDPOINT.format(endpoint)}
+        else:
+            try:
+                result = await run_query(route, consulta, semaphore)
+            except Exception:
+                result = {"status_code": status.HTTP_500_INTERNAL_SERVER_ERROR, "erro": config.ERROR_MESSAGE_INTERNAL}
+        return {"endpoint": endpoint, **result}
+
+    resultados = await asyncio.gather(*[run(consulta) for consulta in lote.consultas])
+    return {"resultados": resultados}
@@ -0,0 +1,51 @@
+from contextlib import aclosing
+from fastapi import APIRouter, Request, status, Query
+from fastapi.dependencies.utils import request_params_to_args
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from src.exports import FORMATOS, exportable_models, compile_export, export_rows
+from src.routers.consultas import list_routes
+from src.utils import get_dedicated_session
+from typing import Optional, Literal
+
+
+ex_router = APIRouter(tags=["Exportação"])
+
+
+async def export_stream(query, formato: str):
+    # The session is opened inside the generator: it must live while the response is streamed,
+    # after the route function (and its dependencies) have returned. aclosing: the session is closed
+    # when the stream ends, also when the client disconnects mid-stream
+    # (the row generator first, releasing the server-side cursor)
+    async with aclosing(get_dedicated_session()) as sessions:
+        dbsession = await anext(sessions)
+        async with aclosing(export_rows(query, formato, dbsession)) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+
+@ex_router.get("/exportar/{recurso}",
+                status_code=status.HTTP_200_OK,
+                description="Exporta todos os registros de um recurso em NDJSON (um objeto JSON por linha) ou CSV, transmitidos à medida que são lidos do banco de dados, "
+                            "sem paginação e sem contagem. Aceita os mesmos filtros da lista paginada do recurso (sem filtros, exporta a tabela inteira). "
+                            "Os registros são ordenados pela chave primária.",
+                response_description="Arquivo NDJSON ou CSV com os registros do recurso",
+                response_class=StreamingResponse
+                )
+async def exportar_faf(
+    request: Request,
+    recurso: Literal[tuple(exportable_models())],
+    formato: Literal['ndjson', 'csv'] = Query('ndjson', description="Formato do arquivo: ndjson (um objeto JSON por linha) ou csv"),
+    campos: Optional[str] = Query(None, description="Campos Exportados, separados por vírgula (padrão: todos os campos; a chave primária é sempre exportada)"),
+):
+    # Filters are parsed and validated exactly as in the list route of the resource
+    route = list_routes(request)[recurso]
+    params, errors = request_params_to_args(route.dependant.query_params, request.query_params)
+    if errors:
+        raise RequestValidationError(errors)
+
+    query = compile_export(exportable_models()[recurso], params)
+    media_type, extension = FORMATOS[formato]
+    return StreamingResponse(export_stream(query, formato),
+                             media_type=media_type,
+                             headers={"Content-Disposition": f'attachment; filename="{recurso}.{extension}"'})
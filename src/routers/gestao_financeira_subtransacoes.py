@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedGestaoFinanceiraSubtransacoesResponse
-from datetime import date
-from typing import Optional, Literal
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 gfs_router = APIRouter(tags=["Gestão Financeira - Subtransações"])
@@ -16,65 +16,58 @@ gfs_router = APIRouter(tags=["Gestão Financeira - Subtransações"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados de Subtransações - FaF.",
                 response_description="Lista Paginada de Subtransações - FaF",
-                response_model=PaginatedGestaoFinanceiraSubtransacoesResponse
+                response_model=PaginatedGestaoFinanceiraSubtransacoesResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedGestaoFinanceiraSubtransacoesResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_gestao_financeira_subtransacoes_faf(
-    id_subtransacao_gestao_financeira: Optional[str] = Query(None, description="Identificador Único da Subtransação"),
+    id_subtransacao_gestao_financeira: Optional[List[str]] = Query(None, description="Identificador Único da Subtransação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     estado_subtransacao_gestao_financeira: Optional[int] = Query(None, description="Estado da Subtransação"),
     situacao_pagamento_subtransacao_gestao_financeira: Literal['3','6'] = Query(None, description="Situação do Pagamento (3, 6)"),
     descricao_situacao_pagamento_subtransacao_gestao_financeira: Literal['Pago', 'Cancelado'] = Query(None, description="Descrição da Situação do Pagamento (3 - 'Pago', 6 - 'Cancelado')"),
     data_pagamento_subtransacao_gestao_financeira: Optional[str] = Query(None, description="Data do Pagamento da Subtransação", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_pagamento_subtransacao_gestao_financeira_de: Optional[str] = Query(None, description="Data do Pagamento da Subtransação - a partir de (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_pagamento_subtransacao_gestao_financeira_ate: Optional[str] = Query(None, description="Data do Pagamento da Subtransação - até (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
     tipo_pessoa_beneficiario_subtransacao_gestao_financeira: Literal['1','2','0'] = Query(None, description="Tipo do Favorecido (1, 2 ou 0) da Subtransação"),
     descricao_tipo_pessoa_beneficiario_subtransacao_gestao_financei: Literal['CPF', 'CNPJ', 'Não Identificado'] = Query(None, description="Descrição do Tipo do Favorecido (1 - 'CPF', 2 - 'CNP'J ou 0 - 'Não Identificado') da Subtransação"),
     numero_documento_beneficiario_subtransacao_gestao_financeira_ma: Optional[str] = Query(None, description="Identificação do Favorecido da Subtransação"),
     nome_beneficiario_subtransacao_gestao_financeira: Optional[str] = Query(None, description="Nome do Favorecido da Subtransação"),
-    codigo_banco_beneficiario_subtransacao_gestao_financeira: Optional[str] = Query(None, description="Código do Banco do Favorecido da Subtransação"),
-    codigo_agencia_beneficiario_subtransacao_gestao_financeira: Optional[str] = Query(None, description="Número da Agência do Favorecido da Subtransação"),
-    codigo_conta_beneficiario_subtransacao_gestao_financeira: Optional[str] = Query(None, description="Número da Conta do Favorecido da Subtransação"),
+    codigo_banco_beneficiario_subtransacao_gestao_financeira: Optional[List[str]] = Query(None, description="Código do Banco do Favorecido da Subtransação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    codigo_agencia_beneficiario_subtransacao_gestao_financeira: Optional[List[str]] = Query(None, description="Número da Agência do Favorecido da Subtransação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    codigo_conta_beneficiario_subtransacao_gestao_financeira: Optional[List[str]] = Query(None, description="Número da Conta do Favorecido da Subtransação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     descricao_subtransacao_gestao_financeira: Optional[str] = Query(None, description="Descrição da Subtransação"),
     valor_subtransacao_gestao_financeira: Optional[float] = Query(None, description="Valor do Pagamento", ge=0),
-    id_categoria_despesa_gestao_financeira: Optional[int] = Query(None, description="Identificador da Categoria de Despesa do Banco do Brasil"),
-    id_lancamento_gestao_financeira: Optional[int] = Query(None, description="Identificador Único do Lançamento"),
+    valor_subtransacao_gestao_financeira_min: Optional[float] = Query(None, description="Valor do Pagamento - mínimo (inclusive)", ge=0),
+    valor_subtransacao_gestao_financeira_max: Optional[float] = Query(None, description="Valor do Pagamento - máximo (inclusive)", ge=0),
+    id_categoria_despesa_gestao_financeira: Optional[List[str]] = Query(None, description="Identificador da Categoria de Despesa do Banco do Brasil (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    id_lancamento_gestao_financeira: Optional[List[str]] = Query(None, description="Identificador Único do Lançamento (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.GestaoFinanceiraSubtransacoes, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.GestaoFinanceiraSubtransacoes).where(
-            and_(
-                models.GestaoFinanceiraSubtransacoes.id_subtransacao_gestao_financeira == id_subtransacao_gestao_financeira if id_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.estado_subtransacao_gestao_financeira == estado_subtransacao_gestao_financeira if estado_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.situacao_pagamento_subtransacao_gestao_financeira == int(situacao_pagamento_subtransacao_gestao_financeira) if situacao_pagamento_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.descricao_situacao_pagamento_subtransacao_gestao_financeira == descricao_situacao_pagamento_subtransacao_gestao_financeira if descricao_situacao_pagamento_subtransacao_gestao_financeira is not None else True,
-                cast(models.GestaoFinanceiraSubtransacoes.data_pagamento_subtransacao_gestao_financeira, Date) == date.fromisoformat(data_pagamento_subtransacao_gestao_financeira) if data_pagamento_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.tipo_pessoa_beneficiario_subtransacao_gestao_financeira == int(tipo_pessoa_beneficiario_subtransacao_gestao_financeira) if tipo_pessoa_beneficiario_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.descricao_tipo_pessoa_beneficiario_subtransacao_gestao_financei == descricao_tipo_pessoa_beneficiario_subtransacao_gestao_financei if descricao_tipo_pessoa_beneficiario_subtransacao_gestao_financei is not None else True,
-                models.GestaoFinanceiraSubtransacoes.numero_documento_beneficiario_subtransacao_gestao_financeira_ma == numero_documento_beneficiario_subtransacao_gestao_financeira_ma if numero_documento_beneficiario_subtransacao_gestao_financeira_ma is not None else True,
-                models.GestaoFinanceiraSubtransacoes.nome_beneficiario_subtransacao_gestao_financeira.ilike(f"%{nome_beneficiario_subtransacao_gestao_financeira}%") if nome_beneficiario_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.codigo_banco_beneficiario_subtransacao_gestao_financeira == codigo_banco_beneficiario_subtransacao_gestao_financeira if codigo_banco_beneficiario_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.codigo_agencia_beneficiario_subtransacao_gestao_financeira == codigo_agencia_beneficiario_subtransacao_gestao_financeira if codigo_agencia_beneficiario_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.codigo_conta_beneficiario_subtransacao_gestao_financeira == codigo_conta_beneficiario_subtransacao_gestao_financeira if codigo_conta_beneficiario_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.descricao_subtransacao_gestao_financeira.ilike(f"%{descricao_subtransacao_gestao_financeira}%") if descricao_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.valor_subtransacao_gestao_financeira == valor_subtransacao_gestao_financeira if valor_subtransacao_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.id_categoria_despesa_gestao_financeira == id_categoria_despesa_gestao_financeira if id_categoria_despesa_gestao_financeira is not None else True,
-                models.GestaoFinanceiraSubtransacoes.id_lancamento_gestao_financeira == id_lancamento_gestao_financeira if id_lancamento_gestao_financeira is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
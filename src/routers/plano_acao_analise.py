@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedPlanoAcaoAnaliseResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 paa_router = APIRouter(tags=["Plano de Ação - Análise"])
@@ -16,49 +16,48 @@ paa_router = APIRouter(tags=["Plano de Ação - Análise"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados de Análises dos Planos de Ação - FaF.",
                 response_description="Lista Paginada de Análises dos Planos de Ação - FaF",
-                response_model=PaginatedPlanoAcaoAnaliseResponse
+                response_model=PaginatedPlanoAcaoAnaliseResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedPlanoAcaoAnaliseResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_plano_acao_analise_faf(
-    id_analise_plano_acao: Optional[int] = Query(None, description="Identificador Único da Análise do Plano de Ação"),
+    id_analise_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único da Análise do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     tipo_analise_plano_acao: Optional[str] = Query(None, description="Tipo de Análise do Plano de Ação (MERITO, TECNICA, FINANCEIRA, TECNICA_FINANCEIRA)"),
     tipo_analise_resultado_plano_acao: Optional[str] = Query(None, description="Tipo de Resultado da Análise do Plano de Ação (COMPLEMENTACAO, APROVADO, COM_RESSALVA, REJEITADO)"),
     data_analise_plano_acao: Optional[str] = Query(None, description="Data da Análise do Plano de Ação", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_analise_plano_acao_de: Optional[str] = Query(None, description="Data da Análise do Plano de Ação - a partir de (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_analise_plano_acao_ate: Optional[str] = Query(None, description="Data da Análise do Plano de Ação - até (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
     parecer_analise_plano_acao: Optional[str] = Query(None, description="Parecer da Análise do Plano de Ação"),
     tipo_origem_analise_plano_acao: Optional[str] = Query(None, description="Tipo de Origem da Análise realizada no Plano de Ação"),
-    id_plano_acao: Optional[int] = Query(None, description="Identificador Único do Plano de Ação"),
-    id_historico_plano_acao: Optional[int] = Query(None, description="Identificador Único do Histórico do Plano de Ação"),
+    id_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    id_historico_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Histórico do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.PlanoAcaoAnalise, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.PlanoAcaoAnalise).where(
-            and_(
-                models.PlanoAcaoAnalise.id_analise_plano_acao == id_analise_plano_acao if id_analise_plano_acao is not None else True,
-                models.PlanoAcaoAnalise.tipo_analise_plano_acao.ilike(f"%{tipo_analise_plano_acao}%") if tipo_analise_plano_acao is not None else True,
-                models.PlanoAcaoAnalise.tipo_analise_resultado_plano_acao.ilike(f"%{tipo_analise_resultado_plano_acao}%") if tipo_analise_resultado_plano_acao is not None else True,
-                cast(models.PlanoAcaoAnalise.data_analise_plano_acao, Date) == date.fromisoformat(data_analise_plano_acao) if data_analise_plano_acao is not None else True,
-                models.PlanoAcaoAnalise.parecer_analise_plano_acao.ilike(f"%{parecer_analise_plano_acao}%") if parecer_analise_plano_acao is not None else True,
-                models.PlanoAcaoAnalise.tipo_origem_analise_plano_acao.ilike(f"%{tipo_origem_analise_plano_acao}%") if tipo_origem_analise_plano_acao is not None else True,
-                models.PlanoAcaoAnalise.id_plano_acao == id_plano_acao if id_plano_acao is not None else True,
-                models.PlanoAcaoAnalise.id_historico_plano_acao == id_historico_plano_acao if id_historico_plano_acao is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedPlanoAcaoDadoBancarioResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 padb_router = APIRouter(tags=["Plano de Ação - Dado Bancário"])
@@ -16,13 +16,15 @@ padb_router = APIRouter(tags=["Plano de Ação - Dado Bancário"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos Dados Bancários dos Planos de Ação - FaF.",
                 response_description="Lista Paginada de Dados Bancários dos Planos de Ação - FaF",
-                response_model=PaginatedPlanoAcaoDadoBancarioResponse
+                response_model=PaginatedPlanoAcaoDadoBancarioResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedPlanoAcaoDadoBancarioResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_plano_acao_dado_bancario_faf(
-    id_plano_acao_dado_bancario: Optional[int] = Query(None, description="Identificador Único do Dado Bancário do Plano de Ação"),
-    id_agencia_conta: Optional[str] = Query(None, description="Número da Agência seguido do caracter '-' seguido do Número da Conta do Dado Bancário do Plano de Ação"),
-    codigo_banco_plano_acao_dado_bancario: Optional[int] = Query(None, description="Código do Banco do Dado Bancário do Plano de Ação"),
+    id_plano_acao_dado_bancario: Optional[List[str]] = Query(None, description="Identificador Único do Dado Bancário do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    id_agencia_conta: Optional[List[str]] = Query(None, description="Número da Agência seguido do caracter '-' seguido do Número da Conta do Dado Bancário do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    codigo_banco_plano_acao_dado_bancario: Optional[List[str]] = Query(None, description="Código do Banco do Dado Bancário do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     nome_banco_plano_acao_dado_bancario: Optional[str] = Query(None, description="Nome do Banco do Dado Bancário do Plano de Ação"),
     numero_agencia_plano_acao_dado_bancario: Optional[int] = Query(None, description="Número da Agência do Dado Bancário do Plano de Ação"),
     dv_agencia_plano_acao_dado_bancario: Optional[str] = Query(None, description="Dígito Verificador (DV) da Agência do Dado Bancário do Plano de Ação"),
@@ -30,45 +32,39 @@ async def consulta_plano_acao_dado_bancario_faf(
     dv_conta_plano_acao_dado_bancario: Optional[str] = Query(None, description="Dígito Verificador (DV) da Conta Corrente do Dado Bancário do Plano de Ação"),
     situacao_conta_plano_acao_dado_bancario: Optional[str] = Query(None, description="Descrição da Situação Dado Bancário do Plano de Ação"),
     data_abertura_conta_plano_acao_dado_bancario: Optional[str] = Query(None, description="Data de Abertura da Conta Corrente do Dado Bancário do Plano de Ação", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_abertura_conta_plano_acao_dado_bancario_de: Optional[str] = Query(None, description="Data de Abertura da Conta Corrente do Dado Bancário do Plano de Ação - a partir de (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_abertura_conta_plano_acao_dado_bancario_ate: Optional[str] = Query(None, description="Data de Abertura da Conta Corrente do Dado Bancário do Plano de Ação - até (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
     nome_programa_agil_conta_plano_acao_dado_bancario: Optional[str] = Query(None, description="Nome do Programa Gestão Ágil do Dado Bancário do Plano de Ação"),
     saldo_final_conta_plano_acao_dado_bancario: Optional[float] = Query(None, description="Saldo Final na Conta Corrente do Dado Bancário do Plano de Ação"),
-    id_plano_acao: Optional[int] = Query(None, description="Identificador Único do Plano de Ação"),
+    saldo_final_conta_plano_acao_dado_bancario_min: Optional[float] = Query(None, description="Saldo Final na Conta Corrente do Dado Bancário do Plano de Ação - mínimo (inclusive)"),
+    saldo_final_conta_plano_acao_dado_bancario_max: Optional[float] = Query(None, description="Saldo Final na Conta Corrente do Dado Bancário do Plano de Ação - máximo (inclusive)"),
+    id_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.PlanoAcaoDadoBancario, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.PlanoAcaoDadoBancario).where(
-            and_(
-                models.PlanoAcaoDadoBancario.id_plano_acao_dado_bancario == id_plano_acao_dado_bancario if id_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.id_agencia_conta == id_agencia_conta if id_agencia_conta is not None else True,
-                models.PlanoAcaoDadoBancario.codigo_banco_plano_acao_dado_bancario == codigo_banco_plano_acao_dado_bancario if codigo_banco_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.nome_banco_plano_acao_dado_bancario.ilike(f"%{nome_banco_plano_acao_dado_bancario}%") if nome_banco_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.numero_agencia_plano_acao_dado_bancario == numero_agencia_plano_acao_dado_bancario if numero_agencia_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.dv_agencia_plano_acao_dado_bancario == dv_agencia_plano_acao_dado_bancario if dv_agencia_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.numero_conta_plano_acao_dado_bancario == numero_conta_plano_acao_dado_bancario if numero_conta_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.dv_conta_plano_acao_dado_bancario == dv_conta_plano_acao_dado_bancario if dv_conta_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.situacao_conta_plano_acao_dado_bancario.ilike(f"%{situacao_conta_plano_acao_dado_bancario}%") if situacao_conta_plano_acao_dado_bancario is not None else True,
-                cast(models.PlanoAcaoDadoBancario.data_abertura_conta_plano_acao_dado_bancario, Date) == date.fromisoformat(data_abertura_conta_plano_acao_dado_bancario) if data_abertura_conta_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.nome_programa_agil_conta_plano_acao_dado_bancario.ilike(f"%{nome_programa_agil_conta_plano_acao_dado_bancario}%") if nome_programa_agil_conta_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.saldo_final_conta_plano_acao_dado_bancario == saldo_final_conta_plano_acao_dado_bancario if saldo_final_conta_plano_acao_dado_bancario is not None else True,
-                models.PlanoAcaoDadoBancario.id_plano_acao == id_plano_acao if id_plano_acao is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
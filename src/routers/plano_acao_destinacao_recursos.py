@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedPlanoAcaoDestinacaoRecursosResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 padr_router = APIRouter(tags=["Plano de Ação - Destinação de Recursos"])
@@ -16,45 +16,46 @@ padr_router = APIRouter(tags=["Plano de Ação - Destinação de Recursos"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados de Itens de Despesa dos Planos de Ação - FaF.",
                 response_description="Lista Paginada de Itens de Despesa dos Planos de Ação - FaF",
-                response_model=PaginatedPlanoAcaoDestinacaoRecursosResponse
+                response_model=PaginatedPlanoAcaoDestinacaoRecursosResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedPlanoAcaoDestinacaoRecursosResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_plano_acao_destinacao_recursos_faf(
-    id_destinacao_recursos_plano_acao: Optional[int] = Query(None, description="Identificador Único do Item de Despesa Cadastrado no Plano de Ação"),
-    codigo_natureza_despesa_destinacao_recursos_plano_acao: Optional[str] = Query(None, description="Código da Natureza de Despesa no SIAFI do Item de Despesa Cadastrado no Plano de Ação"),
+    id_destinacao_recursos_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Item de Despesa Cadastrado no Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    codigo_natureza_despesa_destinacao_recursos_plano_acao: Optional[List[str]] = Query(None, description="Código da Natureza de Despesa no SIAFI do Item de Despesa Cadastrado no Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     descricao_natureza_despesa_destinacao_recursos_plano_acao: Optional[str] = Query(None, description="Descrição da Natureza de Despesa no SIAFI do Item de Despesa Cadastrado no Plano de Ação"),
     tipo_despesa_destinacao_recursos_plano_acao: Optional[str] = Query(None, description="Tipo da Natureza de Despesa do Item de Despesa Cadastrado no Plano de Ação"),
     valor_destinacao_recursos_plano_acao: Optional[float] = Query(None, description="Valor do Recurso destinado ao Item de Despesa Cadastrado no Plano de Ação", ge=0),
-    id_plano_acao: Optional[int] = Query(None, description="Identificador Único do Plano de Ação"),
+    valor_destinacao_recursos_plano_acao_min: Optional[float] = Query(None, description="Valor do Recurso destinado ao Item de Despesa Cadastrado no Plano de Ação - mínimo (inclusive)", ge=0),
+    valor_destinacao_recursos_plano_acao_max: Optional[float] = Query(None, description="Valor do Recurso destinado ao Item de Despesa Cadastrado no Plano de Ação - máximo (inclusive)", ge=0),
+    id_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.PlanoAcaoDestinacaoRecursos, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.PlanoAcaoDestinacaoRecursos).where(
-            and_(
-                models.PlanoAcaoDestinacaoRecursos.id_destinacao_recursos_plano_acao == id_destinacao_recursos_plano_acao if id_destinacao_recursos_plano_acao is not None else True,
-                models.PlanoAcaoDestinacaoRecursos.codigo_natureza_despesa_destinacao_recursos_plano_acao == codigo_natureza_despesa_destinacao_recursos_plano_acao if codigo_natureza_despesa_destinacao_recursos_plano_acao is not None else True,
-                models.PlanoAcaoDestinacaoRecursos.descricao_natureza_despesa_destinacao_recursos_plano_acao.ilike(f"%{descricao_natureza_despesa_destinacao_recursos_plano_acao}%") if descricao_natureza_despesa_destinacao_recursos_plano_acao is not None else True,
-                models.PlanoAcaoDestinacaoRecursos.tipo_despesa_destinacao_recursos_plano_acao.ilike(f"%{tipo_despesa_destinacao_recursos_plano_acao}%") if tipo_despesa_destinacao_recursos_plano_acao is not None else True,
-                models.PlanoAcaoDestinacaoRecursos.valor_destinacao_recursos_plano_acao == valor_destinacao_recursos_plano_acao if valor_destinacao_recursos_plano_acao is not None else True,
-                models.PlanoAcaoDestinacaoRecursos.id_plano_acao == id_plano_acao if id_plano_acao is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
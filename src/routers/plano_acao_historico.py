@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedPlanoAcaoHistoricoResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 pah_router = APIRouter(tags=["Plano de Ação - Histórico"])
@@ -16,43 +16,45 @@ pah_router = APIRouter(tags=["Plano de Ação - Histórico"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados do Histórico do Plano de Ação - FaF.",
                 response_description="Lista Paginada de Históricos do Plano de Ação - FaF",
-                response_model=PaginatedPlanoAcaoHistoricoResponse
+                response_model=PaginatedPlanoAcaoHistoricoResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedPlanoAcaoHistoricoResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_plano_acao_historico_faf(
-    id_historico_plano_acao: Optional[int] = Query(None, description="Identificador Único do Histórico do Plano de Ação"),
+    id_historico_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Histórico do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     situacao_historico_plano_acao: Optional[str] = Query(None, description="Situação do Histórico do Plano de Ação"),
     data_historico_plano_acao: Optional[str] = Query(None, description="Data do Registro no Histórico do Plano de Ação", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_historico_plano_acao_de: Optional[str] = Query(None, description="Data do Registro no Histórico do Plano de Ação - a partir de (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_historico_plano_acao_ate: Optional[str] = Query(None, description="Data do Registro no Histórico do Plano de Ação - até (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
     versao_historico_plano_acao: Optional[int] = Query(None, description="Versão do Histórico do Plano de Ação"),
-    id_plano_acao: Optional[int] = Query(None, description="Identificador Único do Plano de Ação"),
+    id_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.PlanoAcaoHistorico, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.PlanoAcaoHistorico).where(
-            and_(
-                models.PlanoAcaoHistorico.id_historico_plano_acao == id_historico_plano_acao if id_historico_plano_acao is not None else True,
-                models.PlanoAcaoHistorico.situacao_historico_plano_acao.ilike(f"%{situacao_historico_plano_acao}%") if situacao_historico_plano_acao is not None else True,
-                cast(models.PlanoAcaoHistorico.data_historico_plano_acao, Date) == date.fromisoformat(data_historico_plano_acao) if data_historico_plano_acao is not None else True,
-                models.PlanoAcaoHistorico.versao_historico_plano_acao == versao_historico_plano_acao if versao_historico_plano_acao is not None else True,
-                models.PlanoAcaoHistorico.id_plano_acao == id_plano_acao if id_plano_acao is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
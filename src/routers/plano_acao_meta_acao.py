@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedPlanoAcaoMetaAcaoResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 pama_router = APIRouter(tags=["Plano de Ação - Ações da Meta"])
@@ -16,49 +16,48 @@ pama_router = APIRouter(tags=["Plano de Ação - Ações da Meta"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados de Ações das Metas dos Planos de Ação - FaF.",
                 response_description="Lista Paginada de Ações das Metas dos Planos de Ação - FaF",
-                response_model=PaginatedPlanoAcaoMetaAcaoResponse
+                response_model=PaginatedPlanoAcaoMetaAcaoResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedPlanoAcaoMetaAcaoResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_plano_acao_meta_acao_faf(
-    id_acao_meta_plano_acao: Optional[int] = Query(None, description="Identificador Único da Ação da Meta do Plano de Ação"),
+    id_acao_meta_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único da Ação da Meta do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     numero_acao_meta_plano_acao: Optional[str] = Query(None, description="Número da Ação da Meta do Plano de Ação (Letra 'A' seguida do sequencial da Meta do Plano de Ação, seguido de '.', seguida do Sequencial da Ação da Meta do Plano de Ação )"),
     nome_acao_meta_plano_acao: Optional[str] = Query(None, description="Nome da Ação da Meta do Plano de Ação"),
     descricao_acao_meta_plano_acao: Optional[str] = Query(None, description="Descrição da Ação da Meta do Plano de Ação"),
     valor_acao_meta_plano_acao: Optional[float] = Query(None, description="Valor da Ação da Meta do Plano de Ação", ge=0),
+    valor_acao_meta_plano_acao_min: Optional[float] = Query(None, description="Valor da Ação da Meta do Plano de Ação - mínimo (inclusive)", ge=0),
+    valor_acao_meta_plano_acao_max: Optional[float] = Query(None, description="Valor da Ação da Meta do Plano de Ação - máximo (inclusive)", ge=0),
     versao_acao_meta_plano_acao: Optional[int] = Query(None, description="Versão da Ação da Meta do Plano de Ação"),
     sequencial_acao_meta_plano_acao: Optional[int] = Query(None, description="Número Sequencial da Ação da Meta do Plano de Ação"),
-    id_meta_plano_acao: Optional[int] = Query(None, description="Identificador Único da Meta do Plano de Ação"),
+    id_meta_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único da Meta do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.PlanoAcaoMetaAcao, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.PlanoAcaoMetaAcao).where(
-            and_(
-                models.PlanoAcaoMetaAcao.id_acao_meta_plano_acao == id_acao_meta_plano_acao if id_acao_meta_plano_acao is not None else True,
-                models.PlanoAcaoMetaAcao.numero_acao_meta_plano_acao == numero_acao_meta_plano_acao if numero_acao_meta_plano_acao is not None else True,
-                models.PlanoAcaoMetaAcao.nome_acao_meta_plano_acao.ilike(f"%{nome_acao_meta_plano_acao}%") if nome_acao_meta_plano_acao is not None else True,
-                models.PlanoAcaoMetaAcao.descricao_acao_meta_plano_acao.ilike(f"%{descricao_acao_meta_plano_acao}%") if descricao_acao_meta_plano_acao is not None else True,
-                models.PlanoAcaoMetaAcao.valor_acao_meta_plano_acao == valor_acao_meta_plano_acao if valor_acao_meta_plano_acao is not None else True,
-                models.PlanoAcaoMetaAcao.versao_acao_meta_plano_acao == versao_acao_meta_plano_acao if versao_acao_meta_plano_acao is not None else True,
-                models.PlanoAcaoMetaAcao.sequencial_acao_meta_plano_acao == sequencial_acao_meta_plano_acao if sequencial_acao_meta_plano_acao is not None else True,
-                models.PlanoAcaoMetaAcao.id_meta_plano_acao == id_meta_plano_acao if id_meta_plano_acao is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
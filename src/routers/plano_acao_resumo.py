@@ -0,0 +1,73 @@
+from fastapi import APIRouter, HTTPException, Depends, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from src import models
+from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
+from src.schemas import PaginatedResponseTemplate, PaginatedPlanoAcaoResumoResponse
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
+
+
+par_router = APIRouter(tags=["Plano de Ação - Resumo de Execução"])
+
+
+@par_router.get("/plano_acao_resumo",
+                status_code=status.HTTP_200_OK,
+                description="Retorna uma Lista Paginada do Resumo de Execução por Plano de Ação - FaF: total empenhado, total dos lançamentos da gestão financeira nas contas do Plano de Ação e quantidade de metas e de relatórios de gestão. "
+                            "Os dados são pré-calculados e atualizados após as cargas de dados (ver data_atualizacao_resumo_plano_acao).",
+                response_description="Lista Paginada do Resumo de Execução por Plano de Ação - FaF",
+                response_model=PaginatedPlanoAcaoResumoResponse,
+                response_model_exclude_unset=True
+                )
+@fast_response(PaginatedPlanoAcaoResumoResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
+async def consulta_plano_acao_resumo_faf(
+    id_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    codigo_plano_acao: Optional[List[str]] = Query(None, description="Código do Programa concatenado com o Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    situacao_plano_acao: Optional[str] = Query(None, description="Situação do Plano de Ação"),
+    uf_ente_recebedor_plano_acao: Optional[str] = Query(None, description="Sigla da Unidade da Federação do Ente Recebedor do Plano de Ação"),
+    codigo_ibge_municipio_ente_recebedor_plano_acao: Optional[List[str]] = Query(None, description="Código IBGE do Município do Ente Recebedor do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    valor_total_plano_acao: Optional[float] = Query(None, description="Valor Total do Plano de Ação", ge=0),
+    valor_total_plano_acao_min: Optional[float] = Query(None, description="Valor Total do Plano de Ação - mínimo (inclusive)", ge=0),
+    valor_total_plano_acao_max: Optional[float] = Query(None, description="Valor Total do Plano de Ação - máximo (inclusive)", ge=0),
+    quantidade_empenhos_plano_acao: Optional[int] = Query(None, description="Quantidade de Notas de Empenho do Plano de Ação", ge=0),
+    valor_total_empenhado_plano_acao: Optional[float] = Query(None, description="Valor Total Empenhado do Plano de Ação", ge=0),
+    valor_total_empenhado_plano_acao_min: Optional[float] = Query(None, description="Valor Total Empenhado do Plano de Ação - mínimo (inclusive)", ge=0),
+    valor_total_empenhado_plano_acao_max: Optional[float] = Query(None, description="Valor Total Empenhado do Plano de Ação - máximo (inclusive)", ge=0),
+    quantidade_lancamentos_plano_acao: Optional[int] = Query(None, description="Quantidade de Lançamentos da Gestão Financeira nas contas do Plano de Ação", ge=0),
+    valor_total_lancamentos_plano_acao: Optional[float] = Query(None, description="Valor Total dos Lançamentos da Gestão Financeira nas contas do Plano de Ação"),
+    valor_total_lancamentos_plano_acao_min: Optional[float] = Query(None, description="Valor Total dos Lançamentos da Gestão Financeira nas contas do Plano de Ação - mínimo (inclusive)"),
+    valor_total_lancamentos_plano_acao_max: Optional[float] = Query(None, description="Valor Total dos Lançamentos da Gestão Financeira nas contas do Plano de Ação - máximo (inclusive)"),
+    quantidade_metas_plano_acao: Optional[int] = Query(None, description="Quantidade de Metas do Plano de Ação", ge=0),
+    quantidade_relatorios_gestao_plano_acao: Optional[int] = Query(None, description="Quantidade de Relatórios de Gestão do Plano de Ação", ge=0),
+    id_programa: Optional[List[str]] = Query(None, description="Identificador Único do Programa (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    pagina: int = Query(1, ge=1, description="Número da Página"),
+    tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
+    dbsession: AsyncSession = Depends(get_session)
+):
+    query = compile_query(models.PlanoAcaoResumo, locals())
+    
+    if query is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_NO_PARAMS)
+    
+    try:
+        result = await get_paginated_data(query=query,
+                                          dbsession=dbsession,
+                                          response_schema=PaginatedResponseTemplate, 
+                                          current_page=pagina, 
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
+        return result
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail=config.ERROR_MESSAGE_INTERNAL)
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedProgramaBeneficiarioResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 pgb_router = APIRouter(tags=["Programa - Beneficiário"])
@@ -16,51 +16,49 @@ pgb_router = APIRouter(tags=["Programa - Beneficiário"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados de Beneficiários dos Programas - FaF.",
                 response_description="Lista Paginada de Beneficiários dos Programas - FaF",
-                response_model=PaginatedProgramaBeneficiarioResponse
+                response_model=PaginatedProgramaBeneficiarioResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedProgramaBeneficiarioResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_programa_beneficiario_faf(
-    id_beneficiario_programa: Optional[int] = Query(None, description="Identificador Único do Beneficiário do Programa"),
+    id_beneficiario_programa: Optional[List[str]] = Query(None, description="Identificador Único do Beneficiário do Programa (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     cnpj_beneficiario_programa: Optional[str] = Query(None, description="CNPJ do Beneficiário do Programa"),
     nome_beneficiario_programa: Optional[str] = Query(None, description="Nome do Beneficiário do Programa"),
     valor_beneficiario_programa: Optional[float] = Query(None, description="Valor Destinado ao Beneficiário do Programa", ge=0),
+    valor_beneficiario_programa_min: Optional[float] = Query(None, description="Valor Destinado ao Beneficiário do Programa - mínimo (inclusive)", ge=0),
+    valor_beneficiario_programa_max: Optional[float] = Query(None, description="Valor Destinado ao Beneficiário do Programa - máximo (inclusive)", ge=0),
     numero_emenda_beneficiario_programa: Optional[str] = Query(None, description="Número da Emenda do Beneficiário do Programa"),
     nome_parlamentar_beneficiario_programa: Optional[str] = Query(None, description="Nome do Parlamentar Autor da Emenda do Beneficiário do Programa"),
     tipo_beneficiario_programa: Optional[str] = Query(None, description="Tipo do Beneficiário do Programa"),
     uf_beneficiario_programa: Optional[str] = Query(None, description="Sigla da Unidade da Federação do Beneficiário do Programa"),
-    id_programa: Optional[int] = Query(None, description="Identificador Único do Programa"),
+    id_programa: Optional[List[str]] = Query(None, description="Identificador Único do Programa (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.ProgramaBeneficiario, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.ProgramaBeneficiario).where(
-            and_(
-                models.ProgramaBeneficiario.id_beneficiario_programa == id_beneficiario_programa if id_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.cnpj_beneficiario_programa == cnpj_beneficiario_programa if cnpj_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.nome_beneficiario_programa.ilike(f"%{nome_beneficiario_programa}%") if nome_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.valor_beneficiario_programa == valor_beneficiario_programa if valor_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.numero_emenda_beneficiario_programa == numero_emenda_beneficiario_programa if numero_emenda_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.nome_parlamentar_beneficiario_programa == nome_parlamentar_beneficiario_programa if nome_parlamentar_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.tipo_beneficiario_programa.ilike(f"%{tipo_beneficiario_programa}%") if tipo_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.uf_beneficiario_programa == uf_beneficiario_programa if uf_beneficiario_programa is not None else True,
-                models.ProgramaBeneficiario.id_programa == id_programa if id_programa is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedProgramaGestaoAgilResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
+from src.inmemory import in_memory
 
 
 pgga_router = APIRouter(tags=["Programa - Gestão Ágil"])
@@ -16,51 +17,48 @@ pgga_router = APIRouter(tags=["Programa - Gestão Ágil"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados de Programas cadastrados no Sistema Gestão Ágil - FaF.",
                 response_description="Lista Paginada de Programas cadastrados no Sistema Gestão Ágil - FaF",
-                response_model=PaginatedProgramaGestaoAgilResponse
+                response_model=PaginatedProgramaGestaoAgilResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedProgramaGestaoAgilResponse)
+@in_memory(models.ProgramaGestaoAgil)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_programa_gestao_agil_faf(
-    id_programa_agil: Optional[int] = Query(None, description="Identificador Único do Programa Ágil"),
-    id_programa_agil_bb: Optional[int] = Query(None, description="Identificador Único do Programa no Sistema Gestão Ágil no cadastro do Programa no Sistema Gestão Ágil"),
+    id_programa_agil: Optional[List[str]] = Query(None, description="Identificador Único do Programa Ágil (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    id_programa_agil_bb: Optional[List[str]] = Query(None, description="Identificador Único do Programa no Sistema Gestão Ágil no cadastro do Programa no Sistema Gestão Ágil (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     nome_programa_agil: Optional[str] = Query(None, description="Nome do Programa no Sistema de Gestão Ágil BB"),
-    codigo_programa_agil: Optional[str] = Query(None, description="Código do Programa no Sistema de Gestão Ágil BB"),
-    codigo_siorg_orgao_programa_agil: Optional[int] = Query(None, description="Código SIORG do Órgão do Programa"),
+    codigo_programa_agil: Optional[List[str]] = Query(None, description="Código do Programa no Sistema de Gestão Ágil BB (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    codigo_siorg_orgao_programa_agil: Optional[List[str]] = Query(None, description="Código SIORG do Órgão do Programa (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     sigla_orgao_programa_agil: Optional[str] = Query(None, description="Sigla do Órgão do Programa"),
     cnpj_orgao_programa_agil: Optional[str] = Query(None, description="CNPJ do Órgão do Programa"),
     nome_orgao_programa_agil: Optional[str] = Query(None, description="Nome do Órgão do Programa"),
-    id_programa: Optional[int] = Query(None, description="Identificador Único do Programa"),
+    id_programa: Optional[List[str]] = Query(None, description="Identificador Único do Programa (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.ProgramaGestaoAgil, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.ProgramaGestaoAgil).where(
-            and_(
-                models.ProgramaGestaoAgil.id_programa_agil == id_programa_agil if id_programa_agil is not None else True,
-                models.ProgramaGestaoAgil.id_programa_agil_bb == id_programa_agil_bb if id_programa_agil_bb is not None else True,
-                models.ProgramaGestaoAgil.nome_programa_agil.ilike(f"%{nome_programa_agil}%") if nome_programa_agil is not None else True,
-                models.ProgramaGestaoAgil.codigo_programa_agil == codigo_programa_agil if codigo_programa_agil is not None else True,
-                models.ProgramaGestaoAgil.codigo_siorg_orgao_programa_agil == codigo_siorg_orgao_programa_agil if codigo_siorg_orgao_programa_agil is not None else True,
-                models.ProgramaGestaoAgil.sigla_orgao_programa_agil == sigla_orgao_programa_agil if sigla_orgao_programa_agil is not None else True,
-                models.ProgramaGestaoAgil.cnpj_orgao_programa_agil == cnpj_orgao_programa_agil if cnpj_orgao_programa_agil is not None else True,
-                models.ProgramaGestaoAgil.nome_orgao_programa_agil.ilike(f"%{nome_orgao_programa_agil}%") if nome_orgao_programa_agil is not None else True,
-                models.ProgramaGestaoAgil.id_programa == id_programa if id_programa is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
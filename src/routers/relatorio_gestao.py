@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date, Time, func
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedRelatorioGestaoResponse
-from datetime import date
-from typing import Optional, Literal
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 rg_router = APIRouter(tags=["Relatório de Gestão"])
@@ -16,60 +16,57 @@ rg_router = APIRouter(tags=["Relatório de Gestão"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados de Relatórios de Gestão - FaF.",
                 response_description="Lista Paginada de Relatório de Gestão - FaF",
-                response_model=PaginatedRelatorioGestaoResponse
+                response_model=PaginatedRelatorioGestaoResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedRelatorioGestaoResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_relatorio_gestao_faf(
-    id_relatorio_gestao: Optional[int] = Query(None, description="Identificador Único do Relatório de Gestão"),
-    data_relatorio_gestao: Optional[date] = Query(None, description="Data do Envio do Relatório de Gestão", pattern="^\d{4}-\d{2}-\d{2}$"),
+    id_relatorio_gestao: Optional[List[str]] = Query(None, description="Identificador Único do Relatório de Gestão (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    data_relatorio_gestao: Optional[str] = Query(None, description="Data do Envio do Relatório de Gestão", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_relatorio_gestao_de: Optional[str] = Query(None, description="Data do Envio do Relatório de Gestão - a partir de (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_relatorio_gestao_ate: Optional[str] = Query(None, description="Data do Envio do Relatório de Gestão - até (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
     hora_relatorio_gestao: Optional[str] = Query(None, description="Data e Hora do Envio do Relatório de Gestão", pattern="^\d{2}:\d{2}$"),
     tipo_relatorio_gestao: Literal['PARCIAL','FINAL'] = Query(None, description="Tipo do Relatório de Gestão: ('PARCIAL' ou 'FINAL')"),
     situacao_relatorio_gestao: Literal['EM_ELABORACAO', 'ENVIADO_ANALISE_CONSELHO', 'ENVIADO_ANALISE', 'EM_COMPLEMENTACAO', 'ANALISE_CONCLUIDA_CONSELHO', 'ANALISE_CONCLUIDA', 'REJEITADO'] = Query(None, description="Situação do Relatório de Gestão: ('EM_ELABORACAO', 'ENVIADO_ANALISE_CONSELHO', 'ENVIADO_ANALISE', 'EM_COMPLEMENTACAO', 'ANALISE_CONCLUIDA_CONSELHO', 'ANALISE_CONCLUIDA', 'REJEITADO')"),
     valor_executado_relatorio_gestao: Optional[float] = Query(None, description="Valor Repassado do Relatório de Gestão", ge=0),
+    valor_executado_relatorio_gestao_min: Optional[float] = Query(None, description="Valor Repassado do Relatório de Gestão - mínimo (inclusive)", ge=0),
+    valor_executado_relatorio_gestao_max: Optional[float] = Query(None, description="Valor Repassado do Relatório de Gestão - máximo (inclusive)", ge=0),
     valor_pendente_relatorio_gestao: Optional[float] = Query(None, description="Valor Pendente do Relatório de Gestão", ge=0),
+    valor_pendente_relatorio_gestao_min: Optional[float] = Query(None, description="Valor Pendente do Relatório de Gestão - mínimo (inclusive)", ge=0),
+    valor_pendente_relatorio_gestao_max: Optional[float] = Query(None, description="Valor Pendente do Relatório de Gestão - máximo (inclusive)", ge=0),
     resultados_alcancados_metas_relatorio_gestao: Optional[str] = Query(None, description="Resultados Alcançados do Relatório de Gestão"),
     descritivo_relatorio_gestao: Optional[str] = Query(None, description="Descritivo do Parecer do Relatório de Gestão"),
     contrapartida_relatorio_gestao: Optional[str] = Query(None, description="Contrapartida do Relatório de Gestão"),
     endereco_eletronico_publicidade_acoes_relatorio_gestao: Optional[str] = Query(None, description="URL de Publicidade das Ações Pactuadas no Relatório de Gestão"),
     declaracao_conformidade_relatorio_gestao: Optional[bool] = Query(None, description="Indicador da Declaração de Conformidade do Relatório de Gestão"),
-    id_plano_acao: Optional[int] = Query(None, description="Identificador Único do Plano de Ação"),
+    id_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.RelatorioGestao, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.RelatorioGestao).where(
-            and_(
-                models.RelatorioGestao.id_relatorio_gestao == id_relatorio_gestao if id_relatorio_gestao is not None else True,
-                cast(models.RelatorioGestao.data_relatorio_gestao, Date) == date.fromisoformat(data_relatorio_gestao) if data_relatorio_gestao is not None else True,
-                func.to_char(cast(models.RelatorioGestao.data_e_hora_relatorio_gestao, Time), 'HH24:MI') == hora_relatorio_gestao if hora_relatorio_gestao is not None else True,
-                models.RelatorioGestao.tipo_relatorio_gestao == tipo_relatorio_gestao if tipo_relatorio_gestao is not None else True,
-                models.RelatorioGestao.situacao_relatorio_gestao == situacao_relatorio_gestao if situacao_relatorio_gestao is not None else True,
-                models.RelatorioGestao.valor_executado_relatorio_gestao == valor_executado_relatorio_gestao if valor_executado_relatorio_gestao is not None else True,
-                models.RelatorioGestao.valor_pendente_relatorio_gestao == valor_pendente_relatorio_gestao if valor_pendente_relatorio_gestao is not None else True,
-                models.RelatorioGestao.resultados_alcancados_metas_relatorio_gestao.ilike(f"%{resultados_alcancados_metas_relatorio_gestao}%") if resultados_alcancados_metas_relatorio_gestao is not None else True,
-                models.RelatorioGestao.descritivo_relatorio_gestao.ilike(f"%{descritivo_relatorio_gestao}%") if descritivo_relatorio_gestao is not None else True,
-                models.RelatorioGestao.contrapartida_relatorio_gestao.ilike(f"%{contrapartida_relatorio_gestao}%") if contrapartida_relatorio_gestao is not None else True,
-                models.RelatorioGestao.endereco_eletronico_publicidade_acoes_relatorio_gestao.ilike(f"%{endereco_eletronico_publicidade_acoes_relatorio_gestao}%") if endereco_eletronico_publicidade_acoes_relatorio_gestao is not None else True,
-                models.RelatorioGestao.declaracao_conformidade_relatorio_gestao == declaracao_conformidade_relatorio_gestao if declaracao_conformidade_relatorio_gestao is not None else True,
-                models.RelatorioGestao.id_plano_acao == id_plano_acao if id_plano_acao is not None else True
-            )
-        )
-        # print(str(query))
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=e.__repr__())
\ No newline at end of file
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedRelatorioGestaoAcoesResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 rga_router = APIRouter(tags=["Relatório de Gestão - Ações"])
@@ -16,43 +16,43 @@ rga_router = APIRouter(tags=["Relatório de Gestão - Ações"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados das Ações associadas ao Relatório de Gestão - FaF.",
                 response_description="Lista Paginada de Ações associadas ao Relatório de Gestão - FaF",
-                response_model=PaginatedRelatorioGestaoAcoesResponse
+                response_model=PaginatedRelatorioGestaoAcoesResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedRelatorioGestaoAcoesResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_relatorio_gestao_acoes_faf(
-    id_acao_relatorio_gestao: Optional[int] = Query(None, description="Identificador Único da Ação associada ao Relatório de Gestão"),
+    id_acao_relatorio_gestao: Optional[List[str]] = Query(None, description="Identificador Único da Ação associada ao Relatório de Gestão (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     percentual_execucao_fisica_acao_relatorio_gestao_acao: Optional[str] = Query(None, description="Percentual de Conclusão da Ação do Relatório de Gestão"),
     observacoes_justificativas_relatorio_gestao_acao: Optional[str] = Query(None, description="Justificativa referente ao Percentual de Conclusão da Ação do Relatório de Gestão"),
-    id_relatorio_gestao: Optional[int] = Query(None, description="Identificador Único do Relatório de Gestão"),
-    id_acao_meta_plano_acao: Optional[int] = Query(None, description="Identificador Único da Ação da Meta do Plano de Ação"),
+    id_relatorio_gestao: Optional[List[str]] = Query(None, description="Identificador Único do Relatório de Gestão (aceita múltiplos valores, repetidos ou separados por vírgula)"),
+    id_acao_meta_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único da Ação da Meta do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.RelatorioGestaoAcoes, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.RelatorioGestaoAcoes).where(
-            and_(
-                models.RelatorioGestaoAcoes.id_acao_relatorio_gestao == id_acao_relatorio_gestao if id_acao_relatorio_gestao is not None else True,
-                models.RelatorioGestaoAcoes.percentual_execucao_fisica_acao_relatorio_gestao_acao == percentual_execucao_fisica_acao_relatorio_gestao_acao if percentual_execucao_fisica_acao_relatorio_gestao_acao is not None else True,
-                models.RelatorioGestaoAcoes.observacoes_justificativas_relatorio_gestao_acao.ilike(f"%{observacoes_justificativas_relatorio_gestao_acao}%") if observacoes_justificativas_relatorio_gestao_acao is not None else True,
-                models.RelatorioGestaoAcoes.id_relatorio_gestao == id_relatorio_gestao if id_relatorio_gestao is not None else True,
-                models.RelatorioGestaoAcoes.id_acao_meta_plano_acao == id_acao_meta_plano_acao if id_acao_meta_plano_acao is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
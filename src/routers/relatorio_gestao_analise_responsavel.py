@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedRelatorioGestaoAnaliseResponsavelResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
 
 
 rgra_router = APIRouter(tags=["Relatório de Gestão - Responsável pela Análise"])
@@ -16,40 +16,41 @@ rgra_router = APIRouter(tags=["Relatório de Gestão - Responsável pela Anális
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados dos Responsáveis pela Análise do Relatório de Gestão - FaF.",
                 response_description="Lista Paginada de Responsáveis pela Análise do Relatório de Gestão - FaF",
-                response_model=PaginatedRelatorioGestaoAnaliseResponsavelResponse
+                response_model=PaginatedRelatorioGestaoAnaliseResponsavelResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedRelatorioGestaoAnaliseResponsavelResponse)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_relatorio_gestao_analise_responsavel_faf(
-    id_relatorio_gestao_analise: Optional[int] = Query(None, description="Identificador Único da Análise do Relatório de Gestão"),
+    id_relatorio_gestao_analise: Optional[List[str]] = Query(None, description="Identificador Único da Análise do Relatório de Gestão (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     nome_responsavel_analise_relatorio_gestao_analise: Optional[str] = Query(None, description="Nome do Responsável pela Análise do Relatório de Gestão"),
     cargo_responsavel_analise_relatorio_gestao_analise: Optional[str] = Query(None, description="Cargo do Responsável pela Análise do Relatório de Gestão"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.RelatorioGestaoAnaliseResponsavel, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.RelatorioGestaoAnaliseResponsavel).where(
-            and_(
-                models.RelatorioGestaoAnaliseResponsavel.relatorio_gestao_analise_fk == id_relatorio_gestao_analise if id_relatorio_gestao_analise is not None else True,
-                models.RelatorioGestaoAnaliseResponsavel.nome_responsavel_analise_relatorio_gestao_analise.ilike(f"%{nome_responsavel_analise_relatorio_gestao_analise}%") if nome_responsavel_analise_relatorio_gestao_analise is not None else True,
-                models.RelatorioGestaoAnaliseResponsavel.cargo_responsavel_analise_relatorio_gestao_analise.ilike(f"%{cargo_responsavel_analise_relatorio_gestao_analise}%") if cargo_responsavel_analise_relatorio_gestao_analise is not None else True
-            )
-        )
-        # print(str(query))
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
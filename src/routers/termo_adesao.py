@@ -1,12 +1,13 @@
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select, and_, cast, Date
 from src import models
 from src.utils import get_session, get_paginated_data, config
+from src.filters import compile_query
 from src.schemas import PaginatedResponseTemplate, PaginatedTermoAdesaoResponse
-from datetime import date
-from typing import Optional
-from src.cache import cache
+from typing import Optional, Literal, List
+from src.cache import cache_route
+from src.serializers import fast_response
+from src.inmemory import in_memory
 
 
 ta_router = APIRouter(tags=["Termo de Adesão"])
@@ -16,53 +17,53 @@ ta_router = APIRouter(tags=["Termo de Adesão"])
                 status_code=status.HTTP_200_OK,
                 description="Retorna uma Lista Paginada dos dados do Termo de Adesão - FaF.",
                 response_description="Lista Paginada de Termos de Adesão - FaF",
-                response_model=PaginatedTermoAdesaoResponse
+                response_model=PaginatedTermoAdesaoResponse,
+                response_model_exclude_unset=True
                 )
-@cache(ttl=config.CACHE_TTL, lock=True)
+@fast_response(PaginatedTermoAdesaoResponse)
+@in_memory(models.TermoAdesao)
+@cache_route(ttl=config.CACHE_TTL, lock=True)
 async def consulta_termo_adesao_faf(
-    id_termo_adesao: Optional[int] = Query(None, description="Identificador Único do Termo de Adesão"),
+    id_termo_adesao: Optional[List[str]] = Query(None, description="Identificador Único do Termo de Adesão (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     numero_processo_termo_adesao: Optional[str] = Query(None, description="Número do Processo do Termo de Adesão"),
     situacao_termo_adesao: Optional[str] = Query(None, description="Situação do Termo de Adesão (Podendo ser: Em Elaboração; Enviado para o Recebedor; Assinado)"),
     objeto_termo_adesao: Optional[str] = Query(None, description="Objeto do Termo de Adesão"),
     data_assinatura_termo_adesao: Optional[str] = Query(None, description="Data de Assinatura do Termo de Adesão", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_assinatura_termo_adesao_de: Optional[str] = Query(None, description="Data de Assinatura do Termo de Adesão - a partir de (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_assinatura_termo_adesao_ate: Optional[str] = Query(None, description="Data de Assinatura do Termo de Adesão - até (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
     ano_termo_adesao: Optional[int] = Query(None, description="Ano do Termo de Adesão", gt=0),
     secao_publicacao_dou_termo_adesao: Optional[int] = Query(None, description="Seção no DOU (Diário Oficial da União) do Termo de Adesão"),
     pagina_publicacao_dou_termo_adesao: Optional[int] = Query(None, description="Página no DOU (Diário Oficial da União) do Termo de Adesão", gt=0),
     data_publicacao_dou_termo_adesao: Optional[str] = Query(None, description="Data da Publicação no DOU (Diário Oficial da União) do Termo de Adesão", pattern="^\d{4}-\d{2}-\d{2}$"),
-    id_plano_acao: Optional[int] = Query(None, description="Identificador Único do Plano de Ação"),
+    data_publicacao_dou_termo_adesao_de: Optional[str] = Query(None, description="Data da Publicação no DOU (Diário Oficial da União) do Termo de Adesão - a partir de (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    data_publicacao_dou_termo_adesao_ate: Optional[str] = Query(None, description="Data da Publicação no DOU (Diário Oficial da União) do Termo de Adesão - até (inclusive)", pattern="^\d{4}-\d{2}-\d{2}$"),
+    id_plano_acao: Optional[List[str]] = Query(None, description="Identificador Único do Plano de Ação (aceita múltiplos valores, repetidos ou separados por vírgula)"),
     pagina: int = Query(1, ge=1, description="Número da Página"),
     tamanho_da_pagina: int = Query(config.DEFAULT_PAGE_SIZE, le=config.MAX_PAGE_SIZE, ge=1, description="Tamanho da Página"),
+    cursor: Optional[str] = Query(None, description="Cursor de Paginação retornado em next_cursor pela consulta anterior (quando informado, o parâmetro pagina é ignorado)"),
+    contagem: Literal['exata', 'estimada', 'nenhuma'] = Query('exata', description="Modo de Contagem do Total de Registros: exata; estimada (estimativa do planejador do banco de dados, mais rápida em tabelas grandes); ou nenhuma (total não calculado)"),
+    ordenar_por: Optional[str] = Query(None, description="Campo de Ordenação, com prefixo '-' para ordem decrescente (ex.: -campo). Aceita a chave primária e os campos indexados; a chave primária é sempre usada como critério de desempate"),
+    campos: Optional[str] = Query(None, description="Campos Retornados, separados por vírgula (padrão: todos os campos; a chave primária e o campo de ordenação são sempre retornados)"),
     dbsession: AsyncSession = Depends(get_session)
 ):
-    params = locals().copy()
-    params_list = list(params.keys())[:-3]    
+    query = compile_query(models.TermoAdesao, locals())
     
-    if all([params[_name] is None for _name in params_list]):
+    if query is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail=config.ERROR_MESSAGE_NO_PARAMS)
     
     try:
-        query = select(models.TermoAdesao).where(
-            and_(
-                models.TermoAdesao.id_termo_adesao == id_termo_adesao if id_termo_adesao is not None else True,
-                models.TermoAdesao.numero_processo_termo_adesao == numero_processo_termo_adesao if numero_processo_termo_adesao is not None else True,
-                models.TermoAdesao.situacao_termo_adesao.ilike(f"%{situacao_termo_adesao}%") if situacao_termo_adesao is not None else True,
-                models.TermoAdesao.objeto_termo_adesao == objeto_termo_adesao if objeto_termo_adesao is not None else True,
-                cast(models.TermoAdesao.data_assinatura_termo_adesao, Date) == date.fromisoformat(data_assinatura_termo_adesao) if data_assinatura_termo_adesao is not None else True,
-                models.TermoAdesao.ano_termo_adesao == ano_termo_adesao if ano_termo_adesao is not None else True,
-                models.TermoAdesao.secao_publicacao_dou_termo_adesao == secao_publicacao_dou_termo_adesao if secao_publicacao_dou_termo_adesao is not None else True,
-                models.TermoAdesao.pagina_publicacao_dou_termo_adesao == pagina_publicacao_dou_termo_adesao if pagina_publicacao_dou_termo_adesao is not None else True,
-                cast(models.TermoAdesao.data_publicacao_dou_termo_adesao, Date) == date.fromisoformat(data_publicacao_dou_termo_adesao) if data_publicacao_dou_termo_adesao is not None else True,
-                models.TermoAdesao.id_plano_acao == id_plano_acao if id_plano_acao is not None else True
-            )
-        )
         result = await get_paginated_data(query=query,
                                           dbsession=dbsession,
                                           response_schema=PaginatedResponseTemplate, 
                                           current_page=pagina, 
-                                          records_per_page=tamanho_da_pagina)
+                                          records_per_page=tamanho_da_pagina,
+                                          cursor=cursor,
+                                          count_mode=contagem)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=config.ERROR_MESSAGE_INTERNAL)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict
 from datetime import date, datetime
 
 
@@ -8,46 +8,48 @@ class PaginatedResponseTemplate(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     
     data: List[Any]
-    total_pages: int
-    total_items: int
+    total_pages: Optional[int]
+    total_items: Optional[int]
+    total_items_exact: bool = True
     page_number: int
     page_size: int
+    next_cursor: Optional[str] = None
 # --------------------------------------
 
 
 class EmpenhoResponse(BaseModel):  
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_empenho: Optional[int]
-    numero_empenho: Optional[str]
-    ano_empenho: Optional[str]
-    gestao_emitente_empenho: Optional[str]
-    ug_emitente_empenho: Optional[str]
-    data_emissao_empenho: Optional[date]
-    fonte_recurso_empenho: Optional[str]
-    esfera_orcamentaria_empenho: Optional[int]
-    descricao_esfera_orcamentaria_empenho: Optional[str]
-    plano_interno_empenho: Optional[str]
-    unidade_gestora_responsavel_empenho: Optional[str]
-    observacao_empenho: Optional[str]
-    cnpj_favorecido_empenho: Optional[str]
-    numero_lista_empenho: Optional[str]
-    unidade_gestora_referencia_empenho: Optional[str]
-    gestao_referencia_empenho: Optional[str]
-    numero_interno_empenho: Optional[int]
-    objeto_empenho: Optional[str]
-    numero_sistema_empenho: Optional[str]
-    natureza_despesa_empenho: Optional[str]
-    natureza_despesa_sub_item_empenho: Optional[int]
-    tipo_empenho: Optional[int]
-    descricao_tipo_empenho: Optional[str]
-    codigo_tipo_nota_empenho: Optional[str]
-    descricao_tipo_nota_empenho: Optional[str]
-    situacao_empenho: Optional[int]
-    descricao_situacao_empenho: Optional[str]
-    valor_empenho: Optional[float]
-    versao_empenho: Optional[int]
-    id_plano_acao: Optional[int]
+    id_empenho: Optional[int] = None
+    numero_empenho: Optional[str] = None
+    ano_empenho: Optional[str] = None
+    gestao_emitente_empenho: Optional[str] = None
+    ug_emitente_empenho: Optional[str] = None
+    data_emissao_empenho: Optional[date] = None
+    fonte_recurso_empenho: Optional[str] = None
+    esfera_orcamentaria_empenho: Optional[int] = None
+    descricao_esfera_orcamentaria_empenho: Optional[str] = None
+    plano_interno_empenho: Optional[str] = None
+    unidade_gestora_responsavel_empenho: Optional[str] = None
+    observacao_empenho: Optional[str] = None
+    cnpj_favorecido_empenho: Optional[str] = None
+    numero_lista_empenho: Optional[str] = None
+    unidade_gestora_referencia_empenho: Optional[str] = None
+    gestao_referencia_empenho: Optional[str] = None
+    numero_interno_empenho: Optional[int] = None
+    objeto_empenho: Optional[str] = None
+    numero_sistema_empenho: Optional[str] = None
+    natureza_despesa_empenho: Optional[str] = None
+    natureza_despesa_sub_item_empenho: Optional[int] = None
+    tipo_empenho: Optional[int] = None
+    descricao_tipo_empenho: Optional[str] = None
+    codigo_tipo_nota_empenho: Optional[str] = None
+    descricao_tipo_nota_empenho: Optional[str] = None
+    situacao_empenho: Optional[int] = None
+    descricao_situacao_empenho: Optional[str] = None
+    valor_empenho: Optional[float] = None
+    versao_empenho: Optional[int] = None
+    id_plano_acao: Optional[int] = None
     
 
 class PaginatedEmpenhoResponse(PaginatedResponseTemplate):
@@ -57,13 +59,13 @@ class PaginatedEmpenhoResponse(PaginatedResponseTemplate):
 class GestaoFinanceiraCategoriasDespesaResponse(BaseModel):  
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_categoria_despesa_gestao_financeira: Optional[int]
-    id_nivel_pai_categoria_despesa_gestao_financeira: Optional[int]
-    nome_nivel_atual_categoria_despesa_gestao_financeira: Optional[str]
-    nivel_atual_categoria_despesa_gestao_financeira: Optional[int]
-    nome_completo_niveis_categoria_despesa_gestao_financeira: Optional[str]
-    codigo_programa_agil: Optional[int]
-    nome_programa_agil: Optional[str]
+    id_categoria_despesa_gestao_financeira: Optional[int] = None
+    id_nivel_pai_categoria_despesa_gestao_financeira: Optional[int] = None
+    nome_nivel_atual_categoria_despesa_gestao_financeira: Optional[str] = None
+    nivel_atual_categoria_despesa_gestao_financeira: Optional[int] = None
+    nome_completo_niveis_categoria_despesa_gestao_financeira: Optional[str] = None
+    codigo_programa_agil: Optional[int] = None
+    nome_programa_agil: Optional[str] = None
 
 
 class PaginatedGestaoFinanceiraCategoriasDespesaResponse(PaginatedResponseTemplate):
@@ -73,38 +75,38 @@ class PaginatedGestaoFinanceiraCategoriasDespesaResponse(PaginatedResponseTempla
 class GestaoFinanceiraLancamentosResponse(BaseModel):  
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_lancamento_gestao_financeira: Optional[int]
-    origem_solicitacao_gestao_financeira: Optional[str]
-    descricao_origem_solicitacao_gestao_financeira: Optional[str]
-    cnpj_ente_solicitante_gestao_financeira: Optional[str]
-    nome_ente_solicitante_gestao_financeira: Optional[str]
-    nome_personalizado_ente_solicitante_gestao_financeira: Optional[str]
-    codigo_programa_agil_ente_solicitante_gestao_financeira: Optional[str]
-    codigo_banco_gestao_financeira: Optional[str]
-    codigo_agencia_gestao_financeira: Optional[str]
-    dv_agencia_gestao_financeira: Optional[str]
-    codigo_conta_gestao_financeira: Optional[str]
-    dv_conta_gestao_financeira: Optional[str]
-    tipo_operacao_gestao_financeira: Optional[str]
-    descricao_tipo_operacao_gestao_financeira: Optional[str]
-    descricao_gestao_financeira: Optional[str]
-    data_lancamento_gestao_financeira: Optional[date]
-    data_evento_lancamento_gestao_financeira: Optional[date]
-    numero_ordem_gestao_financeira: Optional[int]
-    numero_referencia_unica_gestao_financeira: Optional[str]
-    tipo_favorecido_gestao_financeira: Optional[int]
-    descricao_tipo_favorecido_gestao_financeira: Optional[str]
-    doc_favorecido_gestao_financeira_mask: Optional[str]
-    nome_favorecido_gestao_financeira: Optional[str]
-    codigo_banco_favorecido_gestao_financeira: Optional[str]
-    codigo_agencia_favorecido_gestao_financeira: Optional[str]
-    dv_agencia_favorecido_gestao_financeira: Optional[str]
-    codigo_conta_favorecido_gestao_financeira: Optional[str]
-    dv_conta_favorecido_gestao_financeira: Optional[str]
-    valor_lancamento_gestao_financeira: Optional[float]
-    id_categoria_despesa_gestao_financeira: Optional[int]
-    quantidade_subtransacoes_lancamento_gestao_financeira: Optional[int]
-    id_agencia_conta: Optional[str]
+    id_lancamento_gestao_financeira: Optional[int] = None
+    origem_solicitacao_gestao_financeira: Optional[str] = None
+    descricao_origem_solicitacao_gestao_financeira: Optional[str] = None
+    cnpj_ente_solicitante_gestao_financeira: Optional[str] = None
+    nome_ente_solicitante_gestao_financeira: Optional[str] = None
+    nome_personalizado_ente_solicitante_gestao_financeira: Optional[str] = None
+    codigo_programa_agil_ente_solicitante_gestao_financeira: Optional[str] = None
+    codigo_banco_gestao_financeira: Optional[str] = None
+    codigo_agencia_gestao_financeira: Optional[str] = None
+    dv_agencia_gestao_financeira: Optional[str] = None
+    codigo_conta_gestao_financeira: Optional[str] = None
+    dv_conta_gestao_financeira: Optional[str] = None
+    tipo_operacao_gestao_financeira: Optional[str] = None
+    descricao_tipo_operacao_gestao_financeira: Optional[str] = None
+    descricao_gestao_financeira: Optional[str] = None
+    data_lancamento_gestao_financeira: Optional[date] = None
+    data_evento_lancamento_gestao_financeira: Optional[date] = None
+    numero_ordem_gestao_financeira: Optional[int] = None
+    numero_referencia_unica_gestao_financeira: Optional[str] = None
+    tipo_favorecido_gestao_financeira: Optional[int] = None
+    descricao_tipo_favorecido_gestao_financeira: Optional[str] = None
+    doc_favorecido_gestao_financeira_mask: Optional[str] = None
+    nome_favorecido_gestao_financeira: Optional[str] = None
+    codigo_banco_favorecido_gestao_financeira: Optional[str] = None
+    codigo_agencia_favorecido_gestao_financeira: Optional[str] = None
+    dv_agencia_favorecido_gestao_financeira: Optional[str] = None
+    codigo_conta_favorecido_gestao_financeira: Optional[str] = None
+    dv_conta_favorecido_gestao_financeira: Optional[str] = None
+    valor_lancamento_gestao_financeira: Optional[float] = None
+    id_categoria_despesa_gestao_financeira: Optional[int] = None
+    quantidade_subtransacoes_lancamento_gestao_financeira: Optional[int] = None
+    id_agencia_conta: Optional[str] = None
 
 
 class PaginatedGestaoFinanceiraLancamentosResponse(PaginatedResponseTemplate):
@@ -114,22 +116,22 @@ class PaginatedGestaoFinanceiraLancamentosResponse(PaginatedResponseTemplate):
 class GestaoFinanceiraSubtransacoesResponse(BaseModel):    
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_subtransacao_gestao_financeira: Optional[str]
-    estado_subtransacao_gestao_financeira: Optional[int]
-    situacao_pagamento_subtransacao_gestao_financeira: Optional[int]
-    descricao_situacao_pagamento_subtransacao_gestao_financeira: Optional[str]
-    data_pagamento_subtransacao_gestao_financeira: Optional[date]
-    tipo_pessoa_beneficiario_subtransacao_gestao_financeira: Optional[int]
-    descricao_tipo_pessoa_beneficiario_subtransacao_gestao_financei: Optional[str]
-    numero_documento_beneficiario_subtransacao_gestao_financeira_ma: Optional[str]
-    nome_beneficiario_subtransacao_gestao_financeira: Optional[str]
-    codigo_banco_beneficiario_subtransacao_gestao_financeira: Optional[str]
-    codigo_agencia_beneficiario_subtransacao_gestao_financeira: Optional[str]
-    codigo_conta_beneficiario_subtransacao_gestao_financeira: Optional[str]
-    descricao_subtransacao_gestao_financeira: Optional[str]
-    valor_subtransacao_gestao_financeira: Optional[float]
-    id_categoria_despesa_gestao_financeira: Optional[int]
-    id_lancamento_gestao_financeira: Optional[int]
+    id_subtransacao_gestao_financeira: Optional[str] = None
+    estado_subtransacao_gestao_financeira: Optional[int] = None
+    situacao_pagamento_subtransacao_gestao_financeira: Optional[int] = None
+    descricao_situacao_pagamento_subtransacao_gestao_financeira: Optional[str] = None
+    data_pagamento_subtransacao_gestao_financeira: Optional[date] = None
+    tipo_pessoa_beneficiario_subtransacao_gestao_financeira: Optional[int] = None
+    descricao_tipo_pessoa_beneficiario_subtransacao_gestao_financei: Optional[str] = None
+    numero_documento_beneficiario_subtransacao_gestao_financeira_ma: Optional[str] = None
+    nome_beneficiario_subtransacao_gestao_financeira: Optional[str] = None
+    codigo_banco_beneficiario_subtransacao_gestao_financeira: Optional[str] = None
+    codigo_agencia_beneficiario_subtransacao_gestao_financeira: Optional[str] = None
+    codigo_conta_beneficiario_subtransacao_gestao_financeira: Optional[str] = None
+    descricao_subtransacao_gestao_financeira: Optional[str] = None
+    valor_subtransacao_gestao_financeira: Optional[float] = None
+    id_categoria_despesa_gestao_financeira: Optional[int] = None
+    id_lancamento_gestao_financeira: Optional[int] = None
 
 
 class PaginatedGestaoFinanceiraSubtransacoesResponse(PaginatedResponseTemplate):
@@ -139,70 +141,106 @@ class PaginatedGestaoFinanceiraSubtransacoesResponse(PaginatedResponseTemplate):
 class PlanoAcaoResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_plano_acao: Optional[int]
-    codigo_plano_acao: Optional[str]
-    data_inicio_vigencia_plano_acao: Optional[date]
-    data_fim_vigencia_plano_acao: Optional[date]
-    diagnostico_plano_acao: Optional[str]
-    objetivos_plano_acao: Optional[str]
-    situacao_plano_acao: Optional[str]
-    valor_repasse_emenda_plano_acao: Optional[float]
-    valor_repasse_especifico_plano_acao: Optional[float]
-    valor_repasse_voluntario_plano_acao: Optional[float]
-    valor_total_repasse_plano_acao: Optional[float]
-    valor_recursos_proprios_plano_acao: Optional[float]
-    valor_outros_plano_acao: Optional[float]
-    valor_rendimentos_aplicacao_plano_acao: Optional[float]
-    valor_total_plano_acao: Optional[float]
-    valor_total_investimento_plano_acao: Optional[float]
-    valor_total_custeio_plano_acao: Optional[float]
-    valor_saldo_disponivel_plano_acao: Optional[float]
-    id_orgao_repassador_plano_acao: Optional[int]
-    sigla_orgao_repassador_plano_acao: Optional[str]
-    cnpj_orgao_repassador_plano_acao: Optional[str]
-    nome_orgao_repassador_plano_acao: Optional[str]
-    id_ente_repassador_plano_acao: Optional[int]
-    cnpj_ente_repassador_plano_acao: Optional[str]
-    nome_ente_repassador_plano_acao: Optional[str]
-    uf_ente_repassador_plano_acao: Optional[str]
-    nome_municipio_ente_repassador_plano_acao: Optional[str]
-    codigo_ibge_municipio_ente_repassador_plano_acao: Optional[int]
-    id_ente_recebedor_plano_acao: Optional[int]
-    cnpj_ente_recebedor_plano_acao: Optional[str]
-    nome_ente_recebedor_plano_acao: Optional[str]
-    uf_ente_recebedor_plano_acao: Optional[str]
-    nome_municipio_ente_recebedor_plano_acao: Optional[str]
-    codigo_ibge_municipio_ente_recebedor_plano_acao: Optional[int]
-    id_fundo_repassador_plano_acao: Optional[int]
-    cnpj_fundo_repassador_plano_acao: Optional[str]
-    nome_fundo_repassador_plano_acao: Optional[str]
-    uf_fundo_repassador_plano_acao: Optional[str]
-    municipio_fundo_repassador_plano_acao: Optional[str]
-    codigo_ibge_fundo_repassador_plano_acao: Optional[int]
-    id_fundo_recebedor_plano_acao: Optional[int]
-    cnpj_fundo_recebedor_plano_acao: Optional[str]
-    nome_fundo_recebedor_plano_acao: Optional[str]
-    uf_fundo_recebedor_plano_acao: Optional[str]
-    municipio_fundo_recebedor_plano_acao: Optional[str]
-    codigo_ibge_fundo_recebedor_plano_acao: Optional[int]
-    id_programa: Optional[int]
+    id_plano_acao: Optional[int] = None
+    codigo_plano_acao: Optional[str] = None
+    data_inicio_vigencia_plano_acao: Optional[date] = None
+    data_fim_vigencia_plano_acao: Optional[date] = None
+    diagnostico_plano_acao: Optional[str] = None
+    objetivos_plano_acao: Optional[str] = None
+    situacao_plano_acao: Optional[str] = None
+    valor_repasse_emenda_plano_acao: Optional[float] = None
+    valor_repasse_especifico_plano_acao: Optional[float] = None
+    valor_repasse_voluntario_plano_acao: Optional[float] = None
+    valor_total_repasse_plano_acao: Optional[float] = None
+    valor_recursos_proprios_plano_acao: Optional[float] = None
+    valor_outros_plano_acao: Optional[float] = None
+    valor_rendimentos_aplicacao_plano_acao: Optional[float] = None
+    valor_total_plano_acao: Optional[float] = None
+    valor_total_investimento_plano_acao: Optional[float] = None
+    valor_total_custeio_plano_acao: Optional[float] = None
+    valor_saldo_disponivel_plano_acao: Optional[float] = None
+    id_orgao_repassador_plano_acao: Optional[int] = None
+    sigla_orgao_repassador_plano_acao: Optional[str] = None
+    cnpj_orgao_repassador_plano_acao: Optional[str] = None
+    nome_orgao_repassador_plano_acao: Optional[str] = None
+    id_ente_repassador_plano_acao: Optional[int] = None
+    cnpj_ente_repassador_plano_acao: Optional[str] = None
+    nome_ente_repassador_plano_acao: Optional[str] = None
+    uf_ente_repassador_plano_acao: Optional[str] = None
+    nome_municipio_ente_repassador_plano_acao: Optional[str] = None
+    codigo_ibge_municipio_ente_repassador_plano_acao: Optional[int] = None
+    id_ente_recebedor_plano_acao: Optional[int] = None
+    cnpj_ente_recebedor_plano_acao: Optional[str] = None
+    nome_ente_recebedor_plano_acao: Optional[str] = None
+    uf_ente_recebedor_plano_acao: Optional[str] = None
+    nome_municipio_ente_recebedor_plano_acao: Optional[str] = None
+    codigo_ibge_municipio_ente_recebedor_plano_acao: Optional[int] = None
+    id_fundo_repassador_plano_acao: Optional[int] = None
+    cnpj_fundo_repassador_plano_acao: Optional[str] = None
+    nome_fundo_repassador_plano_acao: Optional[str] = None
+    uf_fundo_repassador_plano_acao: Optional[str] = None
+    municipio_fundo_repassador_plano_acao: Optional[str] = None
+    codigo_ibge_fundo_repassador_plano_acao: Optional[int] = None
+    id_fundo_recebedor_plano_acao: Optional[int] = None
+    cnpj_fundo_recebedor_plano_acao: Optional[str] = None
+    nome_fundo_recebedor_plano_acao: Optional[str] = None
+    uf_fundo_recebedor_plano_acao: Optional[str] = None
+    municipio_fundo_recebedor_plano_acao: Optional[str] = None
+    codigo_ibge_fundo_recebedor_plano_acao: Optional[int] = None
+    id_programa: Optional[int] = None
+
+    # Relações filhas incorporadas pelo parâmetro expandir
+    empenhos: Optional[List["EmpenhoResponse"]] = None
+    analises: Optional[List["PlanoAcaoAnaliseResponse"]] = None
+    dados_bancarios: Optional[List["PlanoAcaoDadoBancarioResponse"]] = None
+    destinacoes_recursos: Optional[List["PlanoAcaoDestinacaoRecursosResponse"]] = None
+    historicos: Optional[List["PlanoAcaoHistoricoResponse"]] = None
+    metas: Optional[List["PlanoAcaoMetaResponse"]] = None
+    relatorios_gestao: Optional[List["RelatorioGestaoResponse"]] = None
+    termos_adesao: Optional[List["TermoAdesaoResponse"]] = None
 
 
 class PaginatedPlanoAcaoResponse(PaginatedResponseTemplate):
     data: List[PlanoAcaoResponse]
 
 
+class PlanoAcaoResumoResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
+
+    id_plano_acao: Optional[int] = None
+    codigo_plano_acao: Optional[str] = None
+    situacao_plano_acao: Optional[str] = None
+    uf_ente_recebedor_plano_acao: Optional[str] = None
+    codigo_ibge_municipio_ente_recebedor_plano_acao: Optional[int] = None
+    valor_total_plano_acao: Optional[float] = None
+    quantidade_empenhos_plano_acao: Optional[int] = None
+    valor_total_empenhado_plano_acao: Optional[float] = None
+    quantidade_lancamentos_plano_acao: Optional[int] = None
+    valor_total_lancamentos_plano_acao: Optional[float] = None
+    quantidade_metas_plano_acao: Optional[int] = None
+    quantidade_relatorios_gestao_plano_acao: Optional[int] = None
+    data_atualizacao_resumo_plano_acao: Optional[datetime] = None
+    id_programa: Optional[int] = None
+
+
+class PaginatedPlanoAcaoResumoResponse(PaginatedResponseTemplate):
+    data: List[PlanoAcaoResumoResponse]
+
+
 class PlanoAcaoAnaliseResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
     
-    id_analise_plano_acao: Optional[int]
-    tipo_analise_plano_acao: Optional[str]
-    tipo_analise_resultado_plano_acao: Optional[str]
-    data_analise_plano_acao: Optional[date]
-    parecer_analise_plano_acao: Optional[str]
-    tipo_origem_analise_plano_acao: Optional[str]
-    id_plano_acao: Optional[int]
-    id_historico_plano_acao: Optional[int]
+    id_analise_plano_acao: Optional[int] = None
+    tipo_analise_plano_acao: Optional[str] = None
+    tipo_analise_resultado_plano_acao: Optional[str] = None
+    data_analise_plano_acao: Optional[date] = None
+    parecer_analise_plano_acao: Optional[str] = None
+    tipo_origem_analise_plano_acao: Optional[str] = None
+    id_plano_acao: Optional[int] = None
+    id_historico_plano_acao: Optional[int] = None
+
+    # Relações filhas incorporadas pelo parâmetro expandir
+    responsaveis: Optional[List["PlanoAcaoAnaliseResponsavelResponse"]] = None
 
 
 class PaginatedPlanoAcaoAnaliseResponse(PaginatedResponseTemplate):
@@ -212,9 +250,9 @@ class PaginatedPlanoAcaoAnaliseResponse(PaginatedResponseTemplate):
 class PlanoAcaoAnaliseResponsavelResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid", populate_by_name=True)
     
-    plano_acao_analise_fk: Optional[int] = Field(alias="id_analise_plano_acao")
-    nome_responsavel_analise_plano_acao: Optional[str]
-    cargo_responsavel_analise_plano_acao: Optional[str]
+    plano_acao_analise_fk: Optional[int] = Field(default=None, alias="id_analise_plano_acao")
+    nome_responsavel_analise_plano_acao: Optional[str] = None
+    cargo_responsavel_analise_plano_acao: Optional[str] = None
 
 
 class PaginatedPlanoAcaoAnaliseResponsavelResponse(PaginatedResponseTemplate):
@@ -224,19 +262,19 @@ class PaginatedPlanoAcaoAnaliseResponsavelResponse(PaginatedResponseTemplate):
 class PlanoAcaoDadoBancarioResponse(BaseModel):  
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_plano_acao_dado_bancario: Optional[int]
-    id_agencia_conta: Optional[str]
-    codigo_banco_plano_acao_dado_bancario: Optional[int]
-    nome_banco_plano_acao_dado_bancario: Optional[str]
-    numero_agencia_plano_acao_dado_bancario: Optional[int]
-    dv_agencia_plano_acao_dado_bancario: Optional[str]
-    numero_conta_plano_acao_dado_bancario: Optional[int]
-    dv_conta_plano_acao_dado_bancario: Optional[str]
-    situacao_conta_plano_acao_dado_bancario: Optional[str]
-    data_abertura_conta_plano_acao_dado_bancario: Optional[date]
-    nome_programa_agil_conta_plano_acao_dado_bancario: Optional[str]
-    saldo_final_conta_plano_acao_dado_bancario: Optional[float]
-    id_plano_acao: Optional[int]
+    id_plano_acao_dado_bancario: Optional[int] = None
+    id_agencia_conta: Optional[str] = None
+    codigo_banco_plano_acao_dado_bancario: Optional[int] = None
+    nome_banco_plano_acao_dado_bancario: Optional[str] = None
+    numero_agencia_plano_acao_dado_bancario: Optional[int] = None
+    dv_agencia_plano_acao_dado_bancario: Optional[str] = None
+    numero_conta_plano_acao_dado_bancario: Optional[int] = None
+    dv_conta_plano_acao_dado_bancario: Optional[str] = None
+    situacao_conta_plano_acao_dado_bancario: Optional[str] = None
+    data_abertura_conta_plano_acao_dado_bancario: Optional[date] = None
+    nome_programa_agil_conta_plano_acao_dado_bancario: Optional[str] = None
+    saldo_final_conta_plano_acao_dado_bancario: Optional[float] = None
+    id_plano_acao: Optional[int] = None
 
 
 class PaginatedPlanoAcaoDadoBancarioResponse(PaginatedResponseTemplate):
@@ -246,12 +284,12 @@ class PaginatedPlanoAcaoDadoBancarioResponse(PaginatedResponseTemplate):
 class PlanoAcaoDestinacaoRecursosResponse(BaseModel):  
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_destinacao_recursos_plano_acao: Optional[int]
-    codigo_natureza_despesa_destinacao_recursos_plano_acao: Optional[str]
-    descricao_natureza_despesa_destinacao_recursos_plano_acao: Optional[str]
-    tipo_despesa_destinacao_recursos_plano_acao: Optional[str]
-    valor_destinacao_recursos_plano_acao: Optional[float]
-    id_plano_acao: Optional[int]
+    id_destinacao_recursos_plano_acao: Optional[int] = None
+    codigo_natureza_despesa_destinacao_recursos_plano_acao: Optional[str] = None
+    descricao_natureza_despesa_destinacao_recursos_plano_acao: Optional[str] = None
+    tipo_despesa_destinacao_recursos_plano_acao: Optional[str] = None
+    valor_destinacao_recursos_plano_acao: Optional[float] = None
+    id_plano_acao: Optional[int] = None
 
 
 class PaginatedPlanoAcaoDestinacaoRecursosResponse(PaginatedResponseTemplate):
@@ -261,11 +299,11 @@ class PaginatedPlanoAcaoDestinacaoRecursosResponse(PaginatedResponseTemplate):
 class PlanoAcaoHistoricoResponse(BaseModel):  
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_historico_plano_acao: Optional[int]
-    situacao_historico_plano_acao: Optional[str]
-    data_historico_plano_acao: Optional[date]
-    versao_historico_plano_acao: Optional[int]
-    id_plano_acao: Optional[int]
+    id_historico_plano_acao: Optional[int] = None
+    situacao_historico_plano_acao: Optional[str] = None
+    data_historico_plano_acao: Optional[date] = None
+    versao_historico_plano_acao: Optional[int] = None
+    id_plano_acao: Optional[int] = None
 
 
 class PaginatedPlanoAcaoHistoricoResponse(PaginatedResponseTemplate):
@@ -275,14 +313,17 @@ class PaginatedPlanoAcaoHistoricoResponse(PaginatedResponseTemplate):
 class PlanoAcaoMetaResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
     
-    id_meta_plano_acao: Optional[int]
-    numero_meta_plano_acao: Optional[str]
-    nome_meta_plano_acao: Optional[str]
-    descricao_meta_plano_acao: Optional[str]
-    valor_meta_plano_acao: Optional[float]
-    versao_meta_plano_acao: Optional[int]
-    sequencial_meta_plano_acao: Optional[int]
-    id_plano_acao: Optional[int]
+    id_meta_plano_acao: Optional[int] = None
+    numero_meta_plano_acao: Optional[str] = None
+    nome_meta_plano_acao: Optional[str] = None
+    descricao_meta_plano_acao: Optional[str] = None
+    valor_meta_plano_acao: Optional[float] = None
+    versao_meta_plano_acao: Optional[int] = None
+    sequencial_meta_plano_acao: Optional[int] = None
+    id_plano_acao: Optional[int] = None
+
+    # Relações filhas incorporadas pelo parâmetro expandir
+    acoes: Optional[List["PlanoAcaoMetaAcaoResponse"]] = None
 
 
 class PaginatedPlanoAcaoMetaResponse(PaginatedResponseTemplate):
@@ -292,14 +333,14 @@ class PaginatedPlanoAcaoMetaResponse(PaginatedResponseTemplate):
 class PlanoAcaoMetaAcaoResponse(BaseModel):  
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_acao_meta_plano_acao: Optional[int]
-    numero_acao_meta_plano_acao: Optional[str]
-    nome_acao_meta_plano_acao: Optional[str]
-    descricao_acao_meta_plano_acao: Optional[str]
-    valor_acao_meta_plano_acao: Optional[float]
-    versao_acao_meta_plano_acao: Optional[int]
-    sequencial_acao_meta_plano_acao: Optional[int]
-    id_meta_plano_acao: Optional[int]
+    id_acao_meta_plano_acao: Optional[int] = None
+    numero_acao_meta_plano_acao: Optional[str] = None
+    nome_acao_meta_plano_acao: Optional[str] = None
+    descricao_acao_meta_plano_acao: Optional[str] = None
+    valor_acao_meta_plano_acao: Optional[float] = None
+    versao_acao_meta_plano_acao: Optional[int] = None
+    sequencial_acao_meta_plano_acao: Optional[int] = None
+    id_meta_plano_acao: Optional[int] = None
 
 
 class PaginatedPlanoAcaoMetaAcaoResponse(PaginatedResponseTemplate):
@@ -309,40 +350,45 @@ class PaginatedPlanoAcaoMetaAcaoResponse(PaginatedResponseTemplate):
 class ProgramaResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
     
-    id_programa: Optional[int]
-    ano_programa: Optional[int]
-    modalidade_programa: Optional[str]
-    codigo_programa: Optional[str]
-    nome_programa: Optional[str]
-    id_unidade_gestora_programa: Optional[int]
-    nome_institucional_programa: Optional[str]
-    permite_transferencia_sem_fundo_programa: Optional[bool]
-    objetivo_programa: Optional[str]
-    descricao_programa: Optional[str]
-    situacao_programa: Optional[str]
-    valor_global_programa: Optional[float]
-    quantidade_parcelas_programa: Optional[int]
-    id_orgao_superior_programa: Optional[int]
-    sigla_orgao_superior_programa: Optional[str]
-    cnpj_orgao_superior_programa: Optional[str]
-    nome_orgao_superior_programa: Optional[str]
-    id_fundo_programa: Optional[int]
-    cnpj_fundo_programa: Optional[str]
-    nome_fundo_programa: Optional[str]
-    uf_fundo_programa: Optional[str]
-    municipio_fundo_programa: Optional[str]
-    codigo_ibge_fundo_programa: Optional[int]
-    grupo_natureza_despesa_programa: Optional[str]
-    codigo_descricao_orcamentaria_programa: Optional[str]
-    descricao_acao_orcamentaria_programa: Optional[str]
-    valor_acao_orcamentaria_programa: Optional[float]
-    data_inicio_recebimento_planos_acao_beneficiarios_especificos: Optional[date]
-    data_fim_recebimento_planos_acao_beneficiarios_especificos: Optional[date]
-    data_inicio_recebimento_planos_acao_beneficiarios_emendas: Optional[date]
-    data_fim_recebimento_planos_acao_beneficiarios_emendas: Optional[date]
-    data_inicio_recebimento_planos_acao_beneficiarios_voluntarios: Optional[date]
-    data_fim_recebimento_planos_acao_beneficiarios_voluntarios: Optional[date]
-    nome_gestao_agil_programa: Optional[str]
+    id_programa: Optional[int] = None
+    ano_programa: Optional[int] = None
+    modalidade_programa: Optional[str] = None
+    codigo_programa: Optional[str] = None
+    nome_programa: Optional[str] = None
+    id_unidade_gestora_programa: Optional[int] = None
+    nome_institucional_programa: Optional[str] = None
+    permite_transferencia_sem_fundo_programa: Optional[bool] = None
+    objetivo_programa: Optional[str] = None
+    descricao_programa: Optional[str] = None
+    situacao_programa: Optional[str] = None
+    valor_global_programa: Optional[float] = None
+    quantidade_parcelas_programa: Optional[int] = None
+    id_orgao_superior_programa: Optional[int] = None
+    sigla_orgao_superior_programa: Optional[str] = None
+    cnpj_orgao_superior_programa: Optional[str] = None
+    nome_orgao_superior_programa: Optional[str] = None
+    id_fundo_programa: Optional[int] = None
+    cnpj_fundo_programa: Optional[str] = None
+    nome_fundo_programa: Optional[str] = None
+    uf_fundo_programa: Optional[str] = None
+    municipio_fundo_programa: Optional[str] = None
+    codigo_ibge_fundo_programa: Optional[int] = None
+    grupo_natureza_despesa_programa: Optional[str] = None
+    codigo_descricao_orcamentaria_programa: Optional[str] = None
+    descricao_acao_orcamentaria_programa: Optional[str] = None
+    valor_acao_orcamentaria_programa: Optional[float] = None
+    data_inicio_recebimento_planos_acao_beneficiarios_especificos: Optional[date] = None
+    data_fim_recebimento_planos_acao_beneficiarios_especificos: Optional[date] = None
+    data_inicio_recebimento_planos_acao_beneficiarios_emendas: Optional[date] = None
+    data_fim_recebimento_planos_acao_beneficiarios_emendas: Optional[date] = None
+    data_inicio_recebimento_planos_acao_beneficiarios_voluntarios: Optional[date] = None
+    data_fim_recebimento_planos_acao_beneficiarios_voluntarios: Optional[date] = None
+    nome_gestao_agil_programa: Optional[str] = None
+
+    # Relações filhas incorporadas pelo parâmetro expandir
+    planos_acao: Optional[List["PlanoAcaoResponse"]] = None
+    beneficiarios: Optional[List["ProgramaBeneficiarioResponse"]] = None
+    programas_gestao_agil: Optional[List["ProgramaGestaoAgilResponse"]] = None
 
 
 class PaginatedProgramaResponse(PaginatedResponseTemplate):
@@ -352,15 +398,15 @@ class PaginatedProgramaResponse(PaginatedResponseTemplate):
 class ProgramaBeneficiarioResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_beneficiario_programa: Optional[int]
-    cnpj_beneficiario_programa: Optional[str]
-    nome_beneficiario_programa: Optional[str]
-    valor_beneficiario_programa: Optional[float]
-    numero_emenda_beneficiario_programa: Optional[str]
-    nome_parlamentar_beneficiario_programa: Optional[str]
-    tipo_beneficiario_programa: Optional[str]
-    uf_beneficiario_programa: Optional[str]
-    id_programa: Optional[int]
+    id_beneficiario_programa: Optional[int] = None
+    cnpj_beneficiario_programa: Optional[str] = None
+    nome_beneficiario_programa: Optional[str] = None
+    valor_beneficiario_programa: Optional[float] = None
+    numero_emenda_beneficiario_programa: Optional[str] = None
+    nome_parlamentar_beneficiario_programa: Optional[str] = None
+    tipo_beneficiario_programa: Optional[str] = None
+    uf_beneficiario_programa: Optional[str] = None
+    id_programa: Optional[int] = None
 
 
 class PaginatedProgramaBeneficiarioResponse(PaginatedResponseTemplate):
@@ -370,15 +416,15 @@ class PaginatedProgramaBeneficiarioResponse(PaginatedResponseTemplate):
 class ProgramaGestaoAgilResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_programa_agil: Optional[int]
-    id_programa_agil_bb: Optional[int]
-    nome_programa_agil: Optional[str]
-    codigo_programa_agil: Optional[str]
-    codigo_siorg_orgao_programa_agil: Optional[int]
-    sigla_orgao_programa_agil: Optional[str]
-    cnpj_orgao_programa_agil: Optional[str]
-    nome_orgao_programa_agil: Optional[str]
-    id_programa: Optional[int]
+    id_programa_agil: Optional[int] = None
+    id_programa_agil_bb: Optional[int] = None
+    nome_programa_agil: Optional[str] = None
+    codigo_programa_agil: Optional[str] = None
+    codigo_siorg_orgao_programa_agil: Optional[int] = None
+    sigla_orgao_programa_agil: Optional[str] = None
+    cnpj_orgao_programa_agil: Optional[str] = None
+    nome_orgao_programa_agil: Optional[str] = None
+    id_programa: Optional[int] = None
 
 
 class PaginatedProgramaGestaoAgilResponse(PaginatedResponseTemplate):
@@ -388,19 +434,23 @@ class PaginatedProgramaGestaoAgilResponse(PaginatedResponseTemplate):
 class RelatorioGestaoResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_relatorio_gestao: Optional[int]
-    data_relatorio_gestao: Optional[date]
-    data_e_hora_relatorio_gestao: Optional[str]
-    tipo_relatorio_gestao: Optional[str]
-    situacao_relatorio_gestao: Optional[str]
-    valor_executado_relatorio_gestao: Optional[float]
-    valor_pendente_relatorio_gestao: Optional[float]
-    resultados_alcancados_metas_relatorio_gestao: Optional[str]
-    descritivo_relatorio_gestao: Optional[str]
-    contrapartida_relatorio_gestao: Optional[str]
-    endereco_eletronico_publicidade_acoes_relatorio_gestao: Optional[str]
-    declaracao_conformidade_relatorio_gestao: Optional[bool]
-    id_plano_acao: Optional[int]
+    id_relatorio_gestao: Optional[int] = None
+    data_relatorio_gestao: Optional[date] = None
+    data_e_hora_relatorio_gestao: Optional[str] = None
+    tipo_relatorio_gestao: Optional[str] = None
+    situacao_relatorio_gestao: Optional[str] = None
+    valor_executado_relatorio_gestao: Optional[float] = None
+    valor_pendente_relatorio_gestao: Optional[float] = None
+    resultados_alcancados_metas_relatorio_gestao: Optional[str] = None
+    descritivo_relatorio_gestao: Optional[str] = None
+    contrapartida_relatorio_gestao: Optional[str] = None
+    endereco_eletronico_publicidade_acoes_relatorio_gestao: Optional[str] = None
+    declaracao_conformidade_relatorio_gestao: Optional[bool] = None
+    id_plano_acao: Optional[int] = None
+
+    # Relações filhas incorporadas pelo parâmetro expandir
+    acoes: Optional[List["RelatorioGestaoAcoesResponse"]] = None
+    analises: Optional[List["RelatorioGestaoAnaliseResponse"]] = None
 
 
 class PaginatedRelatorioGestaoResponse(PaginatedResponseTemplate):
@@ -410,11 +460,11 @@ class PaginatedRelatorioGestaoResponse(PaginatedResponseTemplate):
 class RelatorioGestaoAcoesResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_acao_relatorio_gestao: Optional[int]
-    percentual_execucao_fisica_acao_relatorio_gestao_acao: Optional[str]
-    observacoes_justificativas_relatorio_gestao_acao: Optional[str]
-    id_relatorio_gestao: Optional[int]
-    id_acao_meta_plano_acao: Optional[int]
+    id_acao_relatorio_gestao: Optional[int] = None
+    percentual_execucao_fisica_acao_relatorio_gestao_acao: Optional[str] = None
+    observacoes_justificativas_relatorio_gestao_acao: Optional[str] = None
+    id_relatorio_gestao: Optional[int] = None
+    id_acao_meta_plano_acao: Optional[int] = None
 
 
 class PaginatedRelatorioGestaoAcoesResponse(PaginatedResponseTemplate):
@@ -424,14 +474,17 @@ class PaginatedRelatorioGestaoAcoesResponse(PaginatedResponseTemplate):
 class RelatorioGestaoAnaliseResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_relatorio_gestao_analise: Optional[int]
-    tipo_analise_relatorio_gestao_analise: Optional[str]
-    resultado_analise_relatorio_gestao_analise: Optional[str]
-    parecer_analise_relatorio_gestao_analise: Optional[str]
-    origem_analise_relatorio_gestao_analise: Optional[str]
-    data_analise_relatorio_gestao_analise: Optional[date]
-    versao_analise_relatorio_gestao_analise: Optional[int]
-    id_relatorio_gestao: Optional[int]
+    id_relatorio_gestao_analise: Optional[int] = None
+    tipo_analise_relatorio_gestao_analise: Optional[str] = None
+    resultado_analise_relatorio_gestao_analise: Optional[str] = None
+    parecer_analise_relatorio_gestao_analise: Optional[str] = None
+    origem_analise_relatorio_gestao_analise: Optional[str] = None
+    data_analise_relatorio_gestao_analise: Optional[date] = None
+    versao_analise_relatorio_gestao_analise: Optional[int] = None
+    id_relatorio_gestao: Optional[int] = None
+
+    # Relações filhas incorporadas pelo parâmetro expandir
+    responsaveis: Optional[List["RelatorioGestaoAnaliseResponsavelResponse"]] = None
 
 
 class PaginatedRelatorioGestaoAnaliseResponse(PaginatedResponseTemplate):
@@ -441,9 +494,9 @@ class PaginatedRelatorioGestaoAnaliseResponse(PaginatedResponseTemplate):
 class RelatorioGestaoAnaliseResponsavelResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid", populate_by_name=True)
 
-    relatorio_gestao_analise_fk: Optional[int] = Field(alias="id_relatorio_gestao_analise")
-    nome_responsavel_analise_relatorio_gestao_analise: Optional[str]
-    cargo_responsavel_analise_relatorio_gestao_analise: Optional[str]
+    relatorio_gestao_analise_fk: Optional[int] = Field(default=None, alias="id_relatorio_gestao_analise")
+    nome_responsavel_analise_relatorio_gestao_analise: Optional[str] = None
+    cargo_responsavel_analise_relatorio_gestao_analise: Optional[str] = None
 
 
 class PaginatedRelatorioGestaoAnaliseResponsavelResponse(PaginatedResponseTemplate):
@@ -453,16 +506,19 @@ class PaginatedRelatorioGestaoAnaliseResponsavelResponse(PaginatedResponseTempla
 class TermoAdesaoResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_termo_adesao: Optional[int]
-    numero_processo_termo_adesao: Optional[str]
-    situacao_termo_adesao: Optional[str]
-    objeto_termo_adesao: Optional[str]
-    data_assinatura_termo_adesao: Optional[date]
-    ano_termo_adesao: Optional[int]
-    secao_publicacao_dou_termo_adesao: Optional[int]
-    pagina_publicacao_dou_termo_adesao: Optional[int]
-    data_publicacao_dou_termo_adesao: Optional[date]
-    id_plano_acao: Optional[int]
+    id_termo_adesao: Optional[int] = None
+    numero_processo_termo_adesao: Optional[str] = None
+    situacao_termo_adesao: Optional[str] = None
+    objeto_termo_adesao: Optional[str] = None
+    data_assinatura_termo_adesao: Optional[date] = None
+    ano_termo_adesao: Optional[int] = None
+    secao_publicacao_dou_termo_adesao: Optional[int] = None
+    pagina_publicacao_dou_termo_adesao: Optional[int] = None
+    data_publicacao_dou_termo_adesao: Optional[date] = None
+    id_plano_acao: Optional[int] = None
+
+    # Relações filhas incorporadas pelo parâmetro expandir
+    historicos: Optional[List["TermoAdesaoHistoricoResponse"]] = None
 
 
 class PaginatedTermoAdesaoResponse(PaginatedResponseTemplate):
@@ -472,11 +528,61 @@ class PaginatedTermoAdesaoResponse(PaginatedResponseTemplate):
 class TermoAdesaoHistoricoResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True, extra="forbid")
 
-    id_historico_termo_adesao: Optional[int]
-    situacao_historico_termo_adesao: Optional[str]
-    data_historico_termo_adesao: Optional[date]
-    id_termo_adesao: Optional[int]
+    id_historico_termo_adesao: Optional[int] = None
+    situacao_historico_termo_adesao: Optional[str] = None
+    data_historico_termo_adesao: Optional[date] = None
+    id_termo_adesao: Optional[int] = None
 
 
 class PaginatedTermoAdesaoHistoricoResponse(PaginatedResponseTemplate):
-    data: List[TermoAdesaoHistoricoResponse]
\ No newline at end of file
+    data: List[TermoAdesaoHistoricoResponse]
+
+
+# Resolve as referências entre esquemas das relações expandidas
+PlanoAcaoResponse.model_rebuild()
+ProgramaResponse.model_rebuild()
+PlanoAcaoMetaResponse.model_rebuild()
+PlanoAcaoAnaliseResponse.model_rebuild()
+RelatorioGestaoResponse.model_rebuild()
+RelatorioGestaoAnaliseResponse.model_rebuild()
+TermoAdesaoResponse.model_rebuild()
+
+
+# Consultas em lote (POST /consultas)
+class ConsultaRequest(BaseModel):
+    endpoint: str = Field(description="Endpoint de consulta (ex.: plano_acao)")
+    parametros: Dict[str, Any] = Field(default_factory=dict, description="Parâmetros de consulta do endpoint (filtros, pagina, tamanho_da_pagina, ...)")
+
+
+class ConsultasRequest(BaseModel):
+    consultas: List[ConsultaRequest] = Field(min_length=1)
+
+
+class ConsultaResultado(BaseModel):
+    endpoint: str
+    status_code: int
+    resultado: Optional[Any] = None
+    erro: Optional[Any] = None
+
+
+class ConsultasResponse(BaseModel):
+    resultados: List[ConsultaResultado]
+
+
+# Agregações (GET /agregacao/{recurso})
+class ValoresAgregados(BaseModel):
+    soma: Optional[float] = None
+    minimo: Optional[float] = None
+    maximo: Optional[float] = None
+
+
+class GrupoAgregado(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    contagem: int
+    valores: Dict[str, ValoresAgregados]
+
+
+class AgregacaoResponse(BaseModel):
+    grupos: List[GrupoAgregado]
+    total_grupos: int
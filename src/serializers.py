@@ -0,0 +1,188 @@
+from functools import lru_cache, wraps
+from operator import attrgetter, itemgetter
+from typing import Union, get_args, get_origin
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+import orjson
+from src.schemas import PaginatedResponseTemplate
+
+
+# Planos de leitura mantidos por schema (classes de modelo e conjuntos de chaves dos dicionários)
+MAXIMO_PLANOS = 1024
+
+
+class ItemSerializer:
+    """
+    Conversão pré-compilada dos registros da lista paginada no dicionário que a validação e a
+    serialização do pydantic produziriam com o schema do registro (from_attributes, by_alias e
+    exclude_unset): campos na ordem do schema, chave pelo alias, valores float convertidos e
+    somente os campos presentes no registro (as relações de expandir existem apenas nos dicionários).
+    Um plano de leitura é compilado por classe de modelo ou por conjunto de chaves dos dicionários
+    """
+    def __init__(self, schema: type):
+        self.schema = schema
+        populate_by_name = schema.model_config.get("populate_by_name", False)
+        self.fields = []
+        for name, info in schema.model_fields.items():
+            key = info.alias or name
+            # attribute or key read from the record: the alias first, then the field name
+            sources = (key, name) if populate_by_name and key != name else (key,)
+            self.fields.append((key, sources, field_kind(info.annotation)))
+        self.plans = {}
+
+    def compile(self, available) -> tuple:
+        """
+        Plano de leitura dos campos disponíveis no registro: chaves de saída, atributos ou chaves
+        lidos, posições dos campos float e posições e schemas das relações
+        """
+        keys, sources, floats, nested = [], [], [], []
+        for key, candidates, kind in self.fields:
+            source = next((source for source in candidates if available(source, kind)), None)
+            if source is None:
+                continue
+            if kind is float:
+                floats.append(len(keys))
+            elif is_schema(kind):
+                nested.append((len(keys), kind))
+            keys.append(key)
+            sources.append(source)
+        return tuple(keys), tuple(sources), tuple(floats), tuple(nested)
+
+    def instance_plan(self, cls) -> tuple:
+        keys, sources, floats, nested = self.compile(lambda source, kind: not is_schema(kind) and hasattr(cls, source))
+        # loaded column values live in the instance __dict__, read without the ORM descriptors
+        return keys, getter(itemgetter, sources), getter(attrgetter, sources), floats
+
+    def dict_plan(self, shape: tuple) -> tuple:
+        present = set(shape)
+        keys, sources, floats, nested = self.compile(lambda source, kind: source in present)
+        return keys, getter(itemgetter, sources), floats, nested
+
+    def from_instance(self, obj) -> dict:
+        plan = self.plans.get(obj.__class__)
+        if plan is None:
+            plan = self.plans[obj.__class__] = self.instance_plan(obj.__class__)
+        keys, get_loaded, get_attributes, floats = plan
+        try:
+            values = get_loaded(obj.__dict__)
+        except KeyError:
+            # expired or deferred attribute: loaded through the ORM
+            values = get_attributes(obj)
+        if floats:
+            values = as_float(values, floats)
+        return dict(zip(keys, values))
+
+    def from_dict(self, item: dict) -> dict:
+        shape = tuple(item)
+        plan = self.plans.get(shape)
+        if plan is None:
+            if len(self.plans) >= MAXIMO_PLANOS:
+                # shapes depend on the campos requested: bounded like the statement cache
+                self.plans.clear()
+            plan = self.plans[shape] = self.dict_plan(shape)
+        keys, get, floats, nested = plan
+        values = get(item)
+        if floats:
+            values = as_float(values, floats)
+        if nested:
+            values = list(values)
+            for i, schema in nested:
+                if values[i] is not None:
+                    serializer = item_serializer(schema)
+                    values[i] = [serializer.convert(child) for child in values[i]]
+        return dict(zip(keys, values))
+
+    def convert(self, item) -> dict:
+        return self.from_dict(item) if isinstance(item, dict) else self.from_instance(item)
+
+
+def getter(kind, sources: tuple):
+    """
+    itemgetter/attrgetter que sempre retorna tupla, inclusive com um único campo
+    """
+    if len(sources) == 1:
+        get = kind(sources[0])
+        return lambda record: (get(record),)
+    if not sources:
+        return lambda record: ()
+    return kind(*sources)
+
+
+def as_float(values: tuple, floats: tuple) -> tuple:
+    """
+    Converte para float os valores dos campos float (ex.: inteiros), como faz a validação do pydantic
+    """
+    for i in floats:
+        value = values[i]
+        if value is not None and value.__class__ is not float:
+            values = list(values)
+            for j in floats:
+                if values[j] is not None:
+                    values[j] = float(values[j])
+            return values
+    return values
+
+
+def is_schema(kind) -> bool:
+    return isinstance(kind, type) and issubclass(kind, BaseModel)
+
+
+def field_kind(annotation):
+    """
+    Tipo do campo sem Optional: o tipo escalar ou, nas relações (List[Schema]), o schema dos registros filhos
+    """
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if get_origin(annotation) is list:
+        return get_args(annotation)[0]
+    return annotation
+
+
+@lru_cache(maxsize=None)
+def item_serializer(schema: type) -> ItemSerializer:
+    return ItemSerializer(schema)
+
+
+class PageSerializer:
+    """
+    Serialização da lista paginada (PaginatedResponseTemplate) pelo schema de resposta da rota,
+    direto para bytes JSON com orjson, sem a nova validação do response_model pelo FastAPI
+    """
+    def __init__(self, response_model: type):
+        self.response_model = response_model
+        self.items = item_serializer(field_kind(response_model.model_fields["data"].annotation))
+        self.fields = tuple(name for name in response_model.model_fields if name != "data")
+
+    def content(self, page: PaginatedResponseTemplate) -> dict:
+        content = {"data": [self.items.convert(item) for item in page.data]}
+        for name in self.fields:
+            content[name] = getattr(page, name)
+        return content
+
+    def render(self, page: PaginatedResponseTemplate) -> bytes:
+        # OPT_UTC_Z: UTC datetimes end in Z, as serialized by pydantic
+        return orjson.dumps(self.content(page), option=orjson.OPT_UTC_Z)
+
+
+@lru_cache(maxsize=None)
+def page_serializer(response_model: type) -> PageSerializer:
+    return PageSerializer(response_model)
+
+
+def fast_response(response_model: type):
+    """
+    Decorador das rotas de lista paginada: a página retornada pela rota (ou pelo cache) é convertida
+    em bytes JSON pela conversão pré-compilada do response_model, e o FastAPI repassa a resposta
+    sem validá-la e serializá-la novamente. O response_model declarado na rota continua documentando a resposta
+    """
+    serializer = page_serializer(response_model)
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            result = await func(*args, **kwargs)
+            if isinstance(result, PaginatedResponseTemplate):
+                return Response(content=serializer.render(result), media_type=ORJSONResponse.media_type)
+            return result
+        return wrapper
+    return decorator
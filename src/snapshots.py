@@ -0,0 +1,241 @@
+"""
+Snapshots Parquet de todas as tabelas dos modelos, servidos como arquivos estáticos em /arquivos.
+
+Job executado fora da aplicação (ex.: diariamente pelo cron), a partir da raiz do projeto:
+    python -m src.snapshots
+
+Cada execução grava uma nova geração em SNAPSHOT_DIR/<geração>/<tabela>/..., particionada por mês
+nas tabelas de SNAPSHOT_PARTITIONS, e substitui atomicamente o SNAPSHOT_DIR/manifest.json
+(arquivos, registros, tamanhos, sha256 e data de geração). As gerações anteriores são removidas,
+mantendo SNAPSHOT_KEEP gerações para os downloads em andamento
+"""
+from datetime import date, datetime, timezone
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlmodel import select
+from src.exports import exportable_models
+from src.filters import column_type
+from src.summaries import materialized_tables
+from appconfig import Settings
+
+logger = logging.getLogger(__name__)
+config = Settings()
+
+MANIFESTO = "manifest.json"
+SEM_DATA = "sem_data"
+
+# Tipos Arrow das colunas, pelo tipo Python declarado no modelo
+TIPOS_ARROW = {
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    bool: pa.bool_(),
+    date: pa.date32(),
+    datetime: pa.timestamp("us"),
+}
+
+
+def arrow_schema(model) -> pa.Schema:
+    return pa.schema([pa.field(column.name, TIPOS_ARROW[column_type(model, column)], nullable=True)
+                      for column in model.__table__.columns])
+
+
+def snapshot_statement(model, partition_column):
+    """
+    Todas as colunas da tabela, ordenadas pela coluna de partição (uma partição por vez) e pela chave primária
+    """
+    table = model.__table__
+    order = ([table.c[partition_column]] if partition_column else []) + list(table.primary_key.columns)
+    return select(*table.columns).order_by(*order)
+
+
+def partition_name(value) -> str:
+    return value.strftime("%Y-%m") if value is not None else SEM_DATA
+
+
+def file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PartitionWriter:
+    """
+    Grava os lotes de registros nos arquivos Parquet da tabela, abrindo um novo arquivo
+    a cada mudança de partição (os registros chegam ordenados pela coluna de partição)
+    """
+    def __init__(self, root: str, generation: str, table: str, schema: pa.Schema, partition_column):
+        self.root = root
+        self.generation = generation
+        self.table = table
+        self.schema = schema
+        self.partition_column = partition_column
+        self.partition = None
+        self.writer = None
+        self.path = None
+        self.rows = 0
+        self.files = []
+
+    def relative_path(self, partition) -> str:
+        name = f"mes={partition}.parquet" if self.partition_column else f"{self.table}.parquet"
+        return os.path.join(self.generation, self.table, name)
+
+    def open(self, partition) -> None:
+        self.close()
+        self.partition = partition
+        self.path = self.relative_path(partition)
+        os.makedirs(os.path.dirname(os.path.join(self.root, self.path)), exist_ok=True)
+        self.writer = pq.ParquetWriter(os.path.join(self.root, self.path), self.schema, compression=config.SNAPSHOT_COMPRESSION)
+
+    def write(self, rows) -> None:
+        if self.writer is None:
+            self.open(None)
+        columns = list(zip(*rows))
+        batch = pa.RecordBatch.from_arrays([pa.array(values, type=field.type) for values, field in zip(columns, self.schema)],
+                                           schema=self.schema)
+        self.writer.write_batch(batch)
+        self.rows += len(rows)
+
+    def write_rows(self, rows) -> None:
+        if not self.partition_column:
+            self.write(rows)
+            return
+        index = self.schema.get_field_index(self.partition_column)
+        start = 0
+        for i, row in enumerate(rows):
+            partition = partition_name(row[index])
+            if partition != self.partition:
+                if i > start:
+                    self.write(rows[start:i])
+                self.open(partition)
+                start = i
+        if start < len(rows):
+            self.write(rows[start:])
+
+    def close(self) -> None:
+        if self.writer is None:
+            return
+        self.writer.close()
+        full_path = os.path.join(self.root, self.path)
+        self.files.append({
+            "caminho": self.path.replace(os.sep, "/"),
+            "particao": self.partition,
+            "registros": self.rows,
+            "bytes": os.path.getsize(full_path),
+            "sha256": file_digest(full_path),
+        })
+        self.writer = None
+        self.rows = 0
+
+
+async def snapshot_table(dbsession: AsyncSession, model, root: str, generation: str) -> dict:
+    """
+    Grava a tabela em Parquet a partir de um cursor no servidor, SNAPSHOT_BATCH_SIZE registros por lote
+    """
+    table = model.__tablename__
+    partition_column = config.SNAPSHOT_PARTITIONS.get(table)
+    writer = PartitionWriter(root, generation, table, arrow_schema(model), partition_column)
+    result = await dbsession.stream(snapshot_statement(model, partition_column),
+                                    execution_options={"yield_per": config.SNAPSHOT_BATCH_SIZE})
+    async for rows in result.partitions():
+        writer.write_rows(rows)
+    if writer.writer is None and not writer.files:
+        # empty table: a file with the schema only
+        writer.open(None if not partition_column else SEM_DATA)
+    writer.close()
+    logger.info(f"Tabela {table}: {sum(f['registros'] for f in writer.files)} registros em {len(writer.files)} arquivo(s)")
+    return {
+        "registros": sum(f["registros"] for f in writer.files),
+        "particionada_por": partition_column,
+        "arquivos": writer.files,
+    }
+
+
+def write_manifest(root: str, manifest: dict) -> None:
+    """
+    Grava o manifesto atomicamente (arquivo temporário + rename)
+    """
+    temporary = os.path.join(root, f".{MANIFESTO}.tmp")
+    with open(temporary, "wb") as f:
+        f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    os.replace(temporary, os.path.join(root, MANIFESTO))
+
+
+def remove_old_generations(root: str, keep: int) -> None:
+    generations = sorted(name for name in os.listdir(root)
+                         if os.path.isdir(os.path.join(root, name)) and not name.startswith("."))
+    for name in generations[:-keep]:
+        logger.info(f"Removendo geração {name}")
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+async def missing_summaries(engine) -> set:
+    """
+    Visões materializadas ainda não criadas (python -m src.summaries), que ficam fora do snapshot
+    """
+    def missing(connection):
+        inspector = inspect(connection)
+        return {table.name for table in materialized_tables() if not inspector.has_table(table.name, schema=table.schema)}
+    async with engine.connect() as conn:
+        return await conn.run_sync(missing)
+
+
+async def create_snapshots(engine=None) -> dict:
+    """
+    Gera os snapshots de todas as tabelas, lendo da réplica dedicada quando configurada
+    (ou do engine informado)
+    """
+    root = config.SNAPSHOT_DIR
+    os.makedirs(root, exist_ok=True)
+    started = datetime.now(timezone.utc)
+    generation = started.strftime("%Y%m%dT%H%M%SZ")
+    own_engine = engine is None
+    if own_engine:
+        engine = create_async_engine(config.DATABASE_DEDICATED_REPLICA_URL or config.DATABASE_URL)
+    tables = {}
+    try:
+        missing = await missing_summaries(engine)
+        for table, model in exportable_models().items():
+            if table in missing:
+                logger.warning(f"Visão materializada {table} não encontrada: tabela ignorada no snapshot")
+                continue
+            # one transaction per table, so each file is a consistent snapshot of its table
+            async with AsyncSession(engine) as dbsession:
+                tables[table] = await snapshot_table(dbsession, model, root, generation)
+        if not tables:
+            # never replace the published download list with an empty one
+            raise RuntimeError("Nenhuma tabela exportada: manifesto anterior mantido")
+    except BaseException:
+        shutil.rmtree(os.path.join(root, generation), ignore_errors=True)
+        raise
+    finally:
+        if own_engine:
+            await engine.dispose()
+
+    manifest = {
+        "geracao": generation,
+        "gerado_em": started.isoformat(),
+        "concluido_em": datetime.now(timezone.utc).isoformat(),
+        "formato": "parquet",
+        "compressao": config.SNAPSHOT_COMPRESSION,
+        "tabelas": tables,
+    }
+    write_manifest(root, manifest)
+    remove_old_generations(root, config.SNAPSHOT_KEEP)
+    return manifest
+
+
+if __name__ == "__main__":
+    # python -m src.snapshots
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(create_snapshots())
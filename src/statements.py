@@ -0,0 +1,47 @@
+from collections import OrderedDict, defaultdict
+from appconfig import Settings
+
+
+class StatementCache:
+    """
+    Cache LRU das instruções SQL já construídas pelas rotas de consulta, indexado pela
+    forma da consulta (modelo, filtros ativos, ordenação e modo de paginação).
+    Os valores dos filtros são passados como parâmetros na execução, de modo que consultas
+    de mesma forma reaproveitam a instrução, a compilação do SQLAlchemy e o
+    prepared statement do asyncpg no servidor
+    """
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._statements = OrderedDict()
+        self._stats = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+    def get(self, endpoint: str, key: tuple, build):
+        """
+        Retorna a instrução armazenada para a chave, construindo-a com build() na primeira vez
+        """
+        try:
+            statement = self._statements[key]
+            self._statements.move_to_end(key)
+            self._stats[endpoint]["hits"] += 1
+            return statement
+        except KeyError:
+            self._stats[endpoint]["misses"] += 1
+
+        statement = build()
+        self._statements[key] = statement
+        if len(self._statements) > self.maxsize:
+            self._statements.popitem(last=False)
+        return statement
+
+    def hit_rates(self) -> dict:
+        """
+        Acertos, faltas e taxa de acerto do cache por endpoint
+        """
+        rates = {}
+        for endpoint, stats in sorted(self._stats.items()):
+            total = stats["hits"] + stats["misses"]
+            rates[endpoint] = {**stats, "hit_rate": stats["hits"] / total if total > 0 else 0}
+        return rates
+
+
+statement_cache = StatementCache(maxsize=Settings().STATEMENT_CACHE_SIZE)
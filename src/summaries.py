@@ -0,0 +1,129 @@
+from sqlalchemy import func, literal_column
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from src import models
+from appconfig import Settings
+import logging
+import asyncio
+
+logger = logging.getLogger(__name__)
+
+
+def materialized_tables() -> list:
+    """
+    Tabelas dos modelos mantidas como visões materializadas (info "materializada")
+    """
+    return [table for table in SQLModel.metadata.sorted_tables if table.info.get("materializada")]
+
+
+def create_tables(connection) -> None:
+    """
+    create_all das tabelas dos modelos, exceto as visões materializadas
+    """
+    tables = [table for table in SQLModel.metadata.sorted_tables if not table.info.get("materializada")]
+    SQLModel.metadata.create_all(connection, tables=tables)
+
+
+def plano_acao_resumo_statement():
+    """
+    Resumo de execução por plano de ação: total empenhado (empenho), total dos lançamentos
+    da gestão financeira nas contas do plano (plano_acao_dado_bancario.id_agencia_conta)
+    e quantidade de metas e de relatórios de gestão.
+    Cada tabela filha é agregada antes da junção, para não multiplicar as linhas
+    """
+    empenhos = (select(models.Empenho.id_plano_acao,
+                       func.count().label("quantidade"),
+                       func.sum(models.Empenho.valor_empenho).label("valor"))
+                .group_by(models.Empenho.id_plano_acao)
+                .subquery())
+    # the same account may be listed more than once for a plano
+    contas = (select(models.PlanoAcaoDadoBancario.id_plano_acao, models.PlanoAcaoDadoBancario.id_agencia_conta)
+              .distinct()
+              .subquery())
+    lancamentos = (select(contas.c.id_plano_acao,
+                          func.count().label("quantidade"),
+                          func.sum(models.GestaoFinanceiraLancamentos.valor_lancamento_gestao_financeira).label("valor"))
+                   .join(models.GestaoFinanceiraLancamentos,
+                         models.GestaoFinanceiraLancamentos.id_agencia_conta == contas.c.id_agencia_conta)
+                   .group_by(contas.c.id_plano_acao)
+                   .subquery())
+    metas = (select(models.PlanoAcaoMeta.id_plano_acao, func.count().label("quantidade"))
+             .group_by(models.PlanoAcaoMeta.id_plano_acao)
+             .subquery())
+    relatorios = (select(models.RelatorioGestao.id_plano_acao, func.count().label("quantidade"))
+                  .group_by(models.RelatorioGestao.id_plano_acao)
+                  .subquery())
+
+    plano = models.PlanoAcao
+    return (select(plano.id_plano_acao,
+                   plano.codigo_plano_acao,
+                   plano.situacao_plano_acao,
+                   plano.uf_ente_recebedor_plano_acao,
+                   plano.codigo_ibge_municipio_ente_recebedor_plano_acao,
+                   plano.valor_total_plano_acao,
+                   func.coalesce(empenhos.c.quantidade, 0).label("quantidade_empenhos_plano_acao"),
+                   func.coalesce(empenhos.c.valor, 0).label("valor_total_empenhado_plano_acao"),
+                   func.coalesce(lancamentos.c.quantidade, 0).label("quantidade_lancamentos_plano_acao"),
+                   func.coalesce(lancamentos.c.valor, 0).label("valor_total_lancamentos_plano_acao"),
+                   func.coalesce(metas.c.quantidade, 0).label("quantidade_metas_plano_acao"),
+                   func.coalesce(relatorios.c.quantidade, 0).label("quantidade_relatorios_gestao_plano_acao"),
+                   literal_column("CURRENT_TIMESTAMP").label("data_atualizacao_resumo_plano_acao"),
+                   plano.id_programa)
+            .outerjoin(empenhos, empenhos.c.id_plano_acao == plano.id_plano_acao)
+            .outerjoin(lancamentos, lancamentos.c.id_plano_acao == plano.id_plano_acao)
+            .outerjoin(metas, metas.c.id_plano_acao == plano.id_plano_acao)
+            .outerjoin(relatorios, relatorios.c.id_plano_acao == plano.id_plano_acao))
+
+
+# Consulta de cada visão materializada, por tabela
+RESUMOS = {
+    models.PlanoAcaoResumo.__table__: plano_acao_resumo_statement,
+}
+
+
+def unique_index_name(table) -> str:
+    return f"ux_{table.name}"
+
+
+def create_summaries(connection) -> None:
+    """
+    Cria as visões materializadas ausentes, já populadas, com o índice único da chave
+    primária exigido pelo REFRESH MATERIALIZED VIEW CONCURRENTLY
+    """
+    if connection.dialect.name != "postgresql":
+        logger.warning(f"Visões materializadas não suportadas pelo banco de dados {connection.dialect.name}")
+        return
+    for table, statement in RESUMOS.items():
+        query = statement().compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        connection.exec_driver_sql(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {table.fullname} AS {query}")
+        keys = ", ".join(column.name for column in table.primary_key.columns)
+        connection.exec_driver_sql(f"CREATE UNIQUE INDEX IF NOT EXISTS {unique_index_name(table)} ON {table.fullname} ({keys})")
+
+
+def refresh_summaries(connection, concurrently: bool = True) -> None:
+    """
+    Atualiza as visões materializadas. Com concurrently=True as consultas às visões
+    não são bloqueadas durante a atualização
+    """
+    for table in RESUMOS:
+        logger.info(f"Atualizando visão materializada {table.fullname}")
+        connection.exec_driver_sql(f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrently else ''}{table.fullname}")
+
+
+async def provision_summaries() -> None:
+    """
+    Cria e atualiza as visões materializadas de resumo; executado após as cargas de dados
+    """
+    engine = create_async_engine(Settings().DATABASE_URL, isolation_level="AUTOCOMMIT")
+    try:
+        async with engine.connect() as conn:
+            await conn.run_sync(create_summaries)
+            await conn.run_sync(refresh_summaries)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    # python -m src.summaries
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(provision_summaries())
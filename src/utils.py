@@ -1,12 +1,26 @@
+from contextlib import aclosing
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import AsyncGenerator
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy import inspect, tuple_, bindparam, true, Integer
+from sqlalchemy.orm import aliased
+from typing import AsyncGenerator, Optional
 from sqlmodel import select, func
 from math import ceil
+from datetime import date
 import asyncio
+import base64
+import binascii
+import functools
+import hashlib
+import orjson
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi import Depends, HTTPException, status
 import secrets
 from appconfig import Settings
+from src.cache import cache
+from src.filters import FilteredQuery
+from src.statements import statement_cache
+from src.expansions import expand_items
 
 security_stats = HTTPBasic()
 config = Settings()
@@ -15,37 +29,355 @@ config = Settings()
 # Dependency to inject db sessions
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     from main import db    
-    async for session in db.get_db_session():
-        yield session
+    # aclosing: closing this generator also closes the session generator of the database
+    async with aclosing(db.get_db_session()) as sessions:
+        async for session in sessions:
+            yield session
 
 
-async def get_paginated_data(query: select, dbsession: AsyncSession, response_schema, current_page: int = 1, records_per_page: int = 10):
-    # Prepare the query for execution
-    query.execution_options(prepared=True)
+# Dependency to inject db sessions pinned to the dedicated replica (heavy aggregation/export queries)
+async def get_dedicated_session() -> AsyncGenerator[AsyncSession, None]:
+    from main import db
+    async with aclosing(db.get_db_session(dedicated=True)) as sessions:
+        async for session in sessions:
+            yield session
+
+
+def encode_cursor(values: list) -> str:
+    """
+    Gera o token opaco de paginação (keyset) a partir dos valores das colunas de ordenação
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, model, order_columns, order_spec: Optional[str] = None) -> list:
+    """
+    Recupera os valores das colunas de ordenação (coluna ordenada e chave primária) contidos
+    no token de paginação, validando a ordenação de origem, a quantidade e o tipo de cada valor
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_INVALID_CURSOR)
+
+    if order_spec is not None:
+        # cursors of a custom ordering carry it as first element
+        if not isinstance(values, list) or not values or values[0] != order_spec:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=config.ERROR_MESSAGE_INVALID_CURSOR)
+        values = values[1:]
+
+    if not isinstance(values, list) or len(values) != len(order_columns):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=config.ERROR_MESSAGE_INVALID_CURSOR)
+
+    decoded = []
+    for value, column in zip(values, order_columns):
+        expected_type = model.model_fields[column.name].annotation
+        try:
+            if expected_type is date and isinstance(value, str):
+                value = date.fromisoformat(value)
+            elif expected_type is float and isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=config.ERROR_MESSAGE_INVALID_CURSOR)
+        if isinstance(value, bool) or not isinstance(value, expected_type):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=config.ERROR_MESSAGE_INVALID_CURSOR)
+        decoded.append(value)
+    return decoded
+
+
+def order_columns(query: FilteredQuery, pk_columns) -> list:
+    """
+    Colunas de ordenação da consulta: a coluna de ordenar_por (quando informada)
+    seguida da chave primária, que desempata e torna a ordem determinística
+    """
+    if not query.order:
+        return list(pk_columns)
+    column = query.model.__table__.c[query.order[0]]
+    return [column] + [pk for pk in pk_columns if pk is not column]
+
+
+def order_spec(query: FilteredQuery) -> Optional[str]:
+    """
+    Ordenação solicitada no formato do parâmetro ordenar_por, registrada no cursor
+    """
+    if not query.order:
+        return None
+    name, descending = query.order
+    return f"-{name}" if descending else name
+
+
+def cached_statement(query: FilteredQuery, kind: str, build):
+    """
+    Instrução derivada da consulta filtrada (contagem, página, ...) armazenada no cache de instruções
+    """
+    return statement_cache.get(query.model.__tablename__, (kind, query.key, query.fields, query.order), build)
+
+
+def page_statement(statement: select, order_columns, descending: bool = False):
+    """
+    Página da consulta ordenada pelas colunas de ordenação, com limite e deslocamento parametrizados.
+    populate_existing sobrescreve instâncias já presentes na sessão em vez de selecioná-las novamente
+    """
+    return (statement.order_by(*[column.desc() if descending else column for column in order_columns])
+            .offset(bindparam("_deslocamento", type_=Integer))
+            .limit(bindparam("_limite", type_=Integer))
+            .execution_options(populate_existing=True))
+
+
+def keyset_statement(statement: select, order_columns, descending: bool = False):
+    """
+    Página da consulta a partir dos últimos valores vistos das colunas de ordenação (paginação por cursor)
+    """
+    last_seen = [bindparam(f"_cursor_{i}", type_=column.type) for i, column in enumerate(order_columns)]
+    if len(order_columns) == 1:
+        seen, bound = order_columns[0], last_seen[0]
+    else:
+        seen, bound = tuple_(*order_columns), tuple_(*last_seen)
+    seek = seen < bound if descending else seen > bound
+    return (statement.where(seek)
+            .order_by(*[column.desc() if descending else column for column in order_columns])
+            .limit(bindparam("_limite", type_=Integer))
+            .execution_options(populate_existing=True))
+
+
+def page_total_statement(query: FilteredQuery, order_columns, descending: bool = False):
+    """
+    Página da consulta junto com o total de registros do conjunto filtrado, em uma única instrução:
+    a contagem (subconsulta de uma linha) é unida à página por LEFT JOIN, de modo que o total é
+    retornado também quando a página solicitada está além do fim e não possui registros
+    """
+    total = select(func.count().label("total_records")).select_from(query.statement.subquery()).subquery("total")
+    page = page_statement(query.statement, order_columns, descending).subquery("pagina")
+    if query.fields:
+        # the primary key first: NULL only in the count row of a page past the end
+        key = query.model.__table__.primary_key.columns[0].name
+        columns = [page.c[key]] + [page.c[name] for name in query.fields if name != key]
+    else:
+        columns = [aliased(query.model, page)]
+    sort = [page.c[column.name] for column in order_columns]
+    return (select(*columns, total.c.total_records)
+            .select_from(total)
+            .outerjoin(page, true())
+            .order_by(*[column.desc() if descending else column for column in sort])
+            .execution_options(populate_existing=True))
+
+
+async def count_records(query: FilteredQuery, dbsession: AsyncSession) -> int:
+    """
+    Conta o total de registros retornados pela consulta filtrada
+    """
+    count_query = cached_statement(query, "contagem", lambda: select(func.count()).select_from(query.statement.subquery()))
+    return await dbsession.scalar(count_query, query.params)
+
+
+def query_cache_key(prefix: str, query: FilteredQuery) -> str:
+    """
+    Chave de cache de um resultado da consulta filtrada: tabela consultada e hash da forma da consulta com seus parâmetros
+    """
+    digest = hashlib.sha1(f"{query.key!r}|{sorted(query.params.items())!r}".encode()).hexdigest()
+    return f"{prefix}:{query.model.__tablename__}:{digest}"
+
+
+def count_cache_key(query: FilteredQuery) -> str:
+    """
+    Chave do cache de contagem
+    """
+    return query_cache_key("contagem", query)
+
+
+async def explain_query(query: FilteredQuery, dbsession: AsyncSession) -> dict:
+    """
+    Executa EXPLAIN (sem ANALYZE) da consulta e retorna o nó raiz do plano do PostgreSQL
+    """
+    dialect = dbsession.bind.dialect
+    compiled = cached_statement(query, f"explain_{dialect.name}", lambda: query.statement.compile(dialect=dialect))
+    values = {**compiled.params, **query.params}
+    params = tuple(values[name] for name in compiled.positiontup)
+    conn = await dbsession.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = orjson.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def query_estimates(query: FilteredQuery, dbsession: AsyncSession) -> dict:
+    """
+    Estimativas do planejador do PostgreSQL para a consulta filtrada (sem paginação):
+    total de registros e custo total. Armazenadas no cache por forma e valores da consulta
+    """
+    key = query_cache_key("plano", query)
+    estimates = await cache.get(key)
+    if estimates is None:
+        plan = await explain_query(query, dbsession)
+        estimates = {"linhas": int(plan["Plan Rows"]), "custo": float(plan["Total Cost"])}
+        await cache.set(key, estimates, expire=config.CACHE_TTL)
+    return estimates
+
+
+async def estimate_records(query: FilteredQuery, dbsession: AsyncSession) -> int:
+    """
+    Estimativa do total de registros da consulta filtrada, segundo o planejador do PostgreSQL
+    """
+    estimates = await query_estimates(query, dbsession)
+    return estimates["linhas"]
+
+
+def cost_budget(query: FilteredQuery) -> float:
+    """
+    Custo estimado máximo da consulta com contagem exata no endpoint (QUERY_COST_BUDGETS, por tabela).
+    Acima de QUERY_COST_REJECT_FACTOR vezes esse valor a consulta é recusada
+    """
+    return float(config.QUERY_COST_BUDGETS.get(query.model.__tablename__, config.QUERY_COST_BUDGET))
+
+
+def is_statement_timeout(error: DBAPIError) -> bool:
+    # 57014 query_canceled: raised by PostgreSQL when statement_timeout expires
+    return getattr(error.orig, "sqlstate", None) == "57014"
+
+
+def translate_statement_timeout(func):
+    """
+    Converte o cancelamento da consulta por statement_timeout em resposta 503 com mensagem clara,
+    em vez do erro interno genérico das rotas
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except DBAPIError as e:
+            if is_statement_timeout(e):
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                                    detail=config.ERROR_MESSAGE_QUERY_TIMEOUT)
+            raise
+    return wrapper
+
+
+def page_items(rows, query: FilteredQuery) -> list:
+    """
+    Registros da página: instâncias do modelo ou, com projeção de colunas, dicionários com os campos selecionados
+    """
+    if query.fields:
+        return [{name: row._mapping[name] for name in query.fields} for row in rows]
+    return [row[0] for row in rows]
+
+
+def item_value(item, name: str):
+    """
+    Valor de um campo do registro da página (instância do modelo ou dicionário projetado)
+    """
+    return item[name] if isinstance(item, dict) else getattr(item, name)
+
+
+async def fetch_page_with_total(statement: select, query: FilteredQuery, params: dict, dbsession: AsyncSession):
+    """
+    Recupera uma página da consulta junto com o total de registros do conjunto filtrado,
+    calculado pelo banco na mesma consulta (page_total_statement)
+    """
+    result = await dbsession.execute(statement, params)
+    rows = result.all()
+    if rows[0][0] is None:
+        # page past the end: only the count row, without a record
+        return [], rows[0].total_records
+    return page_items(rows, query), rows[0].total_records
+
+
+@translate_statement_timeout
+async def get_paginated_data(query: FilteredQuery, dbsession: AsyncSession, response_schema, current_page: int = 1, records_per_page: int = 10, cursor: Optional[str] = None, count_mode: str = "exata"):
     # Calculate the offset based on the current page and records per page
     offset = (current_page - 1) * records_per_page
 
-    # Query total number of records
-    count_query = select(func.count()).select_from(query.subquery())
-    total_records = await dbsession.scalar(count_query)
+    # Sort column (ordenar_por) followed by the primary key as tie-breaker,
+    # used for deterministic ordering and keyset pagination
+    model = query.model
+    sort_columns = order_columns(query, inspect(model).primary_key)
+    descending = bool(query.order) and query.order[1]
+
+    # Total number of records according to the requested count mode:
+    # exata - exact count, cached per filter set; estimada - planner estimate; nenhuma - not computed
+    total_records = None
+    count_key = None
+    if count_mode == "exata":
+        count_key = count_cache_key(query)
+        total_records = await cache.get(count_key)
+    elif count_mode == "estimada":
+        total_records = await estimate_records(query, dbsession)
+
+    # Cost guard, only when the exact count would run: planner estimate (EXPLAIN without ANALYZE)
+    # of the whole filtered set. Far above the endpoint budget the query is refused; above it the
+    # exact count is replaced by the estimate, cached under the count key so that the next
+    # requests of the filter set skip the EXPLAIN. Pages without count are LIMITed and not guarded
+    estimates = total_records if isinstance(total_records, dict) else None
+    if (estimates is None and count_key is not None and total_records is None
+            and config.QUERY_COST_GUARD and dbsession.bind.dialect.name == "postgresql"):
+        estimates = await query_estimates(query, dbsession)
+        if estimates["custo"] > cost_budget(query):
+            await cache.set(count_key, estimates, expire=config.CACHE_TTL)
+    if estimates is not None:
+        budget = cost_budget(query)
+        if estimates["custo"] > budget * config.QUERY_COST_REJECT_FACTOR:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                detail=config.ERROR_MESSAGE_QUERY_TOO_EXPENSIVE)
+        if estimates["custo"] > budget:
+            count_mode = "estimada"
+            count_key = None
+            total_records = estimates["linhas"]
+
+    # Query items ordered by primary key. One extra row is fetched to find out
+    # whether there is a next page. Statements come from the statement cache and
+    # filter values, limit, offset and cursor are passed as execution parameters
+    page_params = {**query.params, "_limite": records_per_page + 1}
+
+    if cursor is not None:
+        # Keyset mode: seek past the last seen key (constant cost per page).
+        # The seek predicate narrows the set, so the total comes from a separate count
+        last_seen = decode_cursor(cursor, model, sort_columns, order_spec(query))
+        page_params.update({f"_cursor_{i}": value for i, value in enumerate(last_seen)})
+        if count_key is not None and total_records is None:
+            total_records = await count_records(query, dbsession)
+            await cache.set(count_key, total_records, expire=config.CACHE_TTL)
+        items_query = cached_statement(query, "pagina_cursor", lambda: keyset_statement(query.statement, sort_columns, descending))
+        result = await dbsession.execute(items_query, page_params)
+        items = page_items(result.all(), query)
+    elif count_key is not None and total_records is None:
+        # Offset mode without a cached count: page rows and total number of records in one round trip
+        page_params["_deslocamento"] = offset
+        items_query = cached_statement(query, "pagina_total", lambda: page_total_statement(query, sort_columns, descending))
+        items, total_records = await fetch_page_with_total(items_query, query, page_params, dbsession)
+        await cache.set(count_key, total_records, expire=config.CACHE_TTL)
+    else:
+        page_params["_deslocamento"] = offset
+        items_query = cached_statement(query, "pagina", lambda: page_statement(query.statement, sort_columns, descending))
+        result = await dbsession.execute(items_query, page_params)
+        items = page_items(result.all(), query)
 
     # Calculate the last page number
-    last_page = ceil(total_records / records_per_page)
+    last_page = ceil(total_records / records_per_page) if total_records is not None else None
 
-    # Query items using the calculated offset and records per page
-    items_query = query.offset(offset).limit(records_per_page)
-    result = await dbsession.execute(items_query)            
-    items = result.scalars().all()    
+    next_cursor = None
+    if len(items) > records_per_page:
+        items = items[:records_per_page]
+        last_seen = [item_value(items[-1], column.name) for column in sort_columns]
+        next_cursor = encode_cursor([order_spec(query)] + last_seen if query.order else last_seen)
 
-    for item in items:
-        await dbsession.refresh(item)
+    # Embed the requested child relations (expandir), one IN query per relation for the whole page
+    if query.expand:
+        items = await expand_items(model, items, query.expand, dbsession)
           
     return response_schema(
             data=items,
             total_pages=last_page,
             total_items=total_records,
+            total_items_exact=count_mode == "exata",
             page_number=current_page,
-            page_size=min(len(items), total_records)
+            page_size=len(items),
+            next_cursor=next_cursor
         )
 
 
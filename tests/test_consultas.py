@@ -0,0 +1,35 @@
+import pytest
+from src import models
+from tests.conftest import record
+import main
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_sessions_are_closed_after_each_query(client):
+    response = await client.post("/consultas", json={"consultas": [
+        {"endpoint": "plano_acao", "parametros": {"id_plano_acao": 1}},
+        # no filter: the route raises HTTPException (400)
+        {"endpoint": "plano_acao", "parametros": {}},
+    ]})
+    assert response.status_code == 200, response.text
+    assert [resultado["status_code"] for resultado in response.json()["resultados"]] == [200, 400]
+    assert main.db.primary.total_sessions == 2
+    assert main.db.primary.active_sessions == 0
+
+
+async def test_repeated_queries_are_served_from_the_cache(client, session, statements):
+    session.add(record(models.PlanoAcao, 1))
+    await session.commit()
+    statements.clear()
+    consultas = {"consultas": [{"endpoint": "plano_acao", "parametros": {"id_plano_acao": 1}}]}
+    first = await client.post("/consultas", json=consultas)
+    assert len(statements) == 1
+    statements.clear()
+    second = await client.post("/consultas", json=consultas)
+    assert second.json() == first.json()
+    assert first.json()["resultados"][0]["resultado"]["total_items"] == 1
+    # the list route shares the cache entry of the batch query
+    response = await client.get("/plano_acao", params={"id_plano_acao": "1"})
+    assert response.json() == first.json()["resultados"][0]["resultado"]
+    assert statements == []
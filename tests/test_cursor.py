@@ -0,0 +1,80 @@
+import pytest
+from src import models
+from src.utils import encode_cursor
+from tests.conftest import record
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def planos(session):
+    for i in range(1, 12):
+        # repeated values: the primary key breaks the ties
+        session.add(record(models.PlanoAcao, i, id_programa=1, valor_total_plano_acao=float(i % 3 * 100)))
+    await session.commit()
+
+
+async def walk(client, path: str, params: dict) -> list:
+    """
+    Percorre todas as páginas pelo next_cursor, retornando as páginas recebidas
+    """
+    pages = []
+    cursor = None
+    while True:
+        response = await client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        content = response.json()
+        pages.append(content["data"])
+        cursor = content["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+async def test_walk_by_primary_key(client, planos):
+    pages = await walk(client, "/plano_acao", {"id_programa": "1", "tamanho_da_pagina": 4})
+    assert [len(page) for page in pages] == [4, 4, 3]
+    assert [item["id_plano_acao"] for page in pages for item in page] == list(range(1, 12))
+
+
+@pytest.mark.parametrize("descending", [False, True])
+async def test_walk_by_sort_column_with_primary_key_tie_breaker(client, planos, descending):
+    order = ("-" if descending else "") + "valor_total_plano_acao"
+    pages = await walk(client, "/plano_acao", {"id_programa": "1", "tamanho_da_pagina": 3, "ordenar_por": order})
+    keys = [(item["valor_total_plano_acao"], item["id_plano_acao"]) for page in pages for item in page]
+    assert keys == sorted(((i % 3 * 100.0, i) for i in range(1, 12)), reverse=descending)
+
+
+async def test_walk_with_composite_primary_key(client, session):
+    for i in range(1, 6):
+        session.add(record(models.PlanoAcaoAnaliseResponsavel, i, plano_acao_analise_fk=1,
+                           nome_responsavel_analise_plano_acao=f"nome_{i % 2}"))
+    await session.commit()
+    pages = await walk(client, "/plano_acao_analise_responsavel", {"id_analise_plano_acao": "1", "tamanho_da_pagina": 2})
+    keys = [(item["nome_responsavel_analise_plano_acao"], item["cargo_responsavel_analise_plano_acao"])
+            for page in pages for item in page]
+    assert len(pages) == 3
+    assert keys == sorted(keys) and len(set(keys)) == 5
+
+
+async def test_last_page_has_no_cursor(client, planos):
+    response = await client.get("/plano_acao", params={"id_programa": "1", "tamanho_da_pagina": 11})
+    assert response.json()["next_cursor"] is None
+    response = await client.get("/plano_acao", params={"id_programa": "1", "tamanho_da_pagina": 10})
+    assert response.json()["next_cursor"] is not None
+
+
+@pytest.mark.parametrize("params", [
+    # not base64/JSON
+    {"cursor": "!!!"},
+    # wrong number of values
+    {"cursor": encode_cursor([1, 2])},
+    # wrong type of value
+    {"cursor": encode_cursor(["1"])},
+    # cursor of another ordering
+    {"cursor": encode_cursor(["valor_total_plano_acao", 100.0, 1]), "ordenar_por": "-valor_total_plano_acao"},
+    # cursor of a custom ordering used without ordenar_por
+    {"cursor": encode_cursor(["valor_total_plano_acao", 100.0, 1])},
+])
+async def test_invalid_cursor_is_rejected(client, planos, params):
+    response = await client.get("/plano_acao", params={"id_programa": "1", **params})
+    assert response.status_code == 400
@@ -0,0 +1,48 @@
+import pytest
+from src import expansions, models
+from tests.conftest import record
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def plano_acao(session):
+    session.add(record(models.PlanoAcao, 1))
+    session.add(record(models.PlanoAcaoHistorico, 1, id_plano_acao=1))
+    session.add(record(models.PlanoAcaoHistorico, 2, id_plano_acao=1))
+    session.add(record(models.TermoAdesao, 1, id_plano_acao=1))
+    session.add(record(models.TermoAdesaoHistorico, 1, id_termo_adesao=1))
+    session.add(record(models.PlanoAcaoMeta, 1, id_plano_acao=1))
+    session.add(record(models.PlanoAcaoMetaAcao, 1, id_meta_plano_acao=1))
+    session.add(record(models.RelatorioGestao, 1, id_plano_acao=1))
+    session.add(record(models.RelatorioGestaoAcoes, 1, id_relatorio_gestao=1))
+    await session.commit()
+
+
+async def expanded(client, expandir: str) -> dict:
+    response = await client.get("/plano_acao", params={"id_plano_acao": "1", "expandir": expandir})
+    assert response.status_code == 200, response.text
+    return response.json()["data"][0]
+
+
+async def test_same_relation_name_on_different_models(client, plano_acao):
+    # the nested relation is expanded first, so its statement is the first one cached under the name
+    nested = await expanded(client, "termos_adesao.historicos")
+    assert [set(historico) for historico in nested["termos_adesao"][0]["historicos"]] == [set(models.TermoAdesaoHistorico.model_fields)]
+    historicos = (await expanded(client, "historicos"))["historicos"]
+    assert len(historicos) == 2
+    assert {historico["id_plano_acao"] for historico in historicos} == {1}
+
+    metas = await expanded(client, "metas.acoes")
+    relatorios = await expanded(client, "relatorios_gestao.acoes")
+    assert metas["metas"][0]["acoes"][0]["id_meta_plano_acao"] == 1
+    assert relatorios["relatorios_gestao"][0]["acoes"][0]["id_relatorio_gestao"] == 1
+
+
+async def test_expansion_over_the_row_limit_is_rejected(client, plano_acao, monkeypatch):
+    monkeypatch.setattr(expansions.config, "MAX_EXPANSION_ROWS", 2)
+    assert len((await expanded(client, "historicos"))["historicos"]) == 2
+    monkeypatch.setattr(expansions.config, "MAX_EXPANSION_ROWS", 1)
+    response = await client.get("/plano_acao", params={"id_plano_acao": "1", "expandir": "historicos", "tamanho_da_pagina": 5})
+    assert response.status_code == 400
+    assert response.json()["detail"] == expansions.config.ERROR_MESSAGE_TOO_MANY_EXPANSION_ROWS.format("historicos", 1)
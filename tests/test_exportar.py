@@ -0,0 +1,30 @@
+import pytest
+from src import exports, models
+from src.exports import compile_export
+from src.routers.exportar import export_stream
+from tests.conftest import record
+import main
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_export(client, session):
+    for i in range(1, 4):
+        session.add(record(models.PlanoAcao, i, id_programa=1))
+    await session.commit()
+    response = await client.get("/exportar/plano_acao", params={"formato": "csv", "campos": "codigo_plano_acao", "id_programa": "1"})
+    assert response.status_code == 200
+    assert response.text.splitlines() == ["id_plano_acao,codigo_plano_acao"] + [f"{i},codigo_plano_acao_{i}" for i in range(1, 4)]
+
+
+async def test_session_is_closed_when_the_client_disconnects(session, monkeypatch):
+    for i in range(1, 4):
+        session.add(record(models.PlanoAcao, i))
+    await session.commit()
+    monkeypatch.setattr(exports.config, "EXPORT_CHUNK_SIZE", 1)
+    stream = export_stream(compile_export(models.PlanoAcao, {}), "ndjson")
+    assert (await anext(stream)).startswith(b'{"id_plano_acao":1')
+    assert main.db.primary.active_sessions == 1
+    # client disconnected: the response closes the stream
+    await stream.aclose()
+    assert main.db.primary.active_sessions == 0
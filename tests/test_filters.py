@@ -0,0 +1,121 @@
+from datetime import date
+import pytest
+from fastapi import HTTPException
+from src import models
+from src.filters import (
+    active_filters, bind_values, compile_query, filter_value, parse_fields, parse_order,
+    FILTRO_DATA, FILTRO_DATA_ATE, FILTRO_DATA_DE, FILTRO_IGUAL, FILTRO_LISTA, FILTRO_MAX, FILTRO_MIN, FILTRO_TEXTO,
+)
+from src.utils import config
+from tests.conftest import record
+
+columns = models.PlanoAcao.__table__.c
+
+
+def test_active_filters_follow_the_table_column_order():
+    params = {"id_programa": "1", "valor_total_plano_acao_min": 10.0, "codigo_plano_acao": "x", "id_plano_acao": None}
+    active = active_filters(models.PlanoAcao, params)
+    assert [item.name for item in active] == ["codigo_plano_acao", "valor_total_plano_acao_min", "id_programa"]
+    assert [item.kind for item in active] == [FILTRO_IGUAL, FILTRO_MIN, FILTRO_IGUAL]
+
+
+def test_statement_shape_is_shared_between_values_and_parameter_order():
+    first = compile_query(models.PlanoAcao, {"id_programa": "1", "codigo_plano_acao": "a"})
+    second = compile_query(models.PlanoAcao, {"codigo_plano_acao": "b", "id_programa": "2"})
+    assert first.key == second.key
+    assert first.statement is second.statement
+    assert (first.params, second.params) == ({"codigo_plano_acao": "a", "id_programa": 1}, {"codigo_plano_acao": "b", "id_programa": 2})
+    # a list of values keeps the shape of the list filter, whatever the number of values
+    two = compile_query(models.PlanoAcao, {"id_programa": ["1,2"]})
+    three = compile_query(models.PlanoAcao, {"id_programa": ["1", "2,3"]})
+    assert two.statement is three.statement
+    assert two.key != compile_query(models.PlanoAcao, {"id_programa": ["1"]}).key
+
+
+def test_no_active_filter():
+    assert compile_query(models.PlanoAcao, {"id_programa": None, "campos": "codigo_plano_acao"}) is None
+
+
+@pytest.mark.parametrize("value, expected", [
+    (["1"], ("1", FILTRO_IGUAL)),
+    (["1,2", " 2 ", "3"], (["1", "2", "3"], FILTRO_LISTA)),
+    ([" , "], (None, FILTRO_IGUAL)),
+    ("1", ("1", FILTRO_IGUAL)),
+])
+def test_filter_value_splits_and_deduplicates(value, expected):
+    assert filter_value(models.PlanoAcao, columns.id_programa, "id_programa", FILTRO_IGUAL, value) == expected
+
+
+def test_filter_value_rejects_lists_on_other_columns_and_too_many_values():
+    with pytest.raises(HTTPException) as error:
+        filter_value(models.PlanoAcao, columns.uf_ente_recebedor_plano_acao, "uf_ente_recebedor_plano_acao", FILTRO_IGUAL, ["SP,RJ"])
+    assert error.value.status_code == 400
+    too_many = [",".join(str(i) for i in range(config.MAX_FILTER_VALUES + 1))]
+    with pytest.raises(HTTPException) as error:
+        filter_value(models.PlanoAcao, columns.id_programa, "id_programa", FILTRO_IGUAL, too_many)
+    assert error.value.detail == config.ERROR_MESSAGE_TOO_MANY_VALUES.format("id_programa", config.MAX_FILTER_VALUES)
+
+
+@pytest.mark.parametrize("column, name, kind, value, expected", [
+    ("diagnostico_plano_acao", "diagnostico_plano_acao", FILTRO_TEXTO, "abc", {"diagnostico_plano_acao": "%abc%"}),
+    ("data_inicio_vigencia_plano_acao", "data_inicio_vigencia_plano_acao", FILTRO_DATA, "2024-02-29",
+     {"data_inicio_vigencia_plano_acao": date(2024, 2, 29), "data_inicio_vigencia_plano_acao_limite": date(2024, 3, 1)}),
+    ("data_inicio_vigencia_plano_acao", "data_inicio_vigencia_plano_acao_de", FILTRO_DATA_DE, "2024-01-31",
+     {"data_inicio_vigencia_plano_acao_de": date(2024, 1, 31)}),
+    # inclusive end date: compared with < the next day
+    ("data_inicio_vigencia_plano_acao", "data_inicio_vigencia_plano_acao_ate", FILTRO_DATA_ATE, "2024-12-31",
+     {"data_inicio_vigencia_plano_acao_ate": date(2025, 1, 1)}),
+    ("valor_total_plano_acao", "valor_total_plano_acao_min", FILTRO_MIN, 10, {"valor_total_plano_acao_min": 10}),
+    ("id_programa", "id_programa", FILTRO_LISTA, ["1", "2"], {"id_programa": [1, 2]}),
+])
+def test_bind_values(column, name, kind, value, expected):
+    assert bind_values(models.PlanoAcao, columns[column], name, kind, value) == expected
+
+
+def test_bind_values_rejects_invalid_values():
+    for column, value in (("data_inicio_vigencia_plano_acao", "2024-02-30"), ("id_programa", "x")):
+        with pytest.raises(HTTPException) as error:
+            bind_values(models.PlanoAcao, columns[column], column, FILTRO_IGUAL, value)
+        assert error.value.status_code == 400
+
+
+def test_parse_order():
+    assert parse_order(models.PlanoAcao, None) == ()
+    assert parse_order(models.PlanoAcao, "valor_total_plano_acao") == ("valor_total_plano_acao", False)
+    assert parse_order(models.PlanoAcao, "-id_plano_acao") == ("id_plano_acao", True)
+    # only the primary key and indexed columns
+    with pytest.raises(HTTPException) as error:
+        parse_order(models.PlanoAcao, "-diagnostico_plano_acao")
+    assert error.value.status_code == 400
+
+
+def test_parse_fields():
+    assert parse_fields(models.PlanoAcao, None) == ()
+    assert parse_fields(models.PlanoAcao, " id_programa, codigo_plano_acao ") == ("id_plano_acao", "codigo_plano_acao", "id_programa")
+    with pytest.raises(HTTPException) as error:
+        parse_fields(models.PlanoAcao, "codigo_plano_acao,inexistente")
+    assert error.value.detail == config.ERROR_MESSAGE_INVALID_FIELDS.format("inexistente")
+
+
+@pytest.fixture
+async def planos(session):
+    # data_inicio_vigencia_plano_acao 2024-01-01 + i days, valor_total_plano_acao i * 100
+    for i in range(1, 6):
+        session.add(record(models.PlanoAcao, i, id_programa=1))
+    await session.commit()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("params, expected", [
+    ({"data_inicio_vigencia_plano_acao": "2024-01-03"}, [2]),
+    ({"data_inicio_vigencia_plano_acao_de": "2024-01-03", "data_inicio_vigencia_plano_acao_ate": "2024-01-05"}, [2, 3, 4]),
+    ({"data_inicio_vigencia_plano_acao_ate": "2024-01-02"}, [1]),
+    ({"valor_total_plano_acao_min": 200, "valor_total_plano_acao_max": 400}, [2, 3, 4]),
+    ({"valor_total_plano_acao_min": 500}, [5]),
+    ({"valor_total_plano_acao_max": 100}, [1]),
+    ({"nome_ente_recebedor_plano_acao": "RECEBEDOR_PLANO_ACAO_3"}, [3]),
+])
+async def test_range_and_text_filters_are_inclusive(client, planos, params, expected):
+    response = await client.get("/plano_acao", params=params)
+    assert response.status_code == 200, response.text
+    assert [item["id_plano_acao"] for item in response.json()["data"]] == expected
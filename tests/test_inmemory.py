@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+import pytest
+from src import models
+from src.cache import cache
+from src.inmemory import memory_tables
+from tests.conftest import record
+
+pytestmark = pytest.mark.anyio
+
+DATA = "data_inicio_recebimento_planos_acao_beneficiarios_especificos"
+
+
+@pytest.fixture
+async def tables(engine, session):
+    for i in range(1, 16):
+        session.add(record(models.Programa, i,
+                           situacao_programa="ATIVO" if i % 3 else "inativo",
+                           codigo_programa=f"C{i % 4}",
+                           nome_programa=f"Programa {i} {'100%_ok' if i % 2 else 'parcial'}",
+                           valor_global_programa=float(i % 5 * 1000),
+                           **{DATA: date(2024, 1, 1) + timedelta(days=i % 4)}))
+    for i in range(1, 8):
+        session.add(record(models.TermoAdesao, i, id_plano_acao=1 + i % 2,
+                           data_assinatura_termo_adesao=date(2024, 1, 1) + timedelta(days=i % 3)))
+    await session.commit()
+    yield
+    await memory_tables.close()
+
+
+QUERIES = [
+    ("/programa", {"situacao_programa": "ativo", "tamanho_da_pagina": 4}),
+    ("/programa", {"situacao_programa": "ativo", "tamanho_da_pagina": 4, "pagina": 2}),
+    ("/programa", {"situacao_programa": "ativo", "tamanho_da_pagina": 4, "pagina": 9}),
+    ("/programa", {"situacao_programa": "ATIVO", "ordenar_por": "-valor_global_programa", "tamanho_da_pagina": 5}),
+    ("/programa", {"nome_programa": "100%", "tamanho_da_pagina": 20}),
+    ("/programa", {"nome_programa": "0%_o", "tamanho_da_pagina": 20}),
+    ("/programa", {"codigo_programa": "C1", "contagem": "nenhuma"}),
+    ("/programa", {"valor_global_programa_min": 1000, "valor_global_programa_max": 3000, "tamanho_da_pagina": 20}),
+    ("/programa", {DATA + "_de": "2024-01-02", DATA + "_ate": "2024-01-03", "ordenar_por": DATA}),
+    ("/programa", {DATA: "2024-01-04", "campos": "nome_programa,valor_global_programa", "ordenar_por": "valor_global_programa"}),
+    ("/programa", {"situacao_programa": "nenhum"}),
+    ("/termo_adesao", {"id_plano_acao": "1", "ordenar_por": "-data_assinatura_termo_adesao", "tamanho_da_pagina": 2}),
+]
+
+
+async def pages(client, path: str, params: dict) -> list:
+    """
+    Respostas da consulta e das páginas seguintes, pelo next_cursor
+    """
+    responses = []
+    cursor = None
+    while True:
+        await cache.clear()
+        response = await client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        responses.append(response.json())
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            return responses
+
+
+@pytest.mark.parametrize("path, params", QUERIES)
+async def test_memory_copy_answers_like_the_database(engine, client, tables, statements, path, params):
+    from_database = await pages(client, path, params)
+    await memory_tables.start(engine)
+    assert path.lstrip("/") in memory_tables.tables
+    statements.clear()
+    from_memory = await pages(client, path, params)
+    assert statements == []
+    assert from_memory == from_database
+
+
+async def test_memory_count_is_exact(engine, client, tables):
+    await memory_tables.start(engine)
+    response = await client.get("/programa", params={"codigo_programa": "C1", "contagem": "estimada"})
+    content = response.json()
+    assert (content["total_items"], content["total_items_exact"]) == (4, True)
@@ -0,0 +1,58 @@
+import pytest
+from src import models
+from src.cache import cache
+from src.exports import exportable_models
+from src.filters import column_param, column_type
+from src.schemas import PaginatedResponseTemplate
+from src.utils import encode_cursor
+from tests.conftest import record
+import main
+
+pytestmark = pytest.mark.anyio
+
+
+def list_endpoints() -> dict:
+    """
+    Modelos das rotas de lista paginada, pelo caminho da rota
+    """
+    tables = exportable_models()
+    return {route.path: tables[route.path.lstrip("/")] for route in main.app.routes
+            if isinstance(getattr(route, "response_model", None), type)
+            and issubclass(route.response_model, PaginatedResponseTemplate)}
+
+
+@pytest.mark.parametrize("path, model", sorted(list_endpoints().items(), key=lambda item: item[0]))
+async def test_list_endpoint_issues_one_statement_per_page(path, model, client, session, statements):
+    session.add(record(model, 1))
+    await session.commit()
+    primary_key = model.__table__.primary_key.columns
+    base = {column_param(primary_key[0]): "1", "tamanho_da_pagina": 1}
+    # cursor positioned before the only record
+    before_first = ["" if column_type(model, column) is str else 0 for column in primary_key]
+
+    async def statements_of(params: dict, clear_cache: bool = True) -> int:
+        if clear_cache:
+            await cache.clear()
+        statements.clear()
+        response = await client.get(path, params={**base, **params})
+        assert response.status_code == 200, response.text
+        return len(statements)
+
+    # first page: rows and total in one statement
+    assert await statements_of({}) == 1
+    # page past the end: the total comes in the same statement, without a separate count
+    assert await statements_of({"pagina": 5}) == 1
+    # cursor page: the count of the filter set is reused from the cache
+    assert await statements_of({"cursor": encode_cursor(before_first)}, clear_cache=False) == 1
+    assert await statements_of({"contagem": "nenhuma"}) == 1
+
+
+async def test_page_past_the_end_reports_total(client, session):
+    for i in range(1, 4):
+        session.add(record(models.PlanoAcao, i, id_programa=1))
+    await session.commit()
+    response = await client.get("/plano_acao", params={"id_programa": "1", "tamanho_da_pagina": 2, "pagina": 3})
+    content = response.json()
+    assert content["data"] == []
+    assert content["total_items"] == 3
+    assert content["total_pages"] == 2
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import text
+from src import models, snapshots
+from src.exports import exportable_models
+from src.routers import arquivos
+from tests.conftest import record
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots.config, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(arquivos.config, "SNAPSHOT_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.anyio
+async def test_snapshot_of_every_table(engine, session, snapshot_dir, client):
+    for i in range(1, 4):
+        session.add(record(models.PlanoAcao, i))
+    await session.commit()
+    manifest = await snapshots.create_snapshots(engine)
+
+    assert set(manifest["tabelas"]) == set(exportable_models())
+    plano_acao = manifest["tabelas"]["plano_acao"]
+    assert plano_acao["registros"] == 3
+    files = plano_acao["arquivos"]
+    table = pq.read_table(os.path.join(snapshot_dir, files[0]["caminho"]))
+    assert table.column("id_plano_acao").to_pylist() == [1, 2, 3]
+    assert manifest["tabelas"]["empenho"]["registros"] == 0
+
+    response = await client.get("/arquivos")
+    assert response.status_code == 200
+    assert response.json()["geracao"] == manifest["geracao"]
+    assert response.json()["tabelas"]["plano_acao"]["arquivos"][0]["url"].endswith("/arquivos/" + files[0]["caminho"])
+
+
+@pytest.mark.anyio
+async def test_missing_materialized_view_is_skipped(engine, snapshot_dir):
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE {models.PlanoAcaoResumo.__table__.fullname}"))
+    manifest = await snapshots.create_snapshots(engine)
+    assert "plano_acao_resumo" not in manifest["tabelas"]
+    assert "plano_acao" in manifest["tabelas"]
+
+
+def test_export_models_are_registered_without_main():
+    # python -m src.snapshots runs without main: the models must be registered by src.exports itself
+    code = "from src.exports import exportable_models; assert 'plano_acao' in exportable_models()"
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=os.environ.copy(), check=True)